@@ -0,0 +1,25 @@
+"""
+Algorithms module initialization
+"""
+from .player import Player, POSITIONS, AGE_RANGES, PLAYING_STYLES
+from .balance_calculator import BalanceCalculator, SwapEvaluator, BALANCE_WEIGHTS
+from .chemistry import ChemistryMatrix, teammate_pairs
+from .batch_scorer import BatchBalanceScorer, RosterArrays
+from .incremental_rebalancer import IncrementalRebalancer
+from .parallel_search import MultiStartSearch, get_search_pool, shutdown_search_pool
+from .position_optimizer import PositionOptimizer, formation_minimums
+from .rating import RatedGame, initial_rating, rating_to_skill, rate_game, replay_ratings
+from .team_balancer import TeamBalancer, ALGORITHM_VERSION, MIN_PLAYERS_FOR_TEAMS, split_teams
+
+__all__ = [
+    "Player", "POSITIONS", "AGE_RANGES", "PLAYING_STYLES",
+    "BalanceCalculator", "SwapEvaluator", "BALANCE_WEIGHTS",
+    "BatchBalanceScorer", "RosterArrays",
+    "ChemistryMatrix", "teammate_pairs",
+    "IncrementalRebalancer",
+    "MultiStartSearch", "get_search_pool", "shutdown_search_pool",
+    "PositionOptimizer", "formation_minimums",
+    "RatedGame", "initial_rating", "rating_to_skill", "rate_game", "replay_ratings",
+    "TeamBalancer", "ALGORITHM_VERSION", "MIN_PLAYERS_FOR_TEAMS",
+    "split_teams"
+]
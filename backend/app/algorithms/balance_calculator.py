@@ -0,0 +1,277 @@
+"""
+Balance scoring for two-team splits
+
+``BalanceCalculator`` scores a finished pair of teams. ``SwapEvaluator``
+keeps per-team aggregates (skill sums, position/age counts and style pair
+sums) so the score of a candidate swap is computed in O(1) instead of
+re-walking both rosters, which is what makes local search affordable.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .player import Player, AGE_RANGES, PLAYING_STYLES, POSITIONS
+from .chemistry import ChemistryMatrix
+from .position_optimizer import ANY_INDEX, position_coverage, position_index
+
+BALANCE_WEIGHTS = {
+    'skill': 0.40,
+    'position': 0.25,
+    'style': 0.15,
+    'age': 0.10,
+    'size': 0.10,
+}
+
+# Average skill difference at which skill balance bottoms out
+MAX_SKILL_DIFFERENCE = 3.0
+
+STYLE_COMPATIBILITY = {
+    'Aggressive': {'complement': ['Technical', 'Balanced'], 'clash': ['Aggressive', 'Defensive']},
+    'Technical': {'complement': ['Physical', 'Creative', 'Balanced'], 'clash': ['Defensive']},
+    'Physical': {'complement': ['Technical', 'Creative'], 'clash': ['Physical']},
+    'Balanced': {'complement': ['Aggressive', 'Technical'], 'clash': []},
+    'Creative': {'complement': ['Physical', 'Defensive'], 'clash': []},
+    'Defensive': {'complement': ['Creative', 'Aggressive'], 'clash': ['Technical']},
+}
+
+def _one_way_compatibility(style1: str, style2: str) -> float:
+    rules = STYLE_COMPATIBILITY.get(style1)
+    if not rules:
+        return 0.5
+    if style2 in rules['complement']:
+        return 1.0
+    if style2 in rules['clash']:
+        return 0.0
+    return 0.5
+
+def style_compatibility(style1: str, style2: str) -> float:
+    """Symmetric pair compatibility: 1 complement, 0.5 neutral, 0 clash"""
+    return (_one_way_compatibility(style1, style2) + _one_way_compatibility(style2, style1)) / 2
+
+# Precomputed lookup by style index; the last row/column is "no style"
+STYLE_INDEX = {style: i for i, style in enumerate(PLAYING_STYLES)}
+_STYLES_WITH_NONE = PLAYING_STYLES + [None]
+STYLE_MATRIX = [[style_compatibility(a, b) for b in _STYLES_WITH_NONE] for a in _STYLES_WITH_NONE]
+AGE_INDEX = {age: i for i, age in enumerate(AGE_RANGES)}
+
+def pair_compatibility(players: List[Player], chemistry: Optional[ChemistryMatrix] = None) -> np.ndarray:
+    """``(n, n)`` pairwise compatibility: style, blended with teammate chemistry; zero diagonal"""
+    styles = np.array([STYLE_INDEX.get(p.playing_style, len(PLAYING_STYLES)) for p in players], dtype=np.int64)
+    compat = np.asarray(STYLE_MATRIX, dtype=np.float64)[np.ix_(styles, styles)]
+    if chemistry is not None:
+        compat = chemistry.blend(players, compat)
+    np.fill_diagonal(compat, 0.0)
+    return compat
+
+def _score_components(
+    n: Sequence[int],
+    skill: Sequence[float],
+    positions: Sequence[Sequence[int]],
+    any_counts: Sequence[int],
+    ages: Sequence[Sequence[int]],
+    aged: Sequence[int],
+    style_pairs: Sequence[float]
+) -> Tuple[float, float, float, float, float]:
+    """Component scores (each 0-1) from two teams' aggregates"""
+    n_a, n_b = n
+    if not n_a or not n_b:
+        return 0.0, 0.0, 0.0, 0.0, 0.0
+
+    difference = abs(skill[0] / n_a - skill[1] / n_b)
+    skill_score = 1.0 - difference / MAX_SKILL_DIFFERENCE
+    if skill_score < 0.0:
+        skill_score = 0.0
+
+    position_score = (
+        position_coverage(positions[0], any_counts[0], n_a) +
+        position_coverage(positions[1], any_counts[1], n_b)
+    ) / 2
+
+    pairs_a = n_a * (n_a - 1) / 2
+    pairs_b = n_b * (n_b - 1) / 2
+    style_score = (
+        (style_pairs[0] / pairs_a if pairs_a else 1.0) +
+        (style_pairs[1] / pairs_b if pairs_b else 1.0)
+    ) / 2
+
+    similarity = 0.0
+    for k in range(len(AGE_RANGES)):
+        share_a = ages[0][k] / aged[0] if aged[0] else 0.0
+        share_b = ages[1][k] / aged[1] if aged[1] else 0.0
+        similarity += 1.0 - abs(share_a - share_b)
+    age_score = similarity / len(AGE_RANGES)
+
+    size_score = 1.0 - abs(n_a - n_b) / max(n_a, n_b)
+
+    return skill_score, position_score, style_score, age_score, size_score
+
+def weighted_total(components: Tuple[float, float, float, float, float]) -> float:
+    """Weighted balance score on a 0-100 scale"""
+    skill_score, position_score, style_score, age_score, size_score = components
+    return (
+        skill_score * BALANCE_WEIGHTS['skill'] +
+        position_score * BALANCE_WEIGHTS['position'] +
+        style_score * BALANCE_WEIGHTS['style'] +
+        age_score * BALANCE_WEIGHTS['age'] +
+        size_score * BALANCE_WEIGHTS['size']
+    ) * 100
+
+class SwapEvaluator:
+    """Incremental balance scoring over a two-team assignment.
+
+    ``assignment[i]`` is 0 (Team A) or 1 (Team B) for ``players[i]``.
+    """
+
+    def __init__(
+        self, players: List[Player], assignment: List[int], chemistry: Optional[ChemistryMatrix] = None
+    ):
+        self.players = players
+        self.assignment = list(assignment)
+        size = len(players)
+
+        self.skill = [p.strength for p in players]
+        self.pos = [position_index(p.position) for p in players]
+        self.age = [AGE_INDEX.get(p.age_range, -1) for p in players]
+        self.compat = pair_compatibility(players, chemistry).tolist()
+
+        self.n = [0, 0]
+        self.skill_sum = [0.0, 0.0]
+        self.pos_counts = [[0] * len(POSITIONS), [0] * len(POSITIONS)]
+        self.any_counts = [0, 0]
+        self.age_counts = [[0] * len(AGE_RANGES), [0] * len(AGE_RANGES)]
+        self.aged = [0, 0]
+        # team_compat[t][i]: style compatibility of player i with everyone in team t
+        self.team_compat = [[0.0] * size, [0.0] * size]
+        self.style_pairs = [0.0, 0.0]
+
+        for i, team in enumerate(self.assignment):
+            self._add(i, team)
+        for i in range(size):
+            for t in (0, 1):
+                self.team_compat[t][i] = sum(
+                    self.compat[i][j] for j in range(size) if self.assignment[j] == t
+                )
+        for t in (0, 1):
+            self.style_pairs[t] = sum(
+                self.team_compat[t][i] for i in range(size) if self.assignment[i] == t
+            ) / 2
+
+    def _add(self, i: int, team: int, sign: int = 1) -> None:
+        self.n[team] += sign
+        self.skill_sum[team] += sign * self.skill[i]
+        if self.pos[i] == ANY_INDEX:
+            self.any_counts[team] += sign
+        else:
+            self.pos_counts[team][self.pos[i]] += sign
+        if self.age[i] >= 0:
+            self.age_counts[team][self.age[i]] += sign
+            self.aged[team] += sign
+
+    def components(self) -> Tuple[float, float, float, float, float]:
+        return _score_components(
+            self.n, self.skill_sum, self.pos_counts, self.any_counts,
+            self.age_counts, self.aged, self.style_pairs
+        )
+
+    def score(self) -> float:
+        return weighted_total(self.components())
+
+    def swap_score(self, a: int, b: int) -> float:
+        """Score if players ``a`` and ``b`` (on different teams) traded places"""
+        ta, tb = self.assignment[a], self.assignment[b]
+
+        skill = list(self.skill_sum)
+        delta = self.skill[b] - self.skill[a]
+        skill[ta] += delta
+        skill[tb] -= delta
+
+        positions = self.pos_counts
+        any_counts = self.any_counts
+        pa, pb = self.pos[a], self.pos[b]
+        if pa != pb:
+            positions = [list(self.pos_counts[0]), list(self.pos_counts[1])]
+            any_counts = list(self.any_counts)
+            for p, src, dst in ((pa, ta, tb), (pb, tb, ta)):
+                if p == ANY_INDEX:
+                    any_counts[src] -= 1
+                    any_counts[dst] += 1
+                else:
+                    positions[src][p] -= 1
+                    positions[dst][p] += 1
+
+        ages = self.age_counts
+        aged = self.aged
+        ga, gb = self.age[a], self.age[b]
+        if ga != gb:
+            ages = [list(self.age_counts[0]), list(self.age_counts[1])]
+            aged = list(self.aged)
+            for g, src, dst in ((ga, ta, tb), (gb, tb, ta)):
+                if g >= 0:
+                    ages[src][g] -= 1
+                    ages[dst][g] += 1
+                    aged[src] -= 1
+                    aged[dst] += 1
+
+        style_pairs = list(self.style_pairs)
+        cab = self.compat[a][b]
+        style_pairs[ta] += self.team_compat[ta][b] - cab - self.team_compat[ta][a]
+        style_pairs[tb] += self.team_compat[tb][a] - cab - self.team_compat[tb][b]
+
+        return weighted_total(_score_components(
+            self.n, skill, positions, any_counts, ages, aged, style_pairs
+        ))
+
+    def apply_swap(self, a: int, b: int) -> None:
+        """Trade players ``a`` and ``b`` between teams, updating aggregates in O(n)"""
+        ta, tb = self.assignment[a], self.assignment[b]
+        cab = self.compat[a][b]
+        self.style_pairs[ta] += self.team_compat[ta][b] - cab - self.team_compat[ta][a]
+        self.style_pairs[tb] += self.team_compat[tb][a] - cab - self.team_compat[tb][b]
+
+        self._add(a, ta, -1)
+        self._add(b, tb, -1)
+        self._add(a, tb)
+        self._add(b, ta)
+        self.assignment[a], self.assignment[b] = tb, ta
+
+        compat_a, compat_b = self.compat[a], self.compat[b]
+        team_ta, team_tb = self.team_compat[ta], self.team_compat[tb]
+        for k in range(len(self.players)):
+            moved = compat_b[k] - compat_a[k]
+            team_ta[k] += moved
+            team_tb[k] -= moved
+
+    def teams(self) -> Tuple[List[Player], List[Player]]:
+        team_a = [p for p, t in zip(self.players, self.assignment) if t == 0]
+        team_b = [p for p, t in zip(self.players, self.assignment) if t == 1]
+        return team_a, team_b
+
+class BalanceCalculator:
+    """Calculate balance metrics for a pair of teams"""
+
+    def __init__(self, chemistry: Optional[ChemistryMatrix] = None):
+        self.chemistry = chemistry
+
+    def calculate_total_balance(self, team_a: List[Player], team_b: List[Player]) -> Tuple[float, Dict]:
+        """Calculate overall balance score (0-100) and detailed breakdown"""
+        evaluator = SwapEvaluator(
+            team_a + team_b, [0] * len(team_a) + [1] * len(team_b), self.chemistry
+        )
+        skill_score, position_score, style_score, age_score, size_score = evaluator.components()
+
+        avg_a = evaluator.skill_sum[0] / len(team_a) if team_a else 0.0
+        avg_b = evaluator.skill_sum[1] / len(team_b) if team_b else 0.0
+
+        details = {
+            'skill_balance': skill_score * 100,
+            'position_balance': position_score * 100,
+            'style_balance': style_score * 100,
+            'age_balance': age_score * 100,
+            'size_balance': size_score * 100,
+            'team_a_avg_skill': avg_a,
+            'team_b_avg_skill': avg_b,
+            'skill_difference': abs(avg_a - avg_b),
+        }
+
+        total = weighted_total((skill_score, position_score, style_score, age_score, size_score))
+        return total, details
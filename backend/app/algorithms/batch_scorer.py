@@ -0,0 +1,166 @@
+"""
+Vectorized balance scoring for batches of candidate team assignments
+
+The roster is encoded once as compact NumPy arrays (skill vector, one-hot
+position and age matrices, pairwise style/chemistry compatibility matrix). A batch of
+candidates is an ``(m, n)`` 0/1 matrix where row ``k`` marks which players
+are on Team B in candidate ``k``; every candidate is scored with a handful
+of matrix operations instead of Python loops over player dicts.
+
+Scores match ``BalanceCalculator`` exactly (see test_team_balancer.py).
+"""
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .player import Player, AGE_RANGES, POSITIONS
+from .balance_calculator import AGE_INDEX, BALANCE_WEIGHTS, MAX_SKILL_DIFFERENCE, pair_compatibility
+from .chemistry import ChemistryMatrix
+from .position_optimizer import (
+    ANY_INDEX, POSITION_PRIORITY_WEIGHTS, formation_minimums, position_index
+)
+
+_WEIGHTS = np.array([
+    BALANCE_WEIGHTS['skill'], BALANCE_WEIGHTS['position'], BALANCE_WEIGHTS['style'],
+    BALANCE_WEIGHTS['age'], BALANCE_WEIGHTS['size'],
+])
+_PRIORITY = np.array(POSITION_PRIORITY_WEIGHTS)
+
+class RosterArrays:
+    """Compact array encoding of a roster"""
+
+    def __init__(self, players: List[Player], chemistry: Optional[ChemistryMatrix] = None):
+        n = len(players)
+        self.players = players
+        self.size = n
+        self.skill = np.array([p.strength for p in players], dtype=np.float64)
+
+        # One-hot positions; the extra last column is 'Any'
+        self.positions = np.zeros((n, len(POSITIONS) + 1), dtype=np.float64)
+        self.positions[np.arange(n), [position_index(p.position) for p in players]] = 1.0
+
+        # One-hot ages; players without an age range get an all-zero row
+        self.ages = np.zeros((n, len(AGE_RANGES)), dtype=np.float64)
+        for i, p in enumerate(players):
+            if p.age_range in AGE_INDEX:
+                self.ages[i, AGE_INDEX[p.age_range]] = 1.0
+
+        self.style_compat = pair_compatibility(players, chemistry)
+
+        # Formation minimums indexed by team size
+        self.required = np.array([formation_minimums(k) for k in range(n + 1)], dtype=np.float64)
+
+        self.total_skill = self.skill.sum()
+        self.total_positions = self.positions.sum(axis=0)
+        self.total_ages = self.ages.sum(axis=0)
+
+class BatchBalanceScorer:
+    """Scores many two-team assignments of one roster at once"""
+
+    def __init__(self, players: List[Player], chemistry: Optional[ChemistryMatrix] = None):
+        self.roster = RosterArrays(players, chemistry)
+
+    def _coverage(self, counts: np.ndarray, team_size: np.ndarray) -> np.ndarray:
+        required = self.roster.required[team_size]
+        remaining_any = counts[:, ANY_INDEX].copy()
+        missing = np.zeros(len(counts))
+        for i in range(len(POSITIONS)):
+            gap = np.maximum(required[:, i] - counts[:, i], 0.0)
+            filled = np.minimum(gap, remaining_any)
+            remaining_any -= filled
+            missing += _PRIORITY[i] * (gap - filled)
+        total = required @ _PRIORITY
+        safe_total = np.where(total > 0, total, 1.0)
+        return np.where(total > 0, 1.0 - missing / safe_total, 1.0)
+
+    def components(self, assignments: np.ndarray) -> np.ndarray:
+        """``(m, 5)`` component scores: skill, position, style, age, size"""
+        roster = self.roster
+        on_b = np.asarray(assignments, dtype=np.float64)
+        if on_b.ndim == 1:
+            on_b = on_b[None, :]
+        on_a = 1.0 - on_b
+
+        n_b = on_b.sum(axis=1)
+        n_a = roster.size - n_b
+        valid = (n_a > 0) & (n_b > 0)
+        safe_a = np.where(n_a > 0, n_a, 1.0)
+        safe_b = np.where(n_b > 0, n_b, 1.0)
+
+        skill_b = on_b @ roster.skill
+        skill_a = roster.total_skill - skill_b
+        skill_score = np.clip(1.0 - np.abs(skill_a / safe_a - skill_b / safe_b) / MAX_SKILL_DIFFERENCE, 0.0, None)
+
+        positions_b = on_b @ roster.positions
+        positions_a = roster.total_positions - positions_b
+        position_score = (
+            self._coverage(positions_a, n_a.astype(np.int64)) +
+            self._coverage(positions_b, n_b.astype(np.int64))
+        ) / 2
+
+        pair_sum_a = 0.5 * np.einsum('ij,ij->i', on_a @ roster.style_compat, on_a)
+        pair_sum_b = 0.5 * np.einsum('ij,ij->i', on_b @ roster.style_compat, on_b)
+        pairs_a = n_a * (n_a - 1) / 2
+        pairs_b = n_b * (n_b - 1) / 2
+        style_score = (
+            np.where(pairs_a > 0, pair_sum_a / np.where(pairs_a > 0, pairs_a, 1.0), 1.0) +
+            np.where(pairs_b > 0, pair_sum_b / np.where(pairs_b > 0, pairs_b, 1.0), 1.0)
+        ) / 2
+
+        ages_b = on_b @ roster.ages
+        ages_a = roster.total_ages - ages_b
+        aged_a = ages_a.sum(axis=1, keepdims=True)
+        aged_b = ages_b.sum(axis=1, keepdims=True)
+        share_a = np.where(aged_a > 0, ages_a / np.where(aged_a > 0, aged_a, 1.0), 0.0)
+        share_b = np.where(aged_b > 0, ages_b / np.where(aged_b > 0, aged_b, 1.0), 0.0)
+        age_score = (1.0 - np.abs(share_a - share_b)).mean(axis=1)
+
+        size_score = 1.0 - np.abs(n_a - n_b) / np.maximum(safe_a, safe_b)
+
+        components = np.stack([skill_score, position_score, style_score, age_score, size_score], axis=1)
+        components[~valid] = 0.0
+        return components
+
+    def score(self, assignments: np.ndarray) -> np.ndarray:
+        """Weighted balance score (0-100) for each candidate row"""
+        return self.components(assignments) @ _WEIGHTS * 100
+
+    def swap_candidates(self, assignment: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Every single-swap neighbour of ``assignment`` as a candidate batch.
+
+        Returns ``(candidates, a_idx, b_idx)`` where candidate ``k`` swaps
+        Team A player ``a_idx[k]`` with Team B player ``b_idx[k]``.
+        """
+        assignment = np.asarray(assignment, dtype=np.int8)
+        side_a = np.flatnonzero(assignment == 0)
+        side_b = np.flatnonzero(assignment == 1)
+        a_idx = np.repeat(side_a, len(side_b))
+        b_idx = np.tile(side_b, len(side_a))
+        rows = np.arange(len(a_idx))
+        candidates = np.broadcast_to(assignment, (len(a_idx), len(assignment))).copy()
+        candidates[rows, a_idx] = 1
+        candidates[rows, b_idx] = 0
+        return candidates, a_idx, b_idx
+
+    def refine(self, assignment: Sequence[int], max_passes: int, min_improvement: float = 1e-9) -> Tuple[np.ndarray, float, int]:
+        """Steepest-ascent swap search, scoring each pass's neighbourhood as one batch.
+
+        Returns ``(assignment, score, candidates_evaluated)``.
+        """
+        current_assignment = np.asarray(assignment, dtype=np.int8)
+        current = float(self.score(current_assignment)[0])
+        evaluated = 0
+
+        for _ in range(max_passes):
+            candidates, a_idx, b_idx = self.swap_candidates(current_assignment)
+            if not len(candidates):
+                break
+            scores = self.score(candidates)
+            evaluated += len(candidates)
+            best = int(np.argmax(scores))
+            if scores[best] <= current + min_improvement:
+                break
+            current_assignment = candidates[best]
+            current = float(scores[best])
+
+        return current_assignment, current, evaluated
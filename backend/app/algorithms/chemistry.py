@@ -0,0 +1,65 @@
+"""
+Historical teammate chemistry
+
+Only pairs that have actually played on the same team are stored (a sparse
+upper-triangular matrix keyed by ``(lower_id, higher_id)``). A pair's
+chemistry is its smoothed win rate together; it is blended into the
+pairwise style-compatibility matrix the balance scorers already use, with
+more weight the more games the pair has shared. Pairs without history keep
+their pure style compatibility.
+"""
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .player import Player
+
+CHEMISTRY_PRIOR_GAMES = 5.0   # pseudo-games at a 50% result rate
+CHEMISTRY_MAX_WEIGHT = 0.5    # share of a pair's compatibility chemistry can take
+
+def pair_key(a: int, b: int) -> Tuple[int, int]:
+    return (a, b) if a < b else (b, a)
+
+def teammate_pairs(team: Iterable[int]) -> List[Tuple[int, int]]:
+    """Every unordered pair of teammates, lower id first"""
+    return [pair_key(a, b) for a, b in combinations(sorted(team), 2)]
+
+class ChemistryMatrix:
+    """Sparse teammate history for one roster"""
+
+    def __init__(self, pairs: Optional[Dict[Tuple[int, int], Tuple[int, int, int]]] = None):
+        # (a, b) -> (games_together, wins_together, draws_together)
+        self.pairs = dict(pairs or {})
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[dict]) -> "ChemistryMatrix":
+        return cls({
+            pair_key(r['user_a'], r['user_b']): (r['games_together'], r['wins_together'], r['draws_together'])
+            for r in rows
+        })
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def chemistry(self, a: int, b: int) -> Tuple[float, float]:
+        """``(value, weight)``: smoothed 0-1 result rate together and its blend weight"""
+        games, wins, draws = self.pairs.get(pair_key(a, b), (0, 0, 0))
+        if not games:
+            return 0.5, 0.0
+        value = (wins + 0.5 * draws + 0.5 * CHEMISTRY_PRIOR_GAMES) / (games + CHEMISTRY_PRIOR_GAMES)
+        weight = CHEMISTRY_MAX_WEIGHT * games / (games + CHEMISTRY_PRIOR_GAMES)
+        return value, weight
+
+    def blend(self, players: List[Player], compat: np.ndarray) -> np.ndarray:
+        """Blend chemistry into an ``(n, n)`` style-compatibility matrix for ``players``"""
+        if not self.pairs:
+            return compat
+        compat = compat.copy()
+        index = {p.id: i for i, p in enumerate(players)}
+        for (a, b) in self.pairs:
+            if a in index and b in index:
+                i, j = index[a], index[b]
+                value, weight = self.chemistry(a, b)
+                compat[i, j] = compat[j, i] = (1.0 - weight) * compat[i, j] + weight * value
+        return compat
@@ -0,0 +1,101 @@
+"""
+Incremental rebalancing of stored teams after a roster change
+
+Instead of re-solving from scratch, start from the stored assignment:
+departed players are dropped, newcomers join the smaller (then weaker) team,
+a size gap of more than one is closed with the best single moves, and then
+the best swaps are applied only until the score is back within tolerance of
+the target. Each player is moved at most once, so most players keep their
+original team.
+"""
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .player import Player
+from .batch_scorer import BatchBalanceScorer
+from .chemistry import ChemistryMatrix
+
+class IncrementalRebalancer:
+    """Minimal-change rebalancing from a previous two-team assignment"""
+
+    def __init__(self, max_swaps: int = 3, tolerance: float = 2.0, chemistry: Optional[ChemistryMatrix] = None):
+        self.max_swaps = max_swaps
+        self.tolerance = tolerance
+        self.chemistry = chemistry
+
+    def rebalance(
+        self, players: List[Player], previous: Dict[int, int], target_score: float
+    ) -> Tuple[List[Player], np.ndarray, List[int], int]:
+        """Rebalance ``players`` starting from ``previous`` (player id -> 0/1).
+
+        Returns ``(players, assignment, moved_ids, candidates_evaluated)`` with
+        ``players`` in a fixed order matching ``assignment``.
+        """
+        players = sorted(players, key=lambda p: p.id)
+        scorer = BatchBalanceScorer(players, self.chemistry)
+        assignment = self._seat_newcomers(players, previous)
+        moved: Set[int] = {i for i, p in enumerate(players) if p.id not in previous}
+        evaluated = 0
+
+        # Close any size gap left by departures with single moves
+        while abs(int((assignment == 0).sum()) - int((assignment == 1).sum())) > 1:
+            larger = 0 if (assignment == 0).sum() > (assignment == 1).sum() else 1
+            movable = [int(i) for i in np.flatnonzero(assignment == larger) if i not in moved]
+            if not movable:
+                movable = [int(i) for i in np.flatnonzero(assignment == larger)]
+            candidates = np.broadcast_to(assignment, (len(movable), len(players))).copy()
+            candidates[np.arange(len(movable)), movable] = 1 - larger
+            scores = scorer.score(candidates)
+            evaluated += len(candidates)
+            best = int(np.argmax(scores))
+            assignment = candidates[best]
+            moved.add(movable[best])
+
+        # Swap only until balance is restored, never touching a moved player twice
+        current = float(scorer.score(assignment)[0])
+        for _ in range(self.max_swaps):
+            if current >= target_score - self.tolerance:
+                break
+            candidates, a_idx, b_idx = scorer.swap_candidates(assignment)
+            allowed = np.array([a not in moved and b not in moved for a, b in zip(a_idx, b_idx)], dtype=bool)
+            if not allowed.any():
+                break
+            candidates, a_idx, b_idx = candidates[allowed], a_idx[allowed], b_idx[allowed]
+            scores = scorer.score(candidates)
+            evaluated += len(candidates)
+            best = int(np.argmax(scores))
+            if scores[best] <= current:
+                break
+            assignment = candidates[best]
+            current = float(scores[best])
+            moved.update((int(a_idx[best]), int(b_idx[best])))
+
+        moved_ids = [
+            players[i].id for i in sorted(moved)
+            if players[i].id in previous and previous[players[i].id] != assignment[i]
+        ]
+        return players, assignment, moved_ids, evaluated
+
+    def _seat_newcomers(self, players: List[Player], previous: Dict[int, int]) -> np.ndarray:
+        """Keep returning players on their team; newcomers fill the smaller, then weaker, side"""
+        assignment = np.zeros(len(players), dtype=np.int8)
+        sizes = [0, 0]
+        skill = [0, 0]
+        newcomers = []
+        for i, p in enumerate(players):
+            if p.id in previous:
+                team = previous[p.id]
+                assignment[i] = team
+                sizes[team] += 1
+                skill[team] += p.strength
+            else:
+                newcomers.append(i)
+
+        # Strongest newcomer first so they land on the weaker side
+        for i in sorted(newcomers, key=lambda i: (-players[i].strength, players[i].id)):
+            team = min((0, 1), key=lambda t: (sizes[t], skill[t], t))
+            assignment[i] = team
+            sizes[team] += 1
+            skill[team] += players[i].strength
+        return assignment
@@ -0,0 +1,157 @@
+"""
+Multi-start team search across a process pool
+
+Each restart draws a random even split from its own seed and refines it
+with the batch swap search. Restarts are grouped into small chunks and
+spread over a process pool; whatever has finished when the wall-clock
+budget runs out competes with the deterministic snake-draft baseline.
+Chunks carry the search's deadline and stop between restarts once it has
+passed: a chunk already running cannot be cancelled, and left alone it
+would hold a pool worker while the next request's budget ticks away.
+
+Reproducibility: restart ``k`` always uses the ``k``-th seed derived from
+the search seed, and only the completed *prefix* of chunks (in submission
+order) is considered, with ties going to the lower restart index. The same
+seed therefore gives the same teams whenever the same number of restarts
+finish - always, when the search runs without a time budget.
+"""
+import multiprocessing
+import random
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, wait
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .player import Player
+from .batch_scorer import BatchBalanceScorer
+from .chemistry import ChemistryMatrix
+
+RESTARTS_PER_CHUNK = 4
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+def get_search_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Lazily create the per-process search pool.
+
+    Workers are spawned rather than forked so they never inherit the API
+    worker's event loop, threads or open database sockets.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=max_workers or None,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+    return _pool
+
+def shutdown_search_pool() -> None:
+    """Stop the search pool's worker processes (used on app shutdown)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+def restart_seeds(seed: int, restarts: int) -> List[int]:
+    """Per-restart seeds derived deterministically from the search seed"""
+    rng = random.Random(seed)
+    return [rng.getrandbits(32) for _ in range(restarts)]
+
+def random_assignment(size: int, seed: int) -> np.ndarray:
+    """Random split with Team A taking the odd player out"""
+    order = list(range(size))
+    random.Random(seed).shuffle(order)
+    assignment = np.zeros(size, dtype=np.int8)
+    assignment[order[(size + 1) // 2:]] = 1
+    return assignment
+
+def run_restarts(
+    players: List[Player], seeds: Sequence[int], max_passes: int,
+    chemistry: Optional[ChemistryMatrix] = None, deadline: Optional[float] = None
+) -> Tuple[float, Optional[np.ndarray], int, int]:
+    """Run a chunk of restarts, starting none after ``deadline`` (``time.time()``).
+
+    Returns ``(score, assignment, evaluated, ran)`` for the best of the first
+    ``ran`` restarts (earliest restart wins ties); ``assignment`` is None if
+    the deadline had passed before any ran.
+    """
+    scorer = BatchBalanceScorer(players, chemistry)
+    best = (float('-inf'), None)
+    evaluated = 0
+    ran = 0
+    for seed in seeds:
+        if deadline is not None and time.time() >= deadline:
+            break
+        assignment, score, count = scorer.refine(random_assignment(len(players), seed), max_passes)
+        evaluated += count
+        ran += 1
+        if best[1] is None or score > best[0]:
+            best = (score, assignment)
+    return best[0], best[1], evaluated, ran
+
+class MultiStartSearch:
+    """Best-of-N randomized restarts within a wall-clock budget"""
+
+    def __init__(
+        self,
+        restarts: int = 64,
+        time_budget: Optional[float] = 1.5,
+        max_passes: int = 50,
+        executor: Optional[Executor] = None,
+        chemistry: Optional[ChemistryMatrix] = None,
+    ):
+        self.restarts = restarts
+        self.time_budget = time_budget
+        self.max_passes = max_passes
+        self.executor = executor
+        self.chemistry = chemistry
+
+    def search(
+        self, players: List[Player], baseline: Sequence[int], seed: int
+    ) -> Tuple[np.ndarray, float, int, int]:
+        """Improve on ``baseline`` with seeded restarts.
+
+        Returns ``(assignment, score, candidates_evaluated, restarts_completed)``.
+        """
+        started = time.monotonic()
+        scorer = BatchBalanceScorer(players, self.chemistry)
+        best_assignment, best_score, evaluated = scorer.refine(baseline, self.max_passes)
+
+        seeds = restart_seeds(seed, self.restarts)
+        chunks = [seeds[i:i + RESTARTS_PER_CHUNK] for i in range(0, len(seeds), RESTARTS_PER_CHUNK)]
+        if not chunks:
+            return best_assignment, best_score, evaluated, 0
+
+        timeout = deadline = None
+        if self.time_budget is not None:
+            timeout = max(self.time_budget - (time.monotonic() - started), 0.0)
+            deadline = time.time() + timeout  # wall clock: the workers are other processes
+
+        executor = self.executor or get_search_pool()
+        futures: List[Future] = [
+            executor.submit(run_restarts, players, chunk, self.max_passes, self.chemistry, deadline)
+            for chunk in chunks
+        ]
+        wait(futures, timeout=timeout)
+
+        completed = 0
+        for chunk, future in zip(chunks, futures):
+            if not future.done() or future.cancelled() or future.exception() is not None:
+                break
+            score, assignment, count, ran = future.result()
+            evaluated += count
+            if ran and score > best_score:
+                best_assignment, best_score = assignment, score
+            completed += ran
+            if ran < len(chunk):  # stopped at the deadline: later restarts are not a prefix
+                break
+
+        for future in futures:
+            future.cancel()
+
+        return best_assignment, best_score, evaluated, completed
@@ -0,0 +1,39 @@
+"""
+Player representation used by the team balancing algorithms
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from .rating import rating_to_skill
+
+POSITIONS = ['Goalkeeper', 'Defender', 'Midfielder', 'Forward']
+AGE_RANGES = ['18-25', '26-35', '36-45', '46+']
+PLAYING_STYLES = ['Aggressive', 'Technical', 'Physical', 'Balanced', 'Creative', 'Defensive']
+
+@dataclass
+class Player:
+    """A confirmed participant as seen by the balancer"""
+    id: int
+    username: str
+    first_name: str
+    last_name: str
+    skill_level: int
+    preferred_position: Optional[str] = None
+    playing_style: Optional[str] = None
+    age_range: Optional[str] = None
+    position_preference: Optional[str] = None  # For this specific game
+    rating: Optional[float] = None  # Elo rating from completed games, if any
+
+    @property
+    def position(self) -> str:
+        """Effective position for this game: the per-game preference wins over the profile"""
+        return self.position_preference or self.preferred_position or 'Any'
+
+    @property
+    def strength(self) -> float:
+        """Skill used for balancing: the rating once earned, else the self-reported level"""
+        return rating_to_skill(self.rating) if self.rating is not None else float(self.skill_level)
+
+    @property
+    def display_name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
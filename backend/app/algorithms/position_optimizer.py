@@ -0,0 +1,136 @@
+"""
+Position coverage and assignment for generated teams
+"""
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+from .player import Player, POSITIONS
+
+# Higher priority positions count more towards coverage (goalkeeper first)
+POSITION_PRIORITY_WEIGHTS = (2.0, 1.5, 1.0, 1.0)
+ANY_INDEX = len(POSITIONS)
+POSITION_INDEX = {position: i for i, position in enumerate(POSITIONS)}
+
+def position_index(position: str) -> int:
+    """Index into POSITIONS, or ANY_INDEX for 'Any'/unknown"""
+    return POSITION_INDEX.get(position, ANY_INDEX)
+
+@lru_cache(maxsize=64)
+def formation_minimums(team_size: int) -> Tuple[int, int, int, int]:
+    """Minimum (GK, DEF, MID, FWD) per team, from the plan's formation templates"""
+    if team_size >= 11:
+        return (1, 3, 3, 2)
+    if team_size >= 9:
+        return (1, 3, 2, 2)
+    if team_size >= 7:
+        return (1, 2, 2, 2)
+    # Small-sided: one of each position in priority order while players last
+    return tuple(1 if i < team_size else 0 for i in range(len(POSITIONS)))
+
+def position_coverage(counts: Sequence[int], any_count: int, team_size: int) -> float:
+    """How well a team meets its formation minimums (0-1, higher is better).
+
+    ``counts`` holds players per specific position; 'Any' players fill the
+    remaining gaps in priority order.
+    """
+    required = formation_minimums(team_size)
+    remaining_any = any_count
+    missing = 0.0
+    total = 0.0
+    for i, need in enumerate(required):
+        if not need:
+            continue
+        weight = POSITION_PRIORITY_WEIGHTS[i]
+        total += weight * need
+        gap = need - counts[i]
+        if gap > 0:
+            filled = gap if gap < remaining_any else remaining_any
+            remaining_any -= filled
+            missing += weight * (gap - filled)
+    return 1.0 - missing / total if total else 1.0
+
+class PositionOptimizer:
+    """Fixes critical position gaps and assigns positions within a team"""
+
+    def count_positions(self, team: List[Player]) -> Tuple[List[int], int]:
+        counts = [0] * len(POSITIONS)
+        any_count = 0
+        for player in team:
+            idx = position_index(player.position)
+            if idx == ANY_INDEX:
+                any_count += 1
+            else:
+                counts[idx] += 1
+        return counts, any_count
+
+    def coverage(self, team: List[Player]) -> float:
+        counts, any_count = self.count_positions(team)
+        return position_coverage(counts, any_count, len(team))
+
+    def optimize_positions(self, team_a: List[Player], team_b: List[Player]) -> Tuple[List[Player], List[Player]]:
+        """Swap specialists into teams missing a position, highest priority first.
+
+        A swap is only made when the donor team has a surplus of that
+        position; the returning player is the closest in skill among the
+        receiving team's surplus (or 'Any') players.
+        """
+        team_a, team_b = list(team_a), list(team_b)
+        for idx, position in enumerate(POSITIONS):
+            for needy, donor in ((team_a, team_b), (team_b, team_a)):
+                need = formation_minimums(len(needy))[idx]
+                needy_counts, needy_any = self.count_positions(needy)
+                if needy_counts[idx] + needy_any >= need:
+                    continue
+                donor_counts, _ = self.count_positions(donor)
+                if donor_counts[idx] <= formation_minimums(len(donor))[idx]:
+                    continue
+
+                required = formation_minimums(len(needy))
+                candidates_in = [p for p in donor if p.position == position]
+                candidates_out = [
+                    p for p in needy
+                    if position_index(p.position) != ANY_INDEX
+                    and needy_counts[position_index(p.position)] > required[position_index(p.position)]
+                ]
+                if not candidates_out:
+                    continue
+
+                incoming, outgoing = min(
+                    ((i, o) for i in candidates_in for o in candidates_out),
+                    key=lambda pair: abs(pair[0].strength - pair[1].strength)
+                )
+                needy[needy.index(outgoing)] = incoming
+                donor[donor.index(incoming)] = outgoing
+        return team_a, team_b
+
+    def assign_positions(self, team: List[Player]) -> Dict[int, str]:
+        """Map player id -> assigned position for one team"""
+        required = formation_minimums(len(team))
+        assigned: Dict[int, str] = {}
+        counts = [0] * len(POSITIONS)
+        flexible = []
+
+        for player in team:
+            idx = position_index(player.position)
+            if idx == ANY_INDEX:
+                flexible.append(player)
+            else:
+                assigned[player.id] = POSITIONS[idx]
+                counts[idx] += 1
+
+        # 'Any' players fill gaps in priority order, strongest first
+        flexible.sort(key=lambda p: p.strength, reverse=True)
+        for player in flexible:
+            gaps = [i for i, need in enumerate(required) if counts[i] < need]
+            idx = gaps[0] if gaps else POSITION_INDEX['Midfielder']
+            assigned[player.id] = POSITIONS[idx]
+            counts[idx] += 1
+
+        # Still no goalkeeper: move the weakest player from the deepest position
+        if team and counts[0] == 0 and len(team) > 1:
+            surplus_idx = max(range(1, len(POSITIONS)), key=lambda i: counts[i] - required[i])
+            candidates = [p for p in team if assigned[p.id] == POSITIONS[surplus_idx]]
+            keeper = min(candidates, key=lambda p: p.strength)
+            assigned[keeper.id] = 'Goalkeeper'
+
+        return assigned
@@ -0,0 +1,115 @@
+"""
+Team Elo ratings for players
+
+Each team's strength is the mean rating of its players. After a result,
+every player on a team moves by the same ``K * G * (actual - expected)``,
+where ``G`` is the World Football Elo goal-difference multiplier and ``K``
+is doubled for provisional players. One update touches only that game's
+players, so recording a result is O(team size).
+
+``replay_ratings`` re-rates the whole history at once: games are packed
+into waves in which no player appears twice, and each wave is updated
+with a handful of NumPy operations. The per-player order of games is kept,
+so the result is identical to applying ``rate_game`` game by game.
+"""
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+BASE_RATING = 1500.0          # rating of a self-reported 5.5
+RATING_PER_SKILL_POINT = 100.0
+RATING_SCALE = 400.0
+K_FACTOR = 32.0
+PROVISIONAL_GAMES = 10        # K is doubled until a player has this many rated games
+
+def initial_rating(skill_level: float) -> float:
+    """Starting rating derived from the self-reported 1-10 skill level"""
+    return BASE_RATING + (skill_level - 5.5) * RATING_PER_SKILL_POINT
+
+def rating_to_skill(rating: float) -> float:
+    """Rating on the 1-10 skill scale the balancer works with"""
+    return min(10.0, max(1.0, 5.5 + (rating - BASE_RATING) / RATING_PER_SKILL_POINT))
+
+def goal_difference_multiplier(margin) -> np.ndarray:
+    """1 for a draw or one-goal game, 1.5 for two goals, (11 + n) / 8 beyond"""
+    margin = np.abs(np.asarray(margin, dtype=np.float64))
+    return np.where(margin <= 1, 1.0, np.where(margin == 2, 1.5, (11.0 + margin) / 8.0))
+
+def expected_score(rating_a, rating_b) -> np.ndarray:
+    """Expected score of side A against side B"""
+    return 1.0 / (1.0 + 10.0 ** ((np.asarray(rating_b) - np.asarray(rating_a)) / RATING_SCALE))
+
+def k_factor(games_rated) -> np.ndarray:
+    return np.where(np.asarray(games_rated) < PROVISIONAL_GAMES, 2 * K_FACTOR, K_FACTOR)
+
+def rate_game(
+    ratings_a: Sequence[float], games_a: Sequence[int],
+    ratings_b: Sequence[float], games_b: Sequence[int],
+    score_a: int, score_b: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Rating changes for each player of Team A and Team B after one result"""
+    expected = float(expected_score(np.mean(ratings_a), np.mean(ratings_b)))
+    actual = 1.0 if score_a > score_b else 0.0 if score_a < score_b else 0.5
+    swing = float(goal_difference_multiplier(score_a - score_b)) * (actual - expected)
+    return k_factor(games_a) * swing, -k_factor(games_b) * swing
+
+@dataclass
+class RatedGame:
+    """A completed game as player indices into the ratings arrays"""
+    team_a: List[int]
+    team_b: List[int]
+    score_a: int
+    score_b: int
+
+def plan_waves(games: Sequence[RatedGame], player_count: int) -> List[List[int]]:
+    """Group games (in order) so no player appears twice in a wave.
+
+    A game goes into the wave after the latest wave any of its players
+    was in, which preserves every player's own game order.
+    """
+    last_wave = np.full(player_count, -1, dtype=np.int64)
+    waves: List[List[int]] = []
+    for g, game in enumerate(games):
+        members = game.team_a + game.team_b
+        wave = int(last_wave[members].max()) + 1 if members else 0
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append(g)
+        last_wave[members] = wave
+    return waves
+
+def replay_ratings(
+    initial: Sequence[float], games: Sequence[RatedGame]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Re-rate all history from ``initial``; returns ``(ratings, games_rated)``"""
+    ratings = np.array(initial, dtype=np.float64)
+    games_rated = np.zeros(len(ratings), dtype=np.int64)
+
+    for wave in plan_waves(games, len(ratings)):
+        players, sides, side_a, side_b, margins, actual = [], [], [], [], [], []
+        for k, g in enumerate(wave):
+            game = games[g]
+            players += game.team_a + game.team_b
+            # Side 2k is Team A of the k-th game in the wave, 2k + 1 its Team B
+            sides += [2 * k] * len(game.team_a) + [2 * k + 1] * len(game.team_b)
+            margins.append(game.score_a - game.score_b)
+            actual.append(1.0 if game.score_a > game.score_b else 0.0 if game.score_a < game.score_b else 0.5)
+
+        players = np.array(players, dtype=np.int64)
+        sides = np.array(sides, dtype=np.int64)
+        side_count = 2 * len(wave)
+        totals = np.bincount(sides, weights=ratings[players], minlength=side_count)
+        sizes = np.bincount(sides, minlength=side_count)
+        means = totals / np.maximum(sizes, 1)
+
+        expected = expected_score(means[0::2], means[1::2])
+        swing = goal_difference_multiplier(margins) * (np.array(actual) - expected)
+        side_swing = np.empty(side_count)
+        side_swing[0::2] = swing
+        side_swing[1::2] = -swing
+
+        ratings[players] += k_factor(games_rated[players]) * side_swing[sides]
+        games_rated[players] += 1
+
+    return ratings, games_rated
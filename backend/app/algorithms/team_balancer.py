@@ -0,0 +1,194 @@
+"""
+Smart team balancing for pickup games
+
+Implements the four phases from SMART_TEAM_ALGORITHM_PLAN.md: goalkeeper
+distribution, snake draft, position optimization and swap-based refinement.
+
+With ``restarts`` set, phase 4 also runs seeded random restarts across a
+process pool (see parallel_search.py) and keeps the best split found within
+``time_budget`` seconds.
+"""
+import random
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Tuple
+
+from .player import Player
+from .balance_calculator import BalanceCalculator
+from .batch_scorer import BatchBalanceScorer
+from .chemistry import ChemistryMatrix
+from .incremental_rebalancer import IncrementalRebalancer
+from .parallel_search import MultiStartSearch
+from .position_optimizer import PositionOptimizer
+
+ALGORITHM_VERSION = '1.0'
+MIN_PLAYERS_FOR_TEAMS = 4
+
+class TeamBalancer:
+    """Smart team balancing algorithm for pickup football games"""
+
+    def __init__(
+        self,
+        max_refinement_passes: int = 50,
+        restarts: int = 0,
+        time_budget: Optional[float] = None,
+        executor: Optional[Executor] = None,
+        chemistry: Optional[ChemistryMatrix] = None
+    ):
+        self.chemistry = chemistry
+        self.balance_calculator = BalanceCalculator(chemistry)
+        self.position_optimizer = PositionOptimizer()
+        self.max_refinement_passes = max_refinement_passes
+        self.restarts = restarts
+        self.time_budget = time_budget
+        self.executor = executor
+
+    def generate_balanced_teams(self, players: List[Player], seed: Optional[int] = None) -> Dict:
+        """
+        Generate balanced teams from list of confirmed players
+
+        ``seed`` drives the random restarts; a random one is drawn (and
+        returned) when omitted so any result can be reproduced.
+
+        Returns:
+            {
+                'team_a': List[Player],
+                'team_b': List[Player],
+                'assigned_positions': Dict[int, str],
+                'balance_score': float,
+                'balance_details': Dict,
+                'swaps_evaluated': int,
+                'algorithm_version': str,
+                'seed': int,
+                'restarts_completed': int
+            }
+        """
+        if len(players) < MIN_PLAYERS_FOR_TEAMS:
+            raise ValueError(f"Need at least {MIN_PLAYERS_FOR_TEAMS} players to create teams")
+
+        # Phases 1 & 2: goalkeepers first, then snake draft the rest
+        team_a, team_b = self._initial_split(players)
+
+        # Phase 3: fill critical position gaps
+        team_a, team_b = self.position_optimizer.optimize_positions(team_a, team_b)
+
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(31)
+
+        # Phase 4: swap-based refinement, plus multi-start search when enabled
+        # A configured pool means multi-start mode even at 0 restarts, so replaying a
+        # run that completed none takes the same path as the run itself
+        if self.restarts > 0 or self.executor is not None:
+            team_a, team_b, swaps_evaluated, restarts_completed = self._multi_start(team_a, team_b, seed)
+        else:
+            team_a, team_b, swaps_evaluated = self._optimize_final_balance(team_a, team_b)
+            restarts_completed = 0
+
+        result = self.build_result(team_a, team_b, swaps_evaluated)
+        result['seed'] = seed
+        result['restarts_completed'] = restarts_completed
+        return result
+
+    def rebalance_teams(
+        self,
+        players: List[Player],
+        previous: Dict[int, int],
+        target_score: float,
+        max_swaps: int = 3,
+        tolerance: float = 2.0
+    ) -> Dict:
+        """
+        Rebalance previously generated teams after the confirmed roster changed
+
+        ``previous`` maps player id -> 0 (Team A) / 1 (Team B) from the stored
+        assignment. Returns the same shape as ``generate_balanced_teams`` plus
+        ``moved_player_ids`` (returning players who changed team).
+        """
+        if len(players) < MIN_PLAYERS_FOR_TEAMS:
+            raise ValueError(f"Need at least {MIN_PLAYERS_FOR_TEAMS} players to create teams")
+
+        rebalancer = IncrementalRebalancer(max_swaps=max_swaps, tolerance=tolerance, chemistry=self.chemistry)
+        players, assignment, moved_ids, evaluated = rebalancer.rebalance(players, previous, target_score)
+        result = self.build_result(*split_teams(players, assignment), evaluated)
+        result['moved_player_ids'] = moved_ids
+        return result
+
+    def build_result(self, team_a: List[Player], team_b: List[Player], swaps_evaluated: int = 0) -> Dict:
+        """Score a final split and assign positions within each team"""
+        balance_score, balance_details = self.balance_calculator.calculate_total_balance(team_a, team_b)
+        assigned_positions = {
+            **self.position_optimizer.assign_positions(team_a),
+            **self.position_optimizer.assign_positions(team_b),
+        }
+        return {
+            'team_a': team_a,
+            'team_b': team_b,
+            'assigned_positions': assigned_positions,
+            'balance_score': balance_score,
+            'balance_details': balance_details,
+            'swaps_evaluated': swaps_evaluated,
+            'algorithm_version': ALGORITHM_VERSION,
+        }
+
+    def _initial_split(self, players: List[Player]) -> Tuple[List[Player], List[Player]]:
+        """Split goalkeepers first, then snake draft everyone else by skill"""
+        size_a = (len(players) + 1) // 2
+        size_b = len(players) // 2
+
+        by_skill = sorted(players, key=lambda p: (-p.strength, p.id))
+        keepers = [p for p in by_skill if p.position == 'Goalkeeper'][:2]
+        outfield = [p for p in by_skill if p not in keepers]
+
+        team_a: List[Player] = []
+        team_b: List[Player] = []
+        # Best keeper to the team that gets the weaker snake-draft pick order
+        for keeper, team in zip(keepers, (team_b, team_a)):
+            team.append(keeper)
+
+        for i, player in enumerate(outfield):
+            # Snake pattern: A, B, B, A, A, B, B, A, ...
+            prefer_a = i % 4 in (0, 3)
+            if (prefer_a and len(team_a) < size_a) or len(team_b) >= size_b:
+                team_a.append(player)
+            else:
+                team_b.append(player)
+
+        return team_a, team_b
+
+    def _optimize_final_balance(
+        self, team_a: List[Player], team_b: List[Player]
+    ) -> Tuple[List[Player], List[Player], int]:
+        """Apply the best improving swap until none is left (steepest ascent).
+
+        Each pass scores the whole swap neighbourhood as one NumPy batch.
+        """
+        players = team_a + team_b
+        scorer = BatchBalanceScorer(players, self.chemistry)
+        assignment, _, evaluated = scorer.refine(
+            [0] * len(team_a) + [1] * len(team_b), self.max_refinement_passes
+        )
+        return split_teams(players, assignment) + (evaluated,)
+
+    def _multi_start(
+        self, team_a: List[Player], team_b: List[Player], seed: int
+    ) -> Tuple[List[Player], List[Player], int, int]:
+        """Best of the refined draft and seeded random restarts within the time budget"""
+        # Fixed roster order so a seed maps to the same splits whatever the draft did
+        players = sorted(team_a + team_b, key=lambda p: p.id)
+        on_b = {p.id for p in team_b}
+        baseline = [1 if p.id in on_b else 0 for p in players]
+
+        search = MultiStartSearch(
+            restarts=self.restarts,
+            time_budget=self.time_budget,
+            max_passes=self.max_refinement_passes,
+            executor=self.executor,
+            chemistry=self.chemistry
+        )
+        assignment, _, evaluated, completed = search.search(players, baseline, seed)
+        return split_teams(players, assignment) + (evaluated, completed)
+
+def split_teams(players: List[Player], assignment) -> Tuple[List[Player], List[Player]]:
+    """Players on Team A (0) and Team B (1) for a 0/1 assignment vector"""
+    team_a = [p for p, t in zip(players, assignment) if t == 0]
+    team_b = [p for p, t in zip(players, assignment) if t == 1]
+    return team_a, team_b
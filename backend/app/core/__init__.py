@@ -2,6 +2,28 @@
 Core module initialization
 """
 from .config import settings
-from .database import get_db_connection, DatabaseManager
+from .database import (
+    get_db_connection, DatabaseManager, ConnectionPool, PoolExhaustedError,
+    get_pool, close_pool
+)
+from .async_database import (
+    AsyncDatabaseManager, AsyncCursor, init_async_pool, get_async_pool,
+    close_async_pool, async_pool_stats
+)
+from .password_pool import (
+    run_password_task, get_password_pool, shutdown_password_pool, password_pool_stats
+)
+from .query_stats import QueryTimingMiddleware, current_queries, fingerprint
+from .game_events import (
+    GameUpdateSubscription, get_game_updates, close_game_updates, sse_events
+)
 
-__all__ = ["settings", "get_db_connection", "DatabaseManager"]
+__all__ = [
+    "settings", "get_db_connection", "DatabaseManager", "ConnectionPool",
+    "PoolExhaustedError", "get_pool", "close_pool",
+    "AsyncDatabaseManager", "AsyncCursor", "init_async_pool", "get_async_pool",
+    "close_async_pool", "async_pool_stats",
+    "run_password_task", "get_password_pool", "shutdown_password_pool", "password_pool_stats",
+    "QueryTimingMiddleware", "current_queries", "fingerprint",
+    "GameUpdateSubscription", "get_game_updates", "close_game_updates", "sse_events"
+]
@@ -0,0 +1,179 @@
+"""
+Asyncio database access backed by an asyncpg connection pool
+
+Route handlers are ``async def``, so the service layer talks to Postgres
+through this module instead of the blocking psycopg2 ``DatabaseManager``.
+``AsyncCursor`` keeps the psycopg2 calling convention (``%s`` placeholders,
+``fetchone``/``fetchall`` returning dicts) so service SQL reads the same in
+both worlds.
+"""
+import asyncio
+import logging
+import re
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+import asyncpg
+from fastapi import HTTPException
+from .config import settings
+from .query_stats import calling_method, record_query
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = re.compile(r"%s|%%")
+
+@lru_cache(maxsize=512)
+def translate_placeholders(query: str) -> str:
+    """Rewrite psycopg2 ``%s`` placeholders into asyncpg ``$n`` positional ones"""
+    counter = 0
+
+    def _replace(match):
+        nonlocal counter
+        if match.group(0) == "%%":
+            return "%"
+        counter += 1
+        return f"${counter}"
+
+    return _PLACEHOLDER.sub(_replace, query)
+
+_RETURNS_ROWS = re.compile(r"^\s*(?:SELECT|WITH|VALUES|SHOW|TABLE)\b|\bRETURNING\b", re.IGNORECASE)
+
+@lru_cache(maxsize=512)
+def returns_rows(query: str) -> bool:
+    """Whether ``query`` produces a result set (a SELECT or a write with RETURNING)"""
+    return _RETURNS_ROWS.search(query) is not None
+
+def status_rowcount(status: str) -> int:
+    """Rows affected according to a command tag such as ``UPDATE 3`` or ``INSERT 0 1``"""
+    count = status.rsplit(" ", 1)[-1]
+    return int(count) if count.isdigit() else 0
+
+class AsyncCursor:
+    """Minimal psycopg2-style cursor over an asyncpg connection"""
+
+    def __init__(self, conn: asyncpg.Connection):
+        self.conn = conn
+        self._rows: List[asyncpg.Record] = []
+        self._pos = 0
+        self._rowcount = -1
+
+    async def execute(self, query: str, params: Optional[Sequence[Any]] = None) -> None:
+        caller = calling_method()
+        started = time.perf_counter()
+        self._rows, self._pos, self._rowcount = [], 0, -1
+        try:
+            if returns_rows(query):
+                self._rows = await self.conn.fetch(translate_placeholders(query), *(params or ()))
+                self._rowcount = len(self._rows)
+            else:
+                # fetch() drops the command tag, so writes without RETURNING
+                # go through execute() to learn how many rows they touched
+                status = await self.conn.execute(translate_placeholders(query), *(params or ()))
+                self._rowcount = status_rowcount(status)
+        finally:
+            record_query(query, params, started, max(self._rowcount, 0), caller)
+
+    @property
+    def rowcount(self) -> int:
+        """Rows returned, or affected by a write without RETURNING; -1 if the statement failed"""
+        return self._rowcount
+
+    def fetchone(self) -> Optional[Dict[str, Any]]:
+        if self._pos >= len(self._rows):
+            return None
+        row = self._rows[self._pos]
+        self._pos += 1
+        return dict(row)
+
+    def fetchall(self) -> List[Dict[str, Any]]:
+        rows = self._rows[self._pos:]
+        self._pos = len(self._rows)
+        return [dict(row) for row in rows]
+
+_async_pool: Optional[asyncpg.Pool] = None
+_async_pool_lock = asyncio.Lock()
+
+async def init_async_pool() -> asyncpg.Pool:
+    """Create the per-worker asyncpg pool (idempotent)"""
+    global _async_pool
+    if _async_pool is None:
+        async with _async_pool_lock:
+            if _async_pool is None:
+                config = settings.DATABASE_CONFIG
+                try:
+                    _async_pool = await asyncpg.create_pool(
+                        host=config["host"],
+                        database=config["database"],
+                        user=config["user"],
+                        password=config["password"],
+                        port=config["port"],
+                        min_size=settings.ASYNC_DB_POOL_MIN_SIZE,
+                        max_size=settings.ASYNC_DB_POOL_MAX_SIZE,
+                        max_inactive_connection_lifetime=settings.DB_POOL_MAX_LIFETIME,
+                        command_timeout=settings.ASYNC_DB_COMMAND_TIMEOUT
+                    )
+                except (OSError, asyncpg.PostgresError) as e:
+                    logger.error("Async database pool creation failed: %s", e)
+                    raise HTTPException(
+                        status_code=500,
+                        detail=f"Database connection failed: {str(e)}"
+                    )
+    return _async_pool
+
+async def get_async_pool() -> asyncpg.Pool:
+    """Get the per-worker asyncpg pool, creating it on first use"""
+    return _async_pool or await init_async_pool()
+
+async def close_async_pool() -> None:
+    """Close the per-worker asyncpg pool (called on application shutdown)"""
+    global _async_pool
+    if _async_pool is not None:
+        await _async_pool.close()
+        _async_pool = None
+
+def async_pool_stats() -> Dict[str, Any]:
+    """Snapshot of the asyncpg pool size"""
+    if _async_pool is None:
+        return {"size": 0, "idle": 0, "in_use": 0}
+    size = _async_pool.get_size()
+    idle = _async_pool.get_idle_size()
+    return {
+        "min_size": _async_pool.get_min_size(),
+        "max_size": _async_pool.get_max_size(),
+        "size": size,
+        "idle": idle,
+        "in_use": size - idle,
+    }
+
+class AsyncDatabaseManager:
+    """Async context manager for database operations in a single transaction"""
+
+    def __init__(self):
+        self.pool = None
+        self.conn = None
+        self.transaction = None
+        self.cursor = None
+
+    async def __aenter__(self):
+        self.pool = await get_async_pool()
+        try:
+            self.conn = await self.pool.acquire(timeout=settings.DB_POOL_CHECKOUT_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Database busy: no connection available within {settings.DB_POOL_CHECKOUT_TIMEOUT}s"
+            )
+        self.transaction = self.conn.transaction()
+        await self.transaction.start()
+        self.cursor = AsyncCursor(self.conn)
+        return self.cursor, self.conn
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type:
+                await self.transaction.rollback()
+            else:
+                await self.transaction.commit()
+        finally:
+            await self.pool.release(self.conn)
@@ -4,6 +4,18 @@ Configuration settings for the Pickup Football API
 import os
 from typing import Dict, Any
 
+def parse_signing_keys(value: str) -> Dict[str, str]:
+    """``kid:secret,kid:secret`` -> {kid: secret}"""
+    keys = {}
+    for entry in value.split(","):
+        kid, _, secret = entry.strip().partition(":")
+        if kid and secret:
+            keys[kid] = secret
+    return keys
+
+# Only used when ALLOW_DEV_SIGNING_KEY=true; anyone with the source can sign tokens with it
+DEV_SIGNING_KEYS = "dev:dev-only-signing-key-change-me"
+
 class Settings:
     """Application settings"""
     
@@ -23,8 +35,48 @@ class Settings:
         "port": int(os.getenv("POSTGRES_PORT", "5432"))
     }
     
+    # Connection Pool Settings
+    DB_POOL_MIN_SIZE: int = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+    DB_POOL_MAX_SIZE: int = int(os.getenv("DB_POOL_MAX_SIZE", "20"))
+    DB_POOL_MAX_LIFETIME: float = float(os.getenv("DB_POOL_MAX_LIFETIME", "1800"))  # seconds
+    DB_POOL_CHECKOUT_TIMEOUT: float = float(os.getenv("DB_POOL_CHECKOUT_TIMEOUT", "5"))  # seconds
+    DB_POOL_HEALTH_CHECK_INTERVAL: float = float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", "30"))  # seconds idle before ping
+    
+    # Async (asyncpg) Pool Settings - used by the API service layer
+    ASYNC_DB_POOL_MIN_SIZE: int = int(os.getenv("ASYNC_DB_POOL_MIN_SIZE", "5"))
+    ASYNC_DB_POOL_MAX_SIZE: int = int(os.getenv("ASYNC_DB_POOL_MAX_SIZE", "20"))
+    ASYNC_DB_COMMAND_TIMEOUT: float = float(os.getenv("ASYNC_DB_COMMAND_TIMEOUT", "10"))  # seconds
+    
+    # Query instrumentation (Server-Timing header, slow-query and N+1 warnings)
+    SLOW_QUERY_MS: float = float(os.getenv("SLOW_QUERY_MS", "200"))
+    REPEATED_QUERY_WARN: int = int(os.getenv("REPEATED_QUERY_WARN", "10"))  # same statement per request
+    
     # Security Settings
-    BCRYPT_ROUNDS: int = 12
+    # bcrypt cost for new hashes; logins rehash stored passwords at any other cost.
+    # Each +1 doubles hash/verify CPU: measure with app/scripts/tests/benchmark_bcrypt.py
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    # Every key still accepted for verification; rotate by adding a key, switching
+    # JWT_ACTIVE_KEY_ID to it and dropping the old one after ACCESS_TOKEN_EXPIRE_MINUTES
+    # No default: the API refuses to start without keys unless ALLOW_DEV_SIGNING_KEY=true
+    ALLOW_DEV_SIGNING_KEY: bool = os.getenv("ALLOW_DEV_SIGNING_KEY", "false").lower() == "true"
+    JWT_SIGNING_KEYS: Dict[str, str] = parse_signing_keys(
+        os.getenv("JWT_SIGNING_KEYS") or (DEV_SIGNING_KEYS if ALLOW_DEV_SIGNING_KEY else "")
+    )
+    JWT_ACTIVE_KEY_ID: str = os.getenv("JWT_ACTIVE_KEY_ID", next(iter(JWT_SIGNING_KEYS), ""))
+    JWT_ALGORITHM: str = "HS256"
+    JWT_ISSUER: str = "pickup-football-api"
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    REVOKED_TOKENS_MAX: int = 100000  # per worker, entries expire with their token
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))  # bcrypt threads per worker
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))  # beyond this, 503
+    # Login throttling: token buckets per username and per client IP (burst, then one attempt per refill)
+    LOGIN_USERNAME_BURST: int = int(os.getenv("LOGIN_USERNAME_BURST", "5"))
+    LOGIN_USERNAME_REFILL_SECONDS: float = float(os.getenv("LOGIN_USERNAME_REFILL_SECONDS", "60"))
+    LOGIN_IP_BURST: int = int(os.getenv("LOGIN_IP_BURST", "30"))
+    LOGIN_IP_REFILL_SECONDS: float = float(os.getenv("LOGIN_IP_REFILL_SECONDS", "2"))
+    # "memory" (per worker) or a SQLite file path shared by every worker/node that can open it
+    LOGIN_RATE_LIMIT_STORE: str = os.getenv("LOGIN_RATE_LIMIT_STORE", "memory")
+    LOGIN_RATE_LIMIT_MAX_KEYS: int = 100000  # memory store, least recently used evicted first
     
     # Game Settings
     DEFAULT_GAME_DURATION: int = 90
@@ -35,6 +87,41 @@ class Settings:
     MAX_PLAYERS: int = 30
     MIN_SKILL_LEVEL: int = 1
     MAX_SKILL_LEVEL: int = 10
+    
+    # Team Generation Settings
+    TEAM_SEARCH_RESTARTS: int = int(os.getenv("TEAM_SEARCH_RESTARTS", "64"))
+    TEAM_SEARCH_TIME_BUDGET: float = float(os.getenv("TEAM_SEARCH_TIME_BUDGET", "1.5"))  # seconds, under the 2s target
+    TEAM_SEARCH_WORKERS: int = int(os.getenv("TEAM_SEARCH_WORKERS", "0"))  # 0 = one per CPU core
+    
+    # Live Update Settings (server-sent events)
+    LIVE_UPDATES_MAX_SUBSCRIBERS: int = int(os.getenv("LIVE_UPDATES_MAX_SUBSCRIBERS", "1000"))  # per worker
+    LIVE_UPDATES_HEARTBEAT: float = 15.0  # seconds between keep-alive comments
+    LIVE_UPDATES_RETRY_MS: int = 3000  # client reconnect delay
+    
+    # Listing Cache Settings
+    GAMES_LIST_CACHE_TTL: float = float(os.getenv("GAMES_LIST_CACHE_TTL", "2"))  # seconds, bounds cross-worker staleness
+    GAMES_LIST_CACHE_SIZE: int = 256
+    USER_CACHE_TTL: float = float(os.getenv("USER_CACHE_TTL", "60"))  # seconds, bounds cross-worker staleness
+    USER_CACHE_SIZE: int = int(os.getenv("USER_CACHE_SIZE", "10000"))
+    
+    # Location Search Settings
+    DEFAULT_SEARCH_RADIUS_KM: float = 10.0  # matches user_preferences.max_travel_distance default
+    MAX_SEARCH_RADIUS_KM: float = 100.0
+    SEARCH_SIMILARITY_THRESHOLD: float = 0.5  # pg_trgm word similarity for fuzzy matches
+    
+    # Pagination Settings
+    DEFAULT_PAGE_SIZE: int = 20
+    MAX_PAGE_SIZE: int = 100
+
+    def require_signing_keys(self) -> None:
+        """Refuse to serve without a configured session signing key"""
+        if not self.JWT_SIGNING_KEYS:
+            raise RuntimeError(
+                "JWT_SIGNING_KEYS is not set. Configure kid:secret pairs, or set "
+                "ALLOW_DEV_SIGNING_KEY=true for local development only."
+            )
+        if self.JWT_ACTIVE_KEY_ID not in self.JWT_SIGNING_KEYS:
+            raise RuntimeError(f"JWT_ACTIVE_KEY_ID {self.JWT_ACTIVE_KEY_ID!r} is not in JWT_SIGNING_KEYS")
 
 # Create settings instance
 settings = Settings()
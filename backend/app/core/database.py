@@ -1,43 +1,307 @@
 """
 Database connection and management utilities
 """
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
 import psycopg2
+from psycopg2 import extensions
 from psycopg2.extras import RealDictCursor
 from fastapi import HTTPException
 from .config import settings
+from .query_stats import calling_method, record_query
+
+logger = logging.getLogger(__name__)
 
 def get_db_connection():
     """Get database connection with proper error handling"""
     try:
-        print(f"Attempting to connect with config: {settings.DATABASE_CONFIG}")
         conn = psycopg2.connect(**settings.DATABASE_CONFIG, cursor_factory=RealDictCursor)
         return conn
     except psycopg2.Error as e:
-        print(f"Database connection error: {str(e)}")
+        logger.error(
+            "Database connection error (host=%s, database=%s, user=%s): %s",
+            settings.DATABASE_CONFIG.get("host"),
+            settings.DATABASE_CONFIG.get("database"),
+            settings.DATABASE_CONFIG.get("user"),
+            e,
+        )
         raise HTTPException(
-            status_code=500, 
+            status_code=500,
             detail=f"Database connection failed: {str(e)}"
         )
 
+class PoolExhaustedError(Exception):
+    """Raised when no connection becomes available within the checkout timeout"""
+    pass
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of psycopg2 connections.
+
+    Idle connections are reused LIFO so the warmest connection is handed out
+    first. On checkout a connection is discarded if it is closed, older than
+    ``max_lifetime`` seconds, or fails a ``SELECT 1`` ping after sitting idle
+    for longer than ``health_check_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 10,
+        max_lifetime: float = 1800.0,
+        checkout_timeout: float = 5.0,
+        health_check_interval: float = 30.0,
+        connect=get_db_connection
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self._connect = connect
+
+        self._cond = threading.Condition(threading.Lock())
+        self._idle = deque()  # (conn, created_at, last_used_at)
+        self._created_at: Dict[int, float] = {}
+        self._size = 0
+        self._closed = False
+
+        self._metrics = {
+            "checkouts": 0,
+            "connections_created": 0,
+            "connections_discarded": 0,
+            "health_check_failures": 0,
+            "waits": 0,
+            "exhausted": 0,
+            "total_wait_ms": 0.0,
+        }
+
+        for _ in range(min_size):
+            conn = self._open()
+            self._idle.append((conn, self._created_at[id(conn)], time.monotonic()))
+
+    def _open(self):
+        """Open a new connection and account for it (caller reserves the slot)"""
+        conn = self._connect()
+        with self._cond:
+            self._size += 1
+            self._created_at[id(conn)] = time.monotonic()
+            self._metrics["connections_created"] += 1
+        return conn
+
+    def _discard(self, conn) -> None:
+        """Close a connection and free its slot"""
+        try:
+            if not conn.closed:
+                conn.close()
+        except psycopg2.Error:
+            pass
+        with self._cond:
+            self._created_at.pop(id(conn), None)
+            self._size -= 1
+            self._metrics["connections_discarded"] += 1
+            self._cond.notify()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return bool(self.max_lifetime) and now - created_at > self.max_lifetime
+
+    def _is_healthy(self, conn, last_used_at: float, now: float) -> bool:
+        if conn.closed:
+            return False
+        if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+            return False
+        if now - last_used_at < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            with self._cond:
+                self._metrics["health_check_failures"] += 1
+            return False
+
+    def getconn(self):
+        """Borrow a connection, waiting up to ``checkout_timeout`` seconds"""
+        deadline = time.monotonic() + self.checkout_timeout
+        waited = False
+        started = time.monotonic()
+
+        while True:
+            candidate = None
+            reserve = False
+            with self._cond:
+                if self._closed:
+                    raise PoolExhaustedError("Connection pool is closed")
+
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._metrics["exhausted"] += 1
+                        raise PoolExhaustedError(
+                            f"No database connection available within {self.checkout_timeout}s "
+                            f"(pool size {self.max_size})"
+                        )
+                    if not waited:
+                        waited = True
+                        self._metrics["waits"] += 1
+                    self._cond.wait(remaining)
+
+                if self._idle:
+                    candidate = self._idle.pop()
+                else:
+                    # Reserve the slot now so concurrent callers respect max_size
+                    self._size += 1
+                    reserve = True
+
+            if reserve:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._created_at[id(conn)] = time.monotonic()
+                    self._metrics["connections_created"] += 1
+                break
+
+            conn, created_at, last_used_at = candidate
+            now = time.monotonic()
+            if self._is_expired(created_at, now) or not self._is_healthy(conn, last_used_at, now):
+                self._discard(conn)
+                continue
+            break
+
+        with self._cond:
+            self._metrics["checkouts"] += 1
+            if waited:
+                self._metrics["total_wait_ms"] += (time.monotonic() - started) * 1000
+        return conn
+
+    def putconn(self, conn, discard: bool = False) -> None:
+        """Return a borrowed connection to the pool"""
+        with self._cond:
+            created_at = self._created_at.get(id(conn))
+            closed = self._closed
+
+        if (
+            discard
+            or closed
+            or created_at is None
+            or conn.closed
+            or self._is_expired(created_at, time.monotonic())
+        ):
+            self._discard(conn)
+            return
+
+        if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                self._discard(conn)
+                return
+
+        with self._cond:
+            self._idle.append((conn, created_at, time.monotonic()))
+            self._cond.notify()
+
+    def closeall(self) -> None:
+        """Close every idle connection and refuse further checkouts"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn, _, _ in idle:
+            self._discard(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool size and exhaustion metrics"""
+        with self._cond:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                **self._metrics,
+            }
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+def get_pool() -> ConnectionPool:
+    """Get the process-wide connection pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    min_size=settings.DB_POOL_MIN_SIZE,
+                    max_size=settings.DB_POOL_MAX_SIZE,
+                    max_lifetime=settings.DB_POOL_MAX_LIFETIME,
+                    checkout_timeout=settings.DB_POOL_CHECKOUT_TIMEOUT,
+                    health_check_interval=settings.DB_POOL_HEALTH_CHECK_INTERVAL
+                )
+    return _pool
+
+def close_pool() -> None:
+    """Close the process-wide connection pool (called on application shutdown)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+class InstrumentedCursor(RealDictCursor):
+    """RealDictCursor that reports each statement to the per-request query record"""
+
+    def execute(self, query, vars=None):
+        caller = calling_method()
+        started = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            record_query(query, vars, started, max(self.rowcount, 0), caller)
+
 class DatabaseManager:
-    """Context manager for database operations"""
-    
+    """Context manager for database operations using a pooled connection"""
+
     def __init__(self):
         self.conn = None
         self.cursor = None
-    
+        self.pool = None
+
     def __enter__(self):
-        self.conn = get_db_connection()
-        self.cursor = self.conn.cursor()
+        self.pool = get_pool()
+        try:
+            self.conn = self.pool.getconn()
+        except PoolExhaustedError as e:
+            raise HTTPException(status_code=503, detail=f"Database busy: {str(e)}")
+        self.cursor = self.conn.cursor(cursor_factory=InstrumentedCursor)
         return self.cursor, self.conn
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type:
-            self.conn.rollback()
-        else:
-            self.conn.commit()
-        
-        if self.cursor:
-            self.cursor.close()
-        if self.conn:
-            self.conn.close()
+        broken = False
+        try:
+            if exc_type:
+                self.conn.rollback()
+            else:
+                self.conn.commit()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            if not exc_type:
+                raise
+        finally:
+            if self.cursor and not self.cursor.closed:
+                self.cursor.close()
+            if self.conn:
+                self.pool.putconn(self.conn, discard=broken or bool(self.conn.closed))
@@ -0,0 +1,196 @@
+"""
+Live game updates fanned out from Postgres LISTEN/NOTIFY
+
+A trigger on games (16_add_game_update_notifications.sql) publishes a small
+JSON delta on the ``game_updates`` channel whenever a game's counters or
+status change. Each worker holds one dedicated listening connection (outside
+the pool) and fans every delta out to its streaming subscribers, so any
+number of open dashboards costs one database connection per worker.
+
+Subscribers keep only the latest delta per game until they read it, so a
+slow client never grows an unbounded backlog. After the listening
+connection drops and comes back, subscribers get a ``resync`` event: deltas
+sent while it was down are lost, and clients should re-fetch once.
+"""
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Callable, Awaitable, Dict, List, Optional, Set
+
+import asyncpg
+from fastapi import HTTPException
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+GAME_UPDATES_CHANNEL = "game_updates"
+RECONNECT_BACKOFF = (0.5, 1, 2, 5, 10)  # seconds, last value repeats
+
+class GameUpdateSubscription:
+    """One streaming client's view of the channel"""
+
+    def __init__(self, game_ids: Optional[Set[int]] = None):
+        self.game_ids = game_ids  # None = every game
+        self._pending: Dict[int, dict] = {}
+        self._ready = asyncio.Event()
+
+    def wants(self, game_id: int) -> bool:
+        return self.game_ids is None or game_id in self.game_ids
+
+    def push(self, event: dict) -> None:
+        """Queue an event, replacing any unread one for the same game"""
+        key = event.get("game_id", 0)
+        self._pending.pop(key, None)
+        self._pending[key] = event
+        self._ready.set()
+
+    async def next_batch(self, timeout: float) -> List[dict]:
+        """Unread events in arrival order, or [] after ``timeout`` seconds without any"""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        batch = list(self._pending.values())
+        self._pending.clear()
+        self._ready.clear()
+        return batch
+
+class GameUpdateBroadcaster:
+    """Per-worker LISTEN connection plus its subscribers"""
+
+    def __init__(self):
+        self._conn: Optional[asyncpg.Connection] = None
+        self._lock = asyncio.Lock()
+        self._subscribers: Set[GameUpdateSubscription] = set()
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    async def open_subscription(self, game_ids: Optional[Set[int]] = None) -> GameUpdateSubscription:
+        """Check capacity and start listening; the stream registers the result once it runs"""
+        if len(self._subscribers) >= settings.LIVE_UPDATES_MAX_SUBSCRIBERS:
+            raise HTTPException(status_code=503, detail="Too many live update subscribers, try again later")
+        await self._ensure_listening()
+        return GameUpdateSubscription(game_ids)
+
+    def subscribe(self, subscription: GameUpdateSubscription) -> None:
+        self._subscribers.add(subscription)
+
+    def unsubscribe(self, subscription: GameUpdateSubscription) -> None:
+        self._subscribers.discard(subscription)
+
+    async def _ensure_listening(self) -> None:
+        if self._conn is not None:
+            return
+        async with self._lock:
+            if self._conn is not None:
+                return
+            try:
+                self._conn = await self._connect()
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.error("Live update listener connection failed: %s", e)
+                raise HTTPException(status_code=503, detail="Live updates unavailable")
+            self._closed = False
+
+    async def _connect(self) -> asyncpg.Connection:
+        config = settings.DATABASE_CONFIG
+        conn = await asyncpg.connect(
+            host=config["host"],
+            database=config["database"],
+            user=config["user"],
+            password=config["password"],
+            port=config["port"]
+        )
+        await conn.add_listener(GAME_UPDATES_CHANNEL, self._on_notify)
+        conn.add_termination_listener(self._on_terminated)
+        return conn
+
+    def _on_notify(self, conn, pid, channel, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed %s payload: %r", channel, payload)
+            return
+        event["type"] = "game_update"
+        game_id = event.get("game_id")
+        for subscription in self._subscribers:
+            if subscription.wants(game_id):
+                subscription.push(dict(event))
+
+    def _on_terminated(self, conn) -> None:
+        if conn is not self._conn:
+            return
+        self._conn = None
+        if not self._closed and self._reconnect_task is None:
+            logger.warning("Live update listener connection lost, reconnecting")
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        attempt = 0
+        try:
+            while not self._closed:
+                try:
+                    async with self._lock:
+                        if self._conn is None:
+                            self._conn = await self._connect()
+                    break
+                except (OSError, asyncpg.PostgresError) as e:
+                    delay = RECONNECT_BACKOFF[min(attempt, len(RECONNECT_BACKOFF) - 1)]
+                    logger.warning("Live update listener reconnect failed (%s), retrying in %ss", e, delay)
+                    attempt += 1
+                    await asyncio.sleep(delay)
+            # Deltas published while disconnected are gone
+            for subscription in self._subscribers:
+                subscription.push({"type": "resync"})
+        finally:
+            self._reconnect_task = None
+
+    def stats(self) -> dict:
+        return {"listening": self._conn is not None, "subscribers": len(self._subscribers)}
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+        self._subscribers.clear()
+
+_broadcaster: Optional[GameUpdateBroadcaster] = None
+
+def get_game_updates() -> GameUpdateBroadcaster:
+    """The per-worker broadcaster (connects on first subscription)"""
+    global _broadcaster
+    if _broadcaster is None:
+        _broadcaster = GameUpdateBroadcaster()
+    return _broadcaster
+
+async def close_game_updates() -> None:
+    """Close the listening connection (called on application shutdown)"""
+    global _broadcaster
+    if _broadcaster is not None:
+        await _broadcaster.close()
+        _broadcaster = None
+
+async def sse_events(
+    subscription: GameUpdateSubscription,
+    is_disconnected: Callable[[], Awaitable[bool]]
+) -> AsyncIterator[str]:
+    """Server-sent event stream for one subscription, with keep-alive comments.
+
+    The subscription is registered here rather than by the route, so a client
+    that disconnects before the response starts never leaves one behind.
+    """
+    get_game_updates().subscribe(subscription)
+    try:
+        yield f"retry: {settings.LIVE_UPDATES_RETRY_MS}\n\n"
+        while not await is_disconnected():
+            batch = await subscription.next_batch(settings.LIVE_UPDATES_HEARTBEAT)
+            if not batch:
+                yield ": keep-alive\n\n"
+                continue
+            for event in batch:
+                yield f"event: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+    finally:
+        get_game_updates().unsubscribe(subscription)
@@ -0,0 +1,61 @@
+"""
+Bounded thread pool for bcrypt work
+
+A bcrypt hash or check at cost 12 is ~250ms of CPU. Run on the event loop it
+stalls every other request on the worker, so password work goes to a small
+dedicated pool instead (bcrypt releases the GIL while hashing). Work waiting
+for the pool is capped: past PASSWORD_HASH_MAX_PENDING callers get a 503
+straight away, so a login storm queues in clients rather than in memory.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException
+
+from .config import settings
+
+_password_pool: Optional[ThreadPoolExecutor] = None
+_pending = 0  # submitted and not yet finished; only touched on the event loop
+_rejected = 0
+
+def get_password_pool() -> ThreadPoolExecutor:
+    """The per-worker bcrypt pool, created on first use"""
+    global _password_pool
+    if _password_pool is None:
+        _password_pool = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            thread_name_prefix="bcrypt"
+        )
+    return _password_pool
+
+def shutdown_password_pool() -> None:
+    """Stop the bcrypt threads (called on application shutdown)"""
+    global _password_pool
+    if _password_pool is not None:
+        _password_pool.shutdown(wait=False, cancel_futures=True)
+        _password_pool = None
+
+async def run_password_task(func: Callable[..., Any], *args: Any) -> Any:
+    """Run ``func(*args)`` on the bcrypt pool, or fail fast with 503 when it is saturated"""
+    global _pending, _rejected
+    if _pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        _rejected += 1
+        raise HTTPException(
+            status_code=503,
+            detail="Too many sign-ins in progress, please retry shortly",
+            headers={"Retry-After": "1"}
+        )
+    _pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(get_password_pool(), func, *args)
+    finally:
+        _pending -= 1
+
+def password_pool_stats() -> dict:
+    return {
+        "workers": settings.PASSWORD_HASH_WORKERS,
+        "pending": _pending,
+        "max_pending": settings.PASSWORD_HASH_MAX_PENDING,
+        "rejected": _rejected,
+    }
@@ -0,0 +1,151 @@
+"""
+Per-request SQL instrumentation
+
+Both cursor types (``AsyncCursor`` and the psycopg2 cursor handed out by
+``DatabaseManager``) report every statement here with its duration, row count
+and the service method that issued it. ``QueryTimingMiddleware`` opens a
+record per HTTP request and answers with a ``Server-Timing`` header carrying
+the request's query count and database time, so an N+1 regression shows up in
+the browser's network panel and in access logs.
+
+Statements slower than SLOW_QUERY_MS are logged as a fingerprint (literals
+and placeholders replaced by ``?``) with only the parameters' types, never
+their values. A request that runs the same fingerprint REPEATED_QUERY_WARN
+times or more is logged as a likely N+1.
+"""
+import logging
+import re
+import sys
+import time
+from collections import Counter
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+MAX_STATEMENTS_PER_REQUEST = 500  # beyond this only the totals keep counting
+
+_PLACEHOLDERS = re.compile(r"\$\d+|%s")
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+@lru_cache(maxsize=1024)
+def fingerprint(query: str) -> str:
+    """Statement shape with literals and placeholders as ``?``, whitespace collapsed"""
+    shape = _PLACEHOLDERS.sub("?", query)
+    shape = _STRINGS.sub("?", shape)
+    shape = _NUMBERS.sub("?", shape)
+    shape = _IN_LISTS.sub("(...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+def redact_params(params: Optional[Sequence[Any]]) -> List[str]:
+    """Parameter types (and sizes of lists) without their values"""
+    redacted = []
+    for value in params or ():
+        if isinstance(value, (list, tuple)):
+            redacted.append(f"{type(value).__name__}[{len(value)}]")
+        else:
+            redacted.append(type(value).__name__)
+    return redacted
+
+def calling_method() -> str:
+    """Qualified name of the nearest function outside app.core, e.g. ``GameService.get_games``"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if not frame.f_globals.get("__name__", "").startswith(__package__):
+            return getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+        frame = frame.f_back
+    return "unknown"
+
+class QueryRecord(NamedTuple):
+    """One statement; ``rows`` is rows returned or, for writes without RETURNING, rows affected"""
+
+    fingerprint: str
+    duration_ms: float
+    rows: int
+    caller: str
+
+class RequestQueries:
+    """Statements issued while handling one request"""
+
+    __slots__ = ("count", "duration_ms", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.duration_ms = 0.0
+        self.statements: List[QueryRecord] = []
+
+    def add(self, record: QueryRecord) -> None:
+        self.count += 1
+        self.duration_ms += record.duration_ms
+        if len(self.statements) < MAX_STATEMENTS_PER_REQUEST:
+            self.statements.append(record)
+
+    def repeated(self, threshold: int) -> List[tuple]:
+        """``(fingerprint, caller, times)`` run at least ``threshold`` times"""
+        counts = Counter((r.fingerprint, r.caller) for r in self.statements)
+        return [(fp, caller, n) for (fp, caller), n in counts.most_common() if n >= threshold]
+
+_current: ContextVar[Optional[RequestQueries]] = ContextVar("request_queries", default=None)
+
+def current_queries() -> Optional[RequestQueries]:
+    """The record of the request being handled, if any"""
+    return _current.get()
+
+def record_query(query: str, params: Optional[Sequence[Any]], started: float, rows: int, caller: str) -> None:
+    """Account a statement that began at ``started`` (``time.perf_counter()``), failed ones included"""
+    duration_ms = (time.perf_counter() - started) * 1000
+    shape = fingerprint(query)
+    queries = _current.get()
+    if queries is not None:
+        queries.add(QueryRecord(shape, duration_ms, rows, caller))
+    if duration_ms >= settings.SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query %.1fms (%d rows) in %s: %s params=%s",
+            duration_ms, rows, caller, shape, redact_params(params)
+        )
+
+def server_timing(queries: RequestQueries, total_ms: float) -> str:
+    return f'db;dur={queries.duration_ms:.1f};desc="{queries.count} queries", app;dur={total_ms:.1f}'
+
+class QueryTimingMiddleware:
+    """ASGI middleware: collect each request's statements and report them in ``Server-Timing``"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = RequestQueries()
+        token = _current.set(queries)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - started) * 1000
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing(queries, total_ms).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            for shape, caller, times in queries.repeated(settings.REPEATED_QUERY_WARN):
+                logger.warning(
+                    "%s %s: %s ran the same statement %d times (possible N+1): %s",
+                    scope.get("method"), scope.get("path"), caller, times, shape
+                )
+            logger.debug(
+                "%s %s: %d queries, %.1fms in database",
+                scope.get("method"), scope.get("path"), queries.count, queries.duration_ms
+            )
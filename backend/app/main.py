@@ -11,23 +11,42 @@ This is the main application file that brings together all the modular component
 The modular structure improves maintainability, testability, and scalability.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import core configuration
-from .core import settings
+from .core import (
+    settings, close_pool, close_async_pool, close_game_updates, shutdown_password_pool,
+    QueryTimingMiddleware
+)
+from .algorithms import shutdown_search_pool
 
 # Import route modules
 from .routes import user_router, game_router, health_router
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release pooled database connections and worker pools when the worker shuts down"""
+    yield
+    await close_game_updates()
+    shutdown_search_pool()
+    shutdown_password_pool()
+    await close_async_pool()
+    close_pool()
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application"""
     
+    settings.require_signing_keys()
+    
     # Initialize FastAPI app with configuration
     app = FastAPI(
         title=settings.API_TITLE,
         version=settings.API_VERSION,
-        description="A modern API for organizing pickup football games with smart team balancing"
+        description="A modern API for organizing pickup football games with smart team balancing",
+        lifespan=lifespan
     )
     
     # Add CORS middleware to allow React frontend
@@ -37,8 +56,12 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "Server-Timing"],
     )
     
+    # Per-request query count and database time in the Server-Timing header
+    app.add_middleware(QueryTimingMiddleware)
+    
     # Include route modules
     app.include_router(health_router)  # Health and utility endpoints
     app.include_router(user_router)    # User management endpoints
@@ -1,14 +1,18 @@
 """
 Models module initialization
 """
-from .user_models import UserSignup, UserLogin, UserResponse
+from .user_models import UserSignup, UserProfileUpdate, UserLogin, UserResponse, LoginResponse
 from .game_models import (
-    CreateGameRequest, JoinGameRequest, GameResponse, 
-    ParticipantResponse, GameParticipantsResponse
+    CreateGameRequest, JoinGameRequest, GameResponse, RecommendedGameResponse,
+    ParticipantResponse, GameParticipantsResponse,
+    GameResultRequest, GameResultResponse, PlayerRatingChange
 )
+from .team_models import TeamPlayerResponse, TeamsResponse
 
 __all__ = [
-    "UserSignup", "UserLogin", "UserResponse",
-    "CreateGameRequest", "JoinGameRequest", "GameResponse",
-    "ParticipantResponse", "GameParticipantsResponse"
+    "UserSignup", "UserProfileUpdate", "UserLogin", "UserResponse", "LoginResponse",
+    "CreateGameRequest", "JoinGameRequest", "GameResponse", "RecommendedGameResponse",
+    "ParticipantResponse", "GameParticipantsResponse",
+    "GameResultRequest", "GameResultResponse", "PlayerRatingChange",
+    "TeamPlayerResponse", "TeamsResponse"
 ]
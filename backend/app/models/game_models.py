@@ -2,7 +2,7 @@
 Game-related Pydantic models for request/response validation
 """
 from pydantic import BaseModel, validator
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 class CreateGameRequest(BaseModel):
     """Model for game creation request"""
@@ -14,6 +14,8 @@ class CreateGameRequest(BaseModel):
     max_players: int = 22
     skill_level_min: int = 1
     skill_level_max: int = 10
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     
     @validator('title')
     def validate_title(cls, v):
@@ -49,6 +51,20 @@ class CreateGameRequest(BaseModel):
             raise ValueError('Skill level must be between 1 and 10')
         return v
 
+    @validator('latitude')
+    def validate_latitude(cls, v):
+        if v is not None and not -90 <= v <= 90:
+            raise ValueError('Latitude must be between -90 and 90')
+        return v
+
+    @validator('longitude', always=True)
+    def validate_longitude(cls, v, values):
+        if v is not None and not -180 <= v <= 180:
+            raise ValueError('Longitude must be between -180 and 180')
+        if (v is None) != (values.get('latitude') is None):
+            raise ValueError('Latitude and longitude must be given together')
+        return v
+
 class JoinGameRequest(BaseModel):
     """Model for joining a game request"""
     position_preference: Optional[str] = None
@@ -80,6 +96,19 @@ class GameResponse(BaseModel):
     waitlisted_players: int = 0
     user_status: Optional[str] = None  # confirmed, waitlisted, declined, or None if not joined
     user_waitlist_position: Optional[int] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    distance_km: Optional[float] = None  # only set for near= searches
+    search_rank: Optional[float] = None  # only set for q= searches
+    highlights: Optional[Dict[str, str]] = None  # title/location/description with <mark> tags, q= only
+
+class RecommendedGameResponse(GameResponse):
+    """Model for a recommended game with its match breakdown"""
+    recommendation_score: float  # 0-100
+    day_match: bool
+    time_match: bool
+    skill_match: bool  # user's skill level is inside the game's range (not just the window)
+    spots_left: int
 
 class ParticipantResponse(BaseModel):
     """Model for game participant response"""
@@ -89,9 +118,40 @@ class ParticipantResponse(BaseModel):
     first_name: str
     last_name: str
     skill_level: int
+    preferred_position: Optional[str] = None
+    playing_style: Optional[str] = None
+    age_range: Optional[str] = None
     status: str  # confirmed, waitlisted, declined
     position_preference: Optional[str]
     joined_at: str
+    waitlist_position: Optional[int] = None  # 1-based queue rank, only for waitlisted players
+    rating: Optional[float] = None  # Elo rating once the player has rated games
+
+class GameResultRequest(BaseModel):
+    """Model for recording a completed game's final score"""
+    team_a_score: int
+    team_b_score: int
+
+    @validator('team_a_score', 'team_b_score')
+    def validate_score(cls, v):
+        if v < 0 or v > 99:
+            raise ValueError('Score must be between 0 and 99')
+        return v
+
+class PlayerRatingChange(BaseModel):
+    """Model for one player's rating change after a result"""
+    user_id: int
+    team: str
+    rating_before: float
+    rating_after: float
+    games_rated: int
+
+class GameResultResponse(BaseModel):
+    """Model for a recorded game result"""
+    game_id: int
+    team_a_score: int
+    team_b_score: int
+    rating_changes: List[PlayerRatingChange]
 
 class GameParticipantsResponse(BaseModel):
     """Model for game participants list response"""
@@ -0,0 +1,30 @@
+"""
+Team-related Pydantic models for request/response validation
+"""
+from pydantic import BaseModel
+from typing import Optional, List, Dict
+
+class TeamPlayerResponse(BaseModel):
+    """Model for a player within a generated team"""
+    user_id: int
+    username: str
+    first_name: str
+    last_name: str
+    skill_level: int
+    preferred_position: Optional[str]
+    playing_style: Optional[str]
+    age_range: Optional[str]
+    assigned_position: str
+
+class TeamsResponse(BaseModel):
+    """Model for generated teams response"""
+    game_id: int
+    team_a: List[TeamPlayerResponse]
+    team_b: List[TeamPlayerResponse]
+    balance_score: float
+    balance_details: Dict[str, float]
+    algorithm_version: str
+    swaps_evaluated: int = 0
+    seed: Optional[int] = None
+    restarts_completed: int = 0
+    version: Optional[int] = None  # stored team sheet version; bumps on every regeneration/rebalance
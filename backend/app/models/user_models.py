@@ -15,6 +15,8 @@ class UserSignup(BaseModel):
     skill_level: int = 5
     preferred_position: Optional[str] = None
     playing_style: Optional[str] = None
+    latitude: Optional[float] = None  # home location, for travel distance
+    longitude: Optional[float] = None
 
     @validator('username')
     def validate_username(cls, v):
@@ -54,6 +56,69 @@ class UserSignup(BaseModel):
             raise ValueError('Invalid playing style')
         return v
 
+    @validator('latitude')
+    def validate_latitude(cls, v):
+        if v is not None and not -90 <= v <= 90:
+            raise ValueError('Latitude must be between -90 and 90')
+        return v
+
+    @validator('longitude', always=True)
+    def validate_longitude(cls, v, values):
+        if v is not None and not -180 <= v <= 180:
+            raise ValueError('Longitude must be between -180 and 180')
+        if (v is None) != (values.get('latitude') is None):
+            raise ValueError('Latitude and longitude must be given together')
+        return v
+
+class UserProfileUpdate(BaseModel):
+    """Model for a profile update; only the fields sent are changed"""
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    age_range: Optional[str] = None
+    bio: Optional[str] = None
+    preferred_position: Optional[str] = None
+    playing_style: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+    @validator('first_name', 'last_name')
+    def validate_name(cls, v):
+        if v is None or not v.strip():
+            raise ValueError('Name cannot be empty')
+        return v.strip()
+
+    @validator('age_range')
+    def validate_age_range(cls, v):
+        if v and v not in ['18-25', '26-35', '36-45', '46+']:
+            raise ValueError('Invalid age range')
+        return v
+
+    @validator('preferred_position')
+    def validate_preferred_position(cls, v):
+        if v and v not in ['Goalkeeper', 'Defender', 'Midfielder', 'Forward', 'Any']:
+            raise ValueError('Invalid preferred position')
+        return v
+
+    @validator('playing_style')
+    def validate_playing_style(cls, v):
+        if v and v not in ['Aggressive', 'Technical', 'Physical', 'Balanced', 'Creative', 'Defensive']:
+            raise ValueError('Invalid playing style')
+        return v
+
+    @validator('latitude')
+    def validate_latitude(cls, v):
+        if v is not None and not -90 <= v <= 90:
+            raise ValueError('Latitude must be between -90 and 90')
+        return v
+
+    @validator('longitude', always=True)
+    def validate_longitude(cls, v, values):
+        if v is not None and not -180 <= v <= 180:
+            raise ValueError('Longitude must be between -180 and 180')
+        if (v is None) != (values.get('latitude') is None):
+            raise ValueError('Latitude and longitude must be given together')
+        return v
+
 class UserLogin(BaseModel):
     """Model for user login request"""
     username: str
@@ -85,3 +150,9 @@ class UserResponse(BaseModel):
     is_active: bool
     is_verified: bool
     created_at: str
+
+class LoginResponse(UserResponse):
+    """Model for a successful login: the user plus their session token"""
+    access_token: str
+    token_type: str = "bearer"
+    expires_in: int  # seconds
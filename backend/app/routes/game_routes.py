@@ -1,44 +1,126 @@
 """
 Game-related API endpoints
 """
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
 
 from ..models import (
     CreateGameRequest, JoinGameRequest, GameResponse, 
-    GameParticipantsResponse
+    GameParticipantsResponse, TeamsResponse, GameResultRequest, GameResultResponse
 )
-from ..services import GameService
+from ..services import GameService, TeamService, RatingService
+from ..core import settings, get_game_updates, sse_events
+from ..utils.geo import parse_near
+from ..utils.pagination import NEXT_CURSOR_HEADER, clamp_page_size, next_cursor
+from ..utils.security import SessionUser, get_active_user, get_current_user, get_optional_user
 
 router = APIRouter(prefix="/api/games", tags=["games"])
 
 @router.post("", response_model=GameResponse)
-async def create_game(game_data: CreateGameRequest, created_by: int):
-    """Create a new game"""
-    return GameService.create_game(game_data, created_by)
+async def create_game(game_data: CreateGameRequest, session: SessionUser = Depends(get_active_user)):
+    """Create a new game (created by the session user)"""
+    game = await GameService.create_game(game_data, session.user_id, creator_verified=True)
+    GameService.invalidate_listings()
+    return game
 
 @router.get("", response_model=List[GameResponse])
 async def get_games(
+    response: Response,
     status: Optional[str] = Query("open", description="Filter by game status"),
     skill_min: Optional[int] = Query(None, description="Minimum skill level compatibility"),
     skill_max: Optional[int] = Query(None, description="Maximum skill level compatibility"),
-    limit: Optional[int] = Query(20, description="Maximum number of results"),
-    user_id: Optional[int] = Query(None, description="User ID to check participation status")
+    limit: Optional[int] = Query(20, ge=1, le=100, description="Page size"),
+    user_id: Optional[int] = Query(None, description="User ID to check participation status (the session user's, when signed in)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    near: Optional[str] = Query(None, description="Only games near 'lat,lon'"),
+    radius_km: Optional[float] = Query(
+        None, gt=0, le=settings.MAX_SEARCH_RADIUS_KM,
+        description="Search radius for near (defaults to the user's max travel distance)"
+    ),
+    q: Optional[str] = Query(None, max_length=100, description="Search titles, locations and descriptions"),
+    session: Optional[SessionUser] = Depends(get_optional_user)
 ):
-    """Get list of available games"""
-    return GameService.get_games(status, skill_min, skill_max, limit, user_id)
+    """Get a page of available games; the next page's cursor is sent in X-Next-Cursor"""
+    if radius_km is not None and near is None:
+        raise HTTPException(status_code=400, detail="radius_km requires near")
+    point = parse_near(near) if near else None
+    if session:
+        user_id = session.user_id
+    games = await GameService.get_games(status, skill_min, skill_max, limit, user_id, cursor, point, radius_km, q)
+    token = next_cursor(games, clamp_page_size(limit))
+    if token:
+        response.headers[NEXT_CURSOR_HEADER] = token
+    return games
+
+@router.get("/stream")
+async def stream_game_updates(
+    request: Request,
+    game_ids: Optional[str] = Query(None, description="Comma-separated game IDs to follow (default: all games)")
+):
+    """Server-sent events with each followed game's counters and status as they change"""
+    ids = None
+    if game_ids:
+        try:
+            ids = {int(part) for part in game_ids.split(",") if part.strip()}
+        except ValueError:
+            raise HTTPException(status_code=400, detail="game_ids must be comma-separated integers")
+        if len(ids) > settings.MAX_PAGE_SIZE:
+            raise HTTPException(status_code=400, detail=f"Follow at most {settings.MAX_PAGE_SIZE} games per stream")
+    subscription = await get_game_updates().open_subscription(ids)
+    return StreamingResponse(
+        sse_events(subscription, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @router.post("/{game_id}/join")
-async def join_game(game_id: int, request: JoinGameRequest, user_id: int):
+async def join_game(game_id: int, request: JoinGameRequest, session: SessionUser = Depends(get_active_user)):
     """Join a game (confirmed or waitlisted based on availability)"""
-    return GameService.join_game(game_id, request, user_id)
+    result = await GameService.join_game(game_id, request, session.user_id, session.skill_level)
+    GameService.invalidate_listings(game_id)
+    if result["status"] == "confirmed":
+        # A late confirmed join slots into already generated teams
+        result["teams_rebalanced"] = await TeamService.rebalance_teams_quietly(game_id)
+    return result
 
 @router.delete("/{game_id}/leave")
-async def leave_game(game_id: int, user_id: int):
+async def leave_game(game_id: int, session: SessionUser = Depends(get_current_user)):
     """Leave a game"""
-    return GameService.leave_game(game_id, user_id)
+    result = await GameService.leave_game(game_id, session.user_id)
+    GameService.invalidate_listings(game_id)
+    if result["previous_status"] == "confirmed":
+        # The departure (and any waitlist promotion) is applied to generated teams incrementally
+        result["teams_rebalanced"] = await TeamService.rebalance_teams_quietly(game_id)
+    return result
 
 @router.get("/{game_id}/participants", response_model=GameParticipantsResponse)
 async def get_game_participants(game_id: int):
     """Get all participants for a game"""
-    return GameService.get_game_participants(game_id)
+    return await GameService.get_game_participants(game_id)
+
+@router.get("/{game_id}/teams", response_model=TeamsResponse)
+async def get_teams(game_id: int):
+    """Get the stored teams for a game (served from cache until the confirmed roster changes)"""
+    return await TeamService.get_teams(game_id)
+
+@router.post("/{game_id}/generate-teams", response_model=TeamsResponse)
+async def generate_teams(
+    game_id: int,
+    seed: Optional[int] = None,
+    restarts: Optional[int] = Query(None, description="restarts_completed of the run being reproduced (with seed)"),
+    session: SessionUser = Depends(get_active_user)
+):
+    """Generate balanced teams from the confirmed roster (game creator only).
+
+    Pass the ``seed`` and ``restarts_completed`` (as ``restarts``) from a previous
+    response to reproduce its teams; replays ignore the search time budget.
+    """
+    return await TeamService.generate_teams(game_id, session.user_id, seed, restarts)
+
+@router.post("/{game_id}/result", response_model=GameResultResponse)
+async def record_result(game_id: int, result: GameResultRequest, session: SessionUser = Depends(get_active_user)):
+    """Record the final score, complete the game and update its players' ratings (game creator only)"""
+    recorded = await RatingService.record_result(game_id, session.user_id, result)
+    GameService.invalidate_listings(game_id)  # now completed
+    return recorded
@@ -1,8 +1,10 @@
 """
 Health check and utility endpoints
 """
-from fastapi import APIRouter
-from ..core import get_db_connection
+from fastapi import APIRouter, Query, Response
+from typing import Optional
+from ..core import AsyncDatabaseManager, async_pool_stats, get_game_updates, password_pool_stats
+from ..utils.pagination import NEXT_CURSOR_HEADER, clamp_page_size, next_cursor
 
 router = APIRouter(tags=["health"])
 
@@ -14,26 +16,41 @@ async def root():
 @router.get("/api/health/db")
 async def check_database():
     """Check database connection health"""
+    from ..services import GameService, UserService
+    from ..utils.rate_limit import get_login_limiter
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM users")
-        result = cursor.fetchone()
-        user_count = result['count']
-        cursor.close()
-        conn.close()
+        async with AsyncDatabaseManager() as (cursor, conn):
+            await cursor.execute("SELECT COUNT(*) FROM users")
+            result = cursor.fetchone()
+            user_count = result['count']
         
         return {
             "status": "healthy",
             "database": "connected",
-            "total_users": user_count
+            "total_users": user_count,
+            "pool": async_pool_stats(),
+            "live_updates": get_game_updates().stats(),
+            "listing_cache": GameService.listing_cache_stats(),
+            "user_cache": UserService.user_cache_stats(),
+            "password_pool": password_pool_stats(),
+            "login_limiter": get_login_limiter().stats()
         }
     except Exception as e:
         from fastapi import HTTPException
         raise HTTPException(status_code=500, detail=f"Database health check failed: {str(e)}")
 
 @router.get("/api/users/{user_id}/games")
-async def get_user_games(user_id: int, status: str = None):
-    """Get games for a specific user"""
+async def get_user_games(
+    user_id: int,
+    response: Response,
+    status: str = None,
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header")
+):
+    """Get a page of games for a specific user; the next page's cursor is sent in X-Next-Cursor"""
     from ..services import GameService
-    return GameService.get_user_games(user_id, status)
+    user_games = await GameService.get_user_games(user_id, status, limit, cursor)
+    token = next_cursor([item["game"] for item in user_games], clamp_page_size(limit))
+    if token:
+        response.headers[NEXT_CURSOR_HEADER] = token
+    return user_games
@@ -1,25 +1,68 @@
 """
 User-related API endpoints
 """
-from fastapi import APIRouter
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import List, Optional
 
-from ..models import UserSignup, UserLogin, UserResponse
-from ..services import UserService
+from ..core import settings
+from ..models import (
+    UserSignup, UserProfileUpdate, UserLogin, UserResponse, LoginResponse, RecommendedGameResponse
+)
+from ..services import UserService, RecommendationService
+from ..utils.security import SessionUser, create_access_token, get_current_user, revoke_token
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
 @router.post("/signup", response_model=UserResponse)
 async def signup_user(user_data: UserSignup):
     """Create a new user account"""
-    return UserService.create_user(user_data)
+    return await UserService.create_user(user_data)
 
-@router.post("/login", response_model=UserResponse)
-async def login_user(login_data: UserLogin):
-    """Authenticate user login"""
-    return UserService.authenticate_user(login_data)
+@router.post("/login", response_model=LoginResponse)
+async def login_user(login_data: UserLogin, request: Request):
+    """Authenticate user login and issue a session token (send it as ``Authorization: Bearer``)"""
+    client_ip = request.client.host if request.client else None
+    user = await UserService.authenticate_user(login_data, client_ip)
+    token, expires_in = create_access_token(user.id, user.skill_level, user.is_active)
+    return LoginResponse(**user.model_dump(), access_token=token, expires_in=expires_in)
+
+@router.post("/logout")
+async def logout_user(session: SessionUser = Depends(get_current_user)):
+    """Revoke the current session token"""
+    revoke_token(session)
+    return {"message": "Logged out"}
+
+@router.patch("/me", response_model=UserResponse)
+async def update_my_profile(update: UserProfileUpdate, session: SessionUser = Depends(get_current_user)):
+    """Update the signed-in user's profile (only the fields sent)"""
+    return await UserService.update_profile(session.user_id, update)
+
+@router.delete("/me")
+async def deactivate_my_account(session: SessionUser = Depends(get_current_user)):
+    """Deactivate the signed-in user's account and end all of its sessions"""
+    await UserService.deactivate_user(session.user_id)
+    return {"message": "Account deactivated"}
+
+@router.get("", response_model=List[UserResponse])
+async def get_users(ids: str = Query(..., description="Comma-separated user IDs")):
+    """Get several active users at once, in the order requested (unknown IDs are skipped)"""
+    try:
+        user_ids = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+    if len(user_ids) > settings.MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"Request at most {settings.MAX_PAGE_SIZE} users at once")
+    return await UserService.get_users_by_ids(user_ids)
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(user_id: int):
     """Get user by ID"""
-    return UserService.get_user_by_id(user_id)
+    return await UserService.get_user_by_id(user_id)
+
+@router.get("/{user_id}/recommended-games", response_model=List[RecommendedGameResponse])
+async def get_recommended_games(
+    user_id: int,
+    limit: int = Query(20, ge=1, le=100, description="Number of games to return")
+):
+    """Upcoming open games ranked by the user's day/time preferences, skill window and open spots"""
+    return await RecommendationService.get_recommended_games(user_id, limit)
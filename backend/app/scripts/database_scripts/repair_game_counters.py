@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Script to verify (and optionally repair) the denormalized participant counters on games
+
+    python repair_game_counters.py            # report drift only
+    python repair_game_counters.py --repair   # rewrite drifted counters
+"""
+import argparse
+import psycopg2
+from psycopg2.extras import RealDictCursor
+import sys
+
+# Database connection configuration
+DB_CONFIG = {
+    "host": "127.0.0.1",
+    "database": "pickup_football",
+    "user": "postgres",
+    "password": "kingdoms",
+    "port": 5432
+}
+
+DRIFT_QUERY = """
+    SELECT g.id, g.title,
+           g.confirmed_players AS stored_confirmed,
+           g.waitlisted_players AS stored_waitlisted,
+           COALESCE(c.confirmed, 0) AS actual_confirmed,
+           COALESCE(c.waitlisted, 0) AS actual_waitlisted
+    FROM games g
+    LEFT JOIN (
+        SELECT game_id,
+               COUNT(*) FILTER (WHERE status = 'confirmed') AS confirmed,
+               COUNT(*) FILTER (WHERE status = 'waitlisted') AS waitlisted
+        FROM game_participants
+        GROUP BY game_id
+    ) c ON c.game_id = g.id
+    WHERE g.confirmed_players <> COALESCE(c.confirmed, 0)
+       OR g.waitlisted_players <> COALESCE(c.waitlisted, 0)
+    ORDER BY g.id
+"""
+
+def repair_game(cursor, game_id: int) -> None:
+    """Recount one game's participants while holding its row lock.
+
+    The counter trigger updates the games row on every participant change,
+    so once the lock is held no concurrent join/leave can slip between the
+    recount and the write.
+    """
+    cursor.execute("SELECT id FROM games WHERE id = %s FOR UPDATE", (game_id,))
+    cursor.execute("""
+        UPDATE games
+        SET confirmed_players = (
+                SELECT COUNT(*) FROM game_participants WHERE game_id = %s AND status = 'confirmed'
+            ),
+            waitlisted_players = (
+                SELECT COUNT(*) FROM game_participants WHERE game_id = %s AND status = 'waitlisted'
+            )
+        WHERE id = %s
+    """, (game_id, game_id, game_id))
+
+def check_game_counters(repair: bool = False) -> bool:
+    """Report games whose stored counters differ from game_participants"""
+    conn = None
+    try:
+        print("🔗 Connecting to PostgreSQL database...")
+        conn = psycopg2.connect(**DB_CONFIG, cursor_factory=RealDictCursor)
+        cursor = conn.cursor()
+
+        cursor.execute(DRIFT_QUERY)
+        drifted = cursor.fetchall()
+        conn.commit()
+
+        if not drifted:
+            print("✅ All game counters match game_participants")
+            return True
+
+        print(f"⚠️  {len(drifted)} game(s) with counter drift:")
+        for game in drifted:
+            print(
+                f"  🎯 #{game['id']} {game['title']}: "
+                f"confirmed {game['stored_confirmed']} -> {game['actual_confirmed']}, "
+                f"waitlisted {game['stored_waitlisted']} -> {game['actual_waitlisted']}"
+            )
+
+        if not repair:
+            print("\nℹ️  Run with --repair to fix these counters")
+            return False
+
+        print("\n🔧 Repairing counters...")
+        for game in drifted:
+            repair_game(cursor, game['id'])
+            conn.commit()
+
+        cursor.execute(DRIFT_QUERY)
+        remaining = cursor.fetchall()
+        conn.commit()
+
+        if remaining:
+            print(f"❌ {len(remaining)} game(s) still drifted (concurrent changes?) - run again")
+            return False
+
+        print(f"✅ Repaired {len(drifted)} game(s)")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error checking game counters: {str(e)}")
+        if conn:
+            conn.rollback()
+        return False
+    finally:
+        if conn:
+            cursor.close()
+            conn.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify games.confirmed_players / waitlisted_players")
+    parser.add_argument("--repair", action="store_true", help="rewrite drifted counters")
+    args = parser.parse_args()
+
+    print("🔢 Checking Game Participant Counters")
+    print("=" * 40)
+
+    if not check_game_counters(repair=args.repair):
+        sys.exit(1)
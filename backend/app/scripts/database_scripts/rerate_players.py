@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Script to recompute every player rating by replaying all recorded results
+
+Use after changing the rating parameters in app/algorithms/rating.py. Games
+are replayed in kickoff order in one vectorized pass (see replay_ratings).
+
+    python rerate_players.py           # dry run: show the biggest changes
+    python rerate_players.py --apply   # rewrite player_ratings
+"""
+import argparse
+import os
+import sys
+import time
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from app.algorithms import RatedGame, initial_rating, replay_ratings
+
+# Database connection configuration
+DB_CONFIG = {
+    "host": "127.0.0.1",
+    "database": "pickup_football",
+    "user": "postgres",
+    "password": "kingdoms",
+    "port": 5432
+}
+
+HISTORY_QUERY = """
+    SELECT gr.game_id, gr.team_a_score, gr.team_b_score,
+           array_agg(ta.user_id) FILTER (WHERE ta.team = 'A') AS team_a,
+           array_agg(ta.user_id) FILTER (WHERE ta.team = 'B') AS team_b
+    FROM game_results gr
+    JOIN games g ON g.id = gr.game_id
+    JOIN team_assignments ta ON ta.game_id = gr.game_id
+    -- Same player set as RatingService.record_result: confirmed participants only
+    JOIN game_participants gp
+        ON gp.game_id = ta.game_id AND gp.user_id = ta.user_id AND gp.status = 'confirmed'
+    GROUP BY gr.game_id, gr.team_a_score, gr.team_b_score, g.date_time
+    HAVING bool_or(ta.team = 'A') AND bool_or(ta.team = 'B')
+    ORDER BY g.date_time, gr.game_id
+"""
+
+def rerate_players(apply: bool = False, show: int = 10) -> bool:
+    """Replay all results from the skill-level starting ratings"""
+    conn = None
+    try:
+        print("🔗 Connecting to PostgreSQL database...")
+        conn = psycopg2.connect(**DB_CONFIG, cursor_factory=RealDictCursor)
+        cursor = conn.cursor()
+
+        if apply:
+            # Hold off live result recording until the replay is written
+            cursor.execute("LOCK TABLE player_ratings IN EXCLUSIVE MODE")
+
+        cursor.execute("SELECT id, skill_level FROM users ORDER BY id")
+        users = cursor.fetchall()
+        index = {u['id']: i for i, u in enumerate(users)}
+
+        cursor.execute(HISTORY_QUERY)
+        history = [
+            row for row in cursor.fetchall()
+            if row['team_a'] and row['team_b']
+        ]
+        games = [
+            RatedGame(
+                team_a=[index[u] for u in row['team_a']],
+                team_b=[index[u] for u in row['team_b']],
+                score_a=row['team_a_score'],
+                score_b=row['team_b_score']
+            )
+            for row in history
+        ]
+
+        cursor.execute("SELECT user_id, rating FROM player_ratings")
+        stored = {row['user_id']: row['rating'] for row in cursor.fetchall()}
+
+        started = time.perf_counter()
+        ratings, games_rated = replay_ratings([initial_rating(u['skill_level']) for u in users], games)
+        elapsed = time.perf_counter() - started
+        print(f"⚡ Replayed {len(games)} game(s) for {len(users)} player(s) in {elapsed * 1000:.1f}ms")
+
+        last_game = {}
+        for row in history:
+            for user_id in row['team_a'] + row['team_b']:
+                last_game[user_id] = row['game_id']
+
+        rated = [
+            (u['id'], float(ratings[i]), int(games_rated[i]), last_game.get(u['id']))
+            for i, u in enumerate(users) if games_rated[i] > 0
+        ]
+        changes = sorted(
+            ((user_id, stored.get(user_id), rating) for user_id, rating, _, _ in rated),
+            key=lambda c: -abs(c[2] - (c[1] if c[1] is not None else c[2]))
+        )
+        for user_id, before, after in changes[:show]:
+            before_text = f"{before:.1f}" if before is not None else "unrated"
+            print(f"  👤 #{user_id}: {before_text} -> {after:.1f}")
+
+        if not apply:
+            conn.rollback()
+            print("\nℹ️  Run with --apply to rewrite player_ratings")
+            return True
+
+        cursor.execute("DELETE FROM player_ratings")
+        cursor.execute("""
+            INSERT INTO player_ratings (user_id, rating, games_rated, last_game_id)
+            SELECT * FROM unnest(%s::int[], %s::float8[], %s::int[], %s::int[])
+        """, (
+            [r[0] for r in rated], [r[1] for r in rated], [r[2] for r in rated], [r[3] for r in rated]
+        ))
+        conn.commit()
+        print(f"✅ Rewrote {len(rated)} player rating(s)")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error re-rating players: {str(e)}")
+        if conn:
+            conn.rollback()
+        return False
+    finally:
+        if conn:
+            cursor.close()
+            conn.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute player ratings from all recorded results")
+    parser.add_argument("--apply", action="store_true", help="rewrite player_ratings")
+    parser.add_argument("--show", type=int, default=10, help="number of biggest changes to print")
+    args = parser.parse_args()
+
+    print("📈 Re-rating Players")
+    print("=" * 40)
+
+    if not rerate_players(apply=args.apply, show=args.show):
+        sys.exit(1)
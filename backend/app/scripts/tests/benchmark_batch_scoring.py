@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorized batch balance scoring vs the pure-Python reference
+
+    python -m app.scripts.tests.benchmark_batch_scoring [--players 30] [--candidates 20000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from app.algorithms import (
+    AGE_RANGES, PLAYING_STYLES, POSITIONS, BalanceCalculator, BatchBalanceScorer,
+    Player, split_teams
+)
+
+def random_roster(size: int, rng: random.Random):
+    return [
+        Player(
+            i, f"player{i}", "Bench", f"Player{i}", rng.randint(1, 10),
+            rng.choice(POSITIONS + ['Any']), rng.choice(PLAYING_STYLES), rng.choice(AGE_RANGES)
+        )
+        for i in range(1, size + 1)
+    ]
+
+def random_assignments(players: int, count: int, rng: np.random.Generator) -> np.ndarray:
+    """Random even splits: each row puts half the roster on Team B"""
+    base = np.array([i % 2 for i in range(players)], dtype=np.int8)
+    return np.array([rng.permutation(base) for _ in range(count)])
+
+def benchmark(players: int, candidates: int, batch_size: int, seed: int):
+    roster = random_roster(players, random.Random(seed))
+    assignments = random_assignments(players, candidates, np.random.default_rng(seed))
+
+    # Pure-Python reference: loop over player objects per candidate
+    calculator = BalanceCalculator()
+    reference_count = min(candidates, 5000)
+    started = time.perf_counter()
+    reference = [
+        calculator.calculate_total_balance(*split_teams(roster, row))[0]
+        for row in assignments[:reference_count]
+    ]
+    python_rate = reference_count / (time.perf_counter() - started)
+
+    scorer = BatchBalanceScorer(roster)
+    started = time.perf_counter()
+    scores = np.concatenate([
+        scorer.score(assignments[i:i + batch_size]) for i in range(0, candidates, batch_size)
+    ])
+    numpy_rate = candidates / (time.perf_counter() - started)
+
+    max_error = float(np.max(np.abs(scores[:reference_count] - np.array(reference))))
+    return python_rate, numpy_rate, max_error
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Balance scoring throughput benchmark")
+    parser.add_argument("--players", type=int, default=30)
+    parser.add_argument("--candidates", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=4096)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"📏 Scoring {args.candidates:,} candidate splits of {args.players} players")
+    python_rate, numpy_rate, max_error = benchmark(args.players, args.candidates, args.batch_size, args.seed)
+    print(f"🐍 Pure Python reference: {python_rate:>12,.0f} candidates/second")
+    print(f"🚀 NumPy batch scoring:   {numpy_rate:>12,.0f} candidates/second")
+    print(f"📈 Speedup: {numpy_rate / python_rate:.1f}x (max score difference {max_error:.2e})")
+
+    if max_error > 1e-6:
+        print("❌ Batch scores disagree with the reference!")
+        sys.exit(1)
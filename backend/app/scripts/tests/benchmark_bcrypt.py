@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bcrypt verify latency and login throughput per cost factor
+
+Each +1 of BCRYPT_ROUNDS doubles the CPU a login costs. This measures, on the
+machine it runs on, how long one verify takes at each cost and how many
+logins per second PASSWORD_HASH_WORKERS threads sustain, then suggests the
+highest cost whose p95 stays within --target-ms. Run it on the API nodes
+before changing BCRYPT_ROUNDS; logins rehash existing passwords to the new
+cost as users sign in.
+
+    python -m app.scripts.tests.benchmark_bcrypt
+    python -m app.scripts.tests.benchmark_bcrypt --costs 10 11 12 13 --target-ms 250
+    python -m app.scripts.tests.benchmark_bcrypt --json bcrypt.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from app.core import settings
+
+PASSWORD = b"benchmark-password"
+
+def run_cost(cost: int, runs: int, workers: int) -> dict:
+    hashed = bcrypt.hashpw(PASSWORD, bcrypt.gensalt(rounds=cost))
+    latencies = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        bcrypt.checkpw(PASSWORD, hashed)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    # bcrypt releases the GIL, so the pool's threads verify in parallel
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        started = time.perf_counter()
+        list(pool.map(lambda _: bcrypt.checkpw(PASSWORD, hashed), range(runs * workers)))
+        elapsed = time.perf_counter() - started
+
+    latencies = np.array(latencies)
+    return {
+        'cost': cost,
+        'runs': runs,
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p95_ms': float(np.percentile(latencies, 95)),
+        'logins_per_sec': runs * workers / elapsed,
+    }
+
+def recommend(results: list, target_ms: float):
+    """Highest cost whose p95 verify fits the target, or None"""
+    fitting = [r['cost'] for r in results if r['p95_ms'] <= target_ms]
+    return max(fitting) if fitting else None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="bcrypt cost/latency benchmark")
+    parser.add_argument("--costs", type=int, nargs="+", default=[10, 11, 12, 13, 14])
+    parser.add_argument("--runs", type=int, default=10, help="verifies per cost (and per worker)")
+    parser.add_argument("--workers", type=int, default=settings.PASSWORD_HASH_WORKERS)
+    parser.add_argument("--target-ms", type=float, default=250.0, help="acceptable p95 verify latency")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    print(f"🏁 Benchmarking bcrypt ({args.runs} verifies per cost, {args.workers} worker thread(s))")
+    results = [run_cost(cost, args.runs, args.workers) for cost in args.costs]
+
+    print(f"{'cost':>4} {'p50 ms':>8} {'p95 ms':>8} {'logins/s':>9}")
+    for r in results:
+        marker = "  <- current" if r['cost'] == settings.BCRYPT_ROUNDS else ""
+        print(f"{r['cost']:>4} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['logins_per_sec']:>9.1f}{marker}")
+
+    best = recommend(results, args.target_ms)
+    if best is None:
+        print(f"⚠️  No tested cost verifies within {args.target_ms:.0f}ms")
+    else:
+        print(f"✅ BCRYPT_ROUNDS={best} is the highest cost within {args.target_ms:.0f}ms p95")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                'python': platform.python_version(),
+                'bcrypt': bcrypt.__version__,
+                'config': {k: v for k, v in vars(args).items() if k != 'json'},
+                'current_rounds': settings.BCRYPT_ROUNDS,
+                'recommended_rounds': best,
+                'results': results,
+            }, f, indent=2)
+        print(f"💾 Saved to {args.json}")
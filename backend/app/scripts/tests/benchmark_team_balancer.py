@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Benchmark: team generation latency and quality across roster sizes and mixes
+
+Rosters are synthetic but seeded, so every commit is measured on exactly the
+same inputs. Save a run with --json and pass it back with --compare on a later
+commit to catch speed or balance-quality regressions.
+
+    python -m app.scripts.tests.benchmark_team_balancer
+    python -m app.scripts.tests.benchmark_team_balancer --json baseline.json
+    python -m app.scripts.tests.benchmark_team_balancer --compare baseline.json
+    python -m app.scripts.tests.benchmark_team_balancer --restarts 64 --time-budget 1.5
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from app.algorithms import (
+    AGE_RANGES, PLAYING_STYLES, Player, TeamBalancer, get_search_pool, shutdown_search_pool
+)
+
+DEFAULT_SIZES = [4, 6, 8, 10, 14, 18, 22, 26, 30]
+
+# Position/style/age mix of the sample users in add_sample_users.py
+SAMPLE_POSITIONS = ['Forward', 'Goalkeeper', 'Midfielder', 'Defender', 'Any', 'Any']
+SAMPLE_STYLES = ['Aggressive', 'Technical', 'Creative', 'Physical', 'Balanced', 'Balanced']
+SAMPLE_AGES = ['26-35', '18-25', '26-35', '36-45', '18-25', '26-35']
+
+def _sample_skill(rng: random.Random) -> int:
+    return min(10, max(1, round(rng.gauss(6.3, 2.0))))
+
+def _player(i: int, rng: random.Random, position: str, skill: int, style: str = None, age: str = None) -> Player:
+    return Player(
+        i, f"bench{i}", "Bench", f"Player{i}", skill, position,
+        style or rng.choice(SAMPLE_STYLES), age or rng.choice(SAMPLE_AGES)
+    )
+
+def sample_mix(size, rng):
+    return [_player(i, rng, rng.choice(SAMPLE_POSITIONS), _sample_skill(rng)) for i in range(1, size + 1)]
+
+def uniform_skill(size, rng):
+    return [
+        _player(i, rng, rng.choice(SAMPLE_POSITIONS), rng.randint(1, 10),
+                rng.choice(PLAYING_STYLES), rng.choice(AGE_RANGES))
+        for i in range(1, size + 1)
+    ]
+
+def bimodal_skill(size, rng):
+    return [
+        _player(i, rng, rng.choice(SAMPLE_POSITIONS), rng.choice((2, 3)) if i % 2 else rng.choice((8, 9)))
+        for i in range(1, size + 1)
+    ]
+
+def no_goalkeepers(size, rng):
+    outfield = [p for p in SAMPLE_POSITIONS if p not in ('Goalkeeper', 'Any')]
+    return [_player(i, rng, rng.choice(outfield), _sample_skill(rng)) for i in range(1, size + 1)]
+
+def all_forwards(size, rng):
+    return [_player(i, rng, 'Forward', _sample_skill(rng), style='Aggressive') for i in range(1, size + 1)]
+
+def one_star(size, rng):
+    roster = [_player(i, rng, rng.choice(SAMPLE_POSITIONS), rng.randint(2, 5)) for i in range(1, size + 1)]
+    roster[0].skill_level = 10
+    return roster
+
+SCENARIOS = {
+    'sample-mix': sample_mix,
+    'uniform-skill': uniform_skill,
+    'bimodal-skill': bimodal_skill,
+    'no-goalkeepers': no_goalkeepers,
+    'all-forwards': all_forwards,
+    'one-star': one_star,
+}
+
+def run_case(balancer: TeamBalancer, scenario: str, size: int, runs: int, seed: int) -> dict:
+    latencies, evaluated, scores = [], [], []
+    for run in range(runs):
+        rng = random.Random(f"{seed}:{scenario}:{size}:{run}")
+        roster = SCENARIOS[scenario](size, rng)
+        started = time.perf_counter()
+        result = balancer.generate_balanced_teams(roster, seed=seed + run)
+        latencies.append((time.perf_counter() - started) * 1000)
+        evaluated.append(result['swaps_evaluated'])
+        scores.append(result['balance_score'])
+
+    latencies = np.array(latencies)
+    return {
+        'scenario': scenario,
+        'players': size,
+        'runs': runs,
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p95_ms': float(np.percentile(latencies, 95)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+        'max_ms': float(latencies.max()),
+        'candidates_mean': float(np.mean(evaluated)),
+        'score_mean': float(np.mean(scores)),
+        'score_min': float(np.min(scores)),
+    }
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def compare(results: list, baseline_path: str, max_slowdown: float, max_score_drop: float) -> bool:
+    """Print deltas against a saved run; False when any case regressed"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    previous = {(r['scenario'], r['players']): r for r in baseline['results']}
+    print(f"\n📊 Compared with {baseline_path} (commit {baseline.get('commit', '?')})")
+
+    ok = True
+    for r in results:
+        before = previous.get((r['scenario'], r['players']))
+        if not before:
+            continue
+        # Ignore sub-millisecond noise on the smallest rosters
+        slowdown = r['p95_ms'] / max(before['p95_ms'], 1.0)
+        score_drop = before['score_mean'] - r['score_mean']
+        flags = []
+        if slowdown > max_slowdown and r['p95_ms'] - before['p95_ms'] > 1.0:
+            flags.append(f"p95 {slowdown:.2f}x slower")
+        if score_drop > max_score_drop:
+            flags.append(f"score -{score_drop:.2f}")
+        if flags:
+            ok = False
+            print(f"❌ {r['scenario']:<15} {r['players']:>3}p: {', '.join(flags)}")
+    if ok:
+        print("✅ No regressions")
+    return ok
+
+def print_table(results: list) -> None:
+    print(f"{'scenario':<15} {'n':>3} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'cands':>9} {'score':>7} {'min':>7}")
+    for r in results:
+        print(
+            f"{r['scenario']:<15} {r['players']:>3} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+            f"{r['candidates_mean']:>9.0f} {r['score_mean']:>7.2f} {r['score_min']:>7.2f}"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Team balancer latency/quality benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--runs", type=int, default=20, help="rosters per (scenario, size)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--restarts", type=int, default=0, help="multi-start restarts (0 = single start)")
+    parser.add_argument("--time-budget", type=float, default=None, help="seconds, multi-start only")
+    parser.add_argument("--workers", type=int, default=0, help="search processes (0 = one per core)")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run")
+    parser.add_argument("--max-slowdown", type=float, default=1.25)
+    parser.add_argument("--max-score-drop", type=float, default=0.5)
+    args = parser.parse_args()
+
+    executor = get_search_pool(args.workers) if args.restarts else None
+    balancer = TeamBalancer(restarts=args.restarts, time_budget=args.time_budget, executor=executor)
+    if executor:
+        # Spawn the worker processes before anything is timed
+        balancer.generate_balanced_teams(sample_mix(10, random.Random(0)), seed=0)
+
+    print(f"🏁 Benchmarking team generation ({args.runs} rosters per case, restarts={args.restarts})")
+    results = [
+        run_case(balancer, scenario, size, args.runs, args.seed)
+        for scenario in args.scenarios
+        for size in args.sizes
+        if size >= 4
+    ]
+    shutdown_search_pool()
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                'commit': git_commit(),
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'config': {k: v for k, v in vars(args).items() if k not in ('json', 'compare')},
+                'results': results,
+            }, f, indent=2)
+        print(f"💾 Saved to {args.json}")
+
+    if args.compare and not compare(results, args.compare, args.max_slowdown, args.max_score_drop):
+        sys.exit(1)
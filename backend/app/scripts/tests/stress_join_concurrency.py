@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Stress test: hammer one game's join/leave endpoints from many threads and
+verify capacity is never exceeded
+
+Requires the API running on http://localhost:8000 and the database from
+DB_CONFIG. Creates throwaway users and a game, then removes them. Session
+tokens are minted locally, so run it with the API's JWT_SIGNING_KEYS.
+Needs ``requests`` (not an API dependency); exits non-zero if an invariant breaks:
+
+    python -m app.scripts.tests.stress_join_concurrency
+"""
+import os
+import random
+import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg2
+import requests
+from psycopg2.extras import RealDictCursor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from app.utils.security import create_access_token
+
+# Database connection configuration
+DB_CONFIG = {
+    "host": "127.0.0.1",
+    "database": "pickup_football",
+    "user": "postgres",
+    "password": "kingdoms",
+    "port": 5432
+}
+
+API_URL = "http://localhost:8000/api/games"
+MAX_PLAYERS = 6
+JOINERS = 60
+ROUNDS = 3
+
+def create_fixtures(cursor, tag: str):
+    """Create throwaway users and a small game"""
+    user_ids = []
+    for i in range(JOINERS):
+        cursor.execute("""
+            INSERT INTO users (username, password_hash, first_name, last_name, skill_level)
+            VALUES (%s, 'not-a-real-hash', 'Stress', %s, 5)
+            RETURNING id
+        """, (f"stress_{tag}_{i}", f"Tester {i}"))
+        user_ids.append(cursor.fetchone()['id'])
+
+    cursor.execute("""
+        INSERT INTO games (title, location, date_time, max_players, created_by)
+        VALUES (%s, 'Stress Test Field', NOW() + INTERVAL '7 days', %s, %s)
+        RETURNING id
+    """, (f"Join stress {tag}", MAX_PLAYERS, user_ids[0]))
+    return cursor.fetchone()['id'], user_ids
+
+def remove_fixtures(cursor, game_id: int, user_ids):
+    cursor.execute("DELETE FROM games WHERE id = %s", (game_id,))
+    cursor.execute("DELETE FROM users WHERE id = ANY(%s)", (user_ids,))
+
+def check_invariants(cursor, game_id: int, label: str) -> bool:
+    """Capacity, counter and promotion invariants for the stressed game"""
+    cursor.execute("""
+        SELECT g.max_players, g.confirmed_players, g.waitlisted_players,
+               COUNT(*) FILTER (WHERE gp.status = 'confirmed') AS actual_confirmed,
+               COUNT(*) FILTER (WHERE gp.status = 'waitlisted') AS actual_waitlisted
+        FROM games g
+        LEFT JOIN game_participants gp ON gp.game_id = g.id
+        WHERE g.id = %s
+        GROUP BY g.id
+    """, (game_id,))
+    row = cursor.fetchone()
+    total = row['actual_confirmed'] + row['actual_waitlisted']
+
+    print(f"📊 {label}: confirmed {row['actual_confirmed']}/{row['max_players']}, "
+          f"waitlisted {row['actual_waitlisted']} "
+          f"(counters {row['confirmed_players']}/{row['waitlisted_players']})")
+
+    ok = True
+    if row['actual_confirmed'] > row['max_players']:
+        print("❌ Capacity exceeded!")
+        ok = False
+    if row['actual_confirmed'] != min(total, row['max_players']):
+        print("❌ Open confirmed slots while players are waitlisted")
+        ok = False
+    if (row['confirmed_players'], row['waitlisted_players']) != (row['actual_confirmed'], row['actual_waitlisted']):
+        print("❌ Denormalized counters drifted")
+        ok = False
+    return ok
+
+def run_concurrently(calls):
+    """Release all ``(method, url, user_id)`` calls at once through a barrier and collect status codes"""
+    barrier = threading.Barrier(len(calls))
+    tokens = {uid: create_access_token(uid, 5)[0] for _, _, uid in calls}
+
+    def fire(call):
+        method, url, uid = call
+        headers = {"Authorization": f"Bearer {tokens[uid]}"}
+        barrier.wait()
+        return requests.request(
+            method, url, json={} if method == "POST" else None, headers=headers, timeout=30
+        ).status_code
+
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        return list(pool.map(fire, calls))
+
+def check_join_concurrency() -> bool:
+    conn = psycopg2.connect(**DB_CONFIG, cursor_factory=RealDictCursor)
+    conn.autocommit = True
+    cursor = conn.cursor()
+    tag = uuid.uuid4().hex[:8]
+    game_id, user_ids = create_fixtures(cursor, tag)
+    print(f"🧪 Game {game_id} (max {MAX_PLAYERS}) vs {JOINERS} concurrent joiners")
+
+    try:
+        codes = run_concurrently([("POST", f"{API_URL}/{game_id}/join", uid) for uid in user_ids])
+        print(f"   join responses: { {c: codes.count(c) for c in set(codes)} }")
+        ok = check_invariants(cursor, game_id, "after join burst")
+
+        rng = random.Random(tag)
+        for round_no in range(1, ROUNDS + 1):
+            cursor.execute("SELECT user_id FROM game_participants WHERE game_id = %s", (game_id,))
+            joined = [r['user_id'] for r in cursor.fetchall()]
+            leavers = rng.sample(joined, len(joined) // 2)
+            rejoiners = [uid for uid in user_ids if uid not in joined]
+            calls = [("DELETE", f"{API_URL}/{game_id}/leave", uid) for uid in leavers]
+            calls += [("POST", f"{API_URL}/{game_id}/join", uid) for uid in rejoiners]
+            rng.shuffle(calls)
+            run_concurrently(calls)
+            ok = check_invariants(cursor, game_id, f"after mixed round {round_no}") and ok
+
+        print("✅ Capacity invariant held" if ok else "💥 Invariant violated")
+        return ok
+    finally:
+        remove_fixtures(cursor, game_id, user_ids)
+        cursor.close()
+        conn.close()
+
+if __name__ == "__main__":
+    try:
+        success = check_join_concurrency()
+    except requests.exceptions.ConnectionError:
+        print("❌ Cannot connect to backend server!")
+        print("Make sure the FastAPI server is running on http://localhost:8000")
+        success = False
+    sys.exit(0 if success else 1)
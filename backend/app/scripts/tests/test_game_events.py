@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test the live game update fan-out directly (no database needed)
+
+    python -m app.scripts.tests.test_game_events
+"""
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from app.core import game_events
+from app.core.game_events import GameUpdateBroadcaster, GameUpdateSubscription, sse_events
+
+def notify(broadcaster, **delta):
+    broadcaster._on_notify(None, 0, "game_updates", json.dumps(delta))
+
+def test_fan_out_respects_game_filter():
+    async def run():
+        broadcaster = GameUpdateBroadcaster()
+        everything = GameUpdateSubscription()
+        only_two = GameUpdateSubscription({2})
+        broadcaster._subscribers.update({everything, only_two})
+
+        notify(broadcaster, game_id=1, confirmed_players=3, waitlisted_players=0, status="open")
+        notify(broadcaster, game_id=2, confirmed_players=5, waitlisted_players=1, status="full")
+
+        assert [e["game_id"] for e in await everything.next_batch(0.1)] == [1, 2]
+        batch = await only_two.next_batch(0.1)
+        assert [e["game_id"] for e in batch] == [2] and batch[0]["type"] == "game_update"
+        assert await only_two.next_batch(0.01) == []
+    asyncio.run(run())
+
+def test_slow_subscriber_keeps_latest_delta_per_game():
+    async def run():
+        subscription = GameUpdateSubscription()
+        for confirmed in range(1000):
+            subscription.push({"type": "game_update", "game_id": 7, "confirmed_players": confirmed})
+        subscription.push({"type": "game_update", "game_id": 8, "confirmed_players": 1})
+        batch = await subscription.next_batch(0.1)
+        assert [(e["game_id"], e["confirmed_players"]) for e in batch] == [(7, 999), (8, 1)]
+    asyncio.run(run())
+
+def test_sse_stream_formats_events():
+    async def run():
+        subscription = GameUpdateSubscription()
+        subscription.push({"type": "game_update", "game_id": 4, "confirmed_players": 10})
+        disconnects = iter([False, True])
+
+        async def is_disconnected():
+            return next(disconnects)
+
+        chunks = [chunk async for chunk in sse_events(subscription, is_disconnected)]
+        assert chunks[0].startswith("retry:")
+        assert chunks[1] == 'event: game_update\ndata: {"type":"game_update","game_id":4,"confirmed_players":10}\n\n'
+    asyncio.run(run())
+
+def test_stream_registers_only_while_running():
+    class Listening(GameUpdateBroadcaster):
+        async def _ensure_listening(self):
+            pass
+
+    original = game_events._broadcaster
+    game_events._broadcaster = broadcaster = Listening()
+    try:
+        async def run():
+            # The client went away before the response body was ever iterated
+            abandoned = await broadcaster.open_subscription({1})
+            sse_events(abandoned, None)
+            assert broadcaster.stats()["subscribers"] == 0
+
+            async def is_disconnected():
+                return True
+
+            stream = sse_events(await broadcaster.open_subscription(), is_disconnected)
+            await stream.__anext__()
+            assert broadcaster.stats()["subscribers"] == 1
+            await stream.aclose()
+            assert broadcaster.stats()["subscribers"] == 0
+        asyncio.run(run())
+    finally:
+        game_events._broadcaster = original
+
+if __name__ == "__main__":
+    print("🧪 Testing live game updates...")
+    test_fan_out_respects_game_filter()
+    test_slow_subscriber_keeps_latest_delta_per_game()
+    test_sse_stream_formats_events()
+    test_stream_registers_only_while_running()
+    print("✅ Live game update tests passed!")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Check how many SQL statements the game listing issues per request
+
+Run from the backend directory against a database seeded with
+add_sample_users.py / add_sample_games.py / add_test_participants.py:
+
+    python -m app.scripts.tests.test_game_query_counts
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from app.core import AsyncCursor, AsyncDatabaseManager, close_async_pool
+from app.services import GameService
+
+MAX_QUERIES_PER_LISTING = 2  # shared page + the caller's status overlay
+MAX_QUERIES_PER_CACHED_LISTING = 1  # overlay only
+
+class QueryCounter:
+    """Counts AsyncCursor.execute calls while active"""
+
+    def __init__(self):
+        self.statements = []
+        self._original = AsyncCursor.execute
+
+    def __enter__(self):
+        counter = self
+        original = self._original
+
+        async def counting_execute(cursor, query, params=None):
+            counter.statements.append(" ".join(query.split())[:80])
+            return await original(cursor, query, params)
+
+        AsyncCursor.execute = counting_execute
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        AsyncCursor.execute = self._original
+
+async def find_busy_user() -> int:
+    """Pick the user registered for the most games (waitlisted ones first)"""
+    async with AsyncDatabaseManager() as (cursor, conn):
+        await cursor.execute("""
+            SELECT user_id, COUNT(*) AS games,
+                   COUNT(*) FILTER (WHERE status = 'waitlisted') AS waitlisted
+            FROM game_participants
+            GROUP BY user_id
+            ORDER BY waitlisted DESC, games DESC
+            LIMIT 1
+        """)
+        row = cursor.fetchone()
+        return row['user_id'] if row else None
+
+async def check_game_listing_query_count():
+    user_id = await find_busy_user()
+    if user_id is None:
+        print("❌ No participants found - seed the database first")
+        return False
+
+    print(f"🧪 Listing games for user {user_id}...")
+    with QueryCounter() as counter:
+        games = await GameService.get_games(status=None, limit=20, user_id=user_id)
+
+    joined = [g for g in games if g.user_status]
+    print(f"📋 {len(games)} games returned, user is in {len(joined)} of them")
+    for g in joined:
+        print(f"   #{g.id} {g.title}: {g.user_status} (waitlist position: {g.user_waitlist_position})")
+
+    print(f"📊 Queries issued: {len(counter.statements)}")
+    for statement in counter.statements:
+        print(f"   - {statement}...")
+
+    assert len(counter.statements) <= MAX_QUERIES_PER_LISTING, (
+        f"Expected at most {MAX_QUERIES_PER_LISTING} queries, got {len(counter.statements)}"
+    )
+
+    # A repeat within the TTL reuses the shared page
+    with QueryCounter() as cached:
+        again = await GameService.get_games(status=None, limit=20, user_id=user_id)
+    print(f"📊 Queries issued when cached: {len(cached.statements)}")
+    assert [g.id for g in again] == [g.id for g in games]
+    assert len(cached.statements) <= MAX_QUERIES_PER_CACHED_LISTING, (
+        f"Expected at most {MAX_QUERIES_PER_CACHED_LISTING} queries, got {len(cached.statements)}"
+    )
+    print("✅ Game listing query count OK")
+    return True
+
+async def main():
+    try:
+        await check_game_listing_query_count()
+    finally:
+        await close_async_pool()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test the geohash radius search helpers directly (no database needed)
+
+    python -m app.scripts.tests.test_geo
+"""
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from pydantic import ValidationError
+
+from app.models import CreateGameRequest, UserSignup
+from app.utils.geo import covering_prefixes, encode_geohash, haversine_km, prefix_range
+
+def test_encode_known_geohash():
+    # Reference value from the original geohash.org description
+    assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert encode_geohash(57.64911, 10.40744, 5) == "u4pru"
+
+def test_haversine_known_distance():
+    # London -> Paris is about 344 km
+    assert abs(haversine_km(51.5074, -0.1278, 48.8566, 2.3522) - 343.5) < 2
+
+def covered(geohash, prefixes):
+    return any(low <= geohash < high for low, high in map(prefix_range, prefixes))
+
+def test_prefixes_cover_every_point_in_radius():
+    rng = random.Random(5)
+    centres = [(51.5, -0.12), (40.71, -74.0), (-33.87, 151.2), (0.01, 0.01), (64.1, -21.9), (1.3, 179.99)]
+    for lat, lon in centres:
+        for radius in (0.5, 2, 10, 25, 100):
+            prefixes = covering_prefixes(lat, lon, radius)
+            assert prefixes and len(prefixes) <= 9
+            for _ in range(300):
+                # Uniform bearing, distance up to the radius
+                bearing = rng.uniform(0, 2 * math.pi)
+                dist = radius * math.sqrt(rng.random())
+                p_lat = lat + dist / 111.32 * math.cos(bearing)
+                p_lon = lon + dist / (111.32 * math.cos(math.radians(p_lat))) * math.sin(bearing)
+                p_lon = (p_lon + 180) % 360 - 180
+                if haversine_km(lat, lon, p_lat, p_lon) <= radius:
+                    assert covered(encode_geohash(p_lat, p_lon), prefixes), (lat, lon, radius, p_lat, p_lon)
+
+def test_half_specified_coordinates_are_rejected():
+    game = dict(title="Sunday kickabout", location="Central Park", date_time="2030-01-01T18:00:00Z")
+    user = dict(username="geo_user", password="password123", first_name="Pat", last_name="Lee")
+    for model, base in ((CreateGameRequest, game), (UserSignup, user)):
+        for coords in ({"latitude": 40.7}, {"longitude": -73.9}):
+            try:
+                model(**base, **coords)
+                raise AssertionError(f"{model.__name__} accepted {coords}")
+            except ValidationError as e:
+                assert "together" in str(e)
+        assert model(**base, latitude=40.7, longitude=-73.9).longitude == -73.9
+        assert model(**base).latitude is None
+
+if __name__ == "__main__":
+    print("🧪 Testing geohash radius search...")
+    test_encode_known_geohash()
+    test_haversine_known_distance()
+    test_prefixes_cover_every_point_in_radius()
+    test_half_specified_coordinates_are_rejected()
+    print("✅ Geohash tests passed!")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test the shared game listing cache and the bcrypt pool limits (no database needed)
+
+    python -m app.scripts.tests.test_listing_cache
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from fastapi import HTTPException
+
+from app.core import password_pool, run_password_task, settings
+from app.models import GameResponse
+from app.services import GameService
+from app.utils.cache import SingleFlight
+
+def make_game(game_id: int) -> GameResponse:
+    return GameResponse(
+        id=game_id, title=f"Game {game_id}", description=None, location="Central Park",
+        date_time="2030-01-01 18:00:00+00:00", duration_minutes=90, max_players=22,
+        skill_level_min=1, skill_level_max=10, status="open", created_by=1, creator_name="A B",
+        created_at="2030-01-01", updated_at="2030-01-01"
+    )
+
+class FakeFetch:
+    """Stands in for GameService._fetch_games and counts the queries it would run"""
+
+    def __init__(self, ids):
+        self.ids = ids
+        self.calls = 0
+
+    async def __call__(self, *args):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return [make_game(i) for i in self.ids]
+
+def with_fake_fetch(ids):
+    fetch = FakeFetch(ids)
+    original = GameService._fetch_games
+    GameService._fetch_games = staticmethod(fetch)
+    GameService.invalidate_listings()
+    return fetch, original
+
+def test_single_flight_coalesces_concurrent_loads():
+    async def run():
+        flight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "page"
+
+        results = await asyncio.gather(*(flight.do("key", load) for _ in range(100)))
+        assert results == ["page"] * 100 and calls == 1 and flight.coalesced == 99
+        assert len(flight) == 0
+    asyncio.run(run())
+
+def test_concurrent_listing_misses_share_one_query():
+    fetch, original = with_fake_fetch([1, 2, 3])
+    try:
+        async def run():
+            pages = await asyncio.gather(*(GameService.get_games("open", limit=20) for _ in range(500)))
+            assert all([g.id for g in page] == [1, 2, 3] for page in pages)
+            assert fetch.calls == 1
+            await GameService.get_games("open", limit=20)
+            assert fetch.calls == 1  # served from cache
+        asyncio.run(run())
+    finally:
+        GameService._fetch_games = original
+
+def test_writes_invalidate_affected_listings():
+    fetch, original = with_fake_fetch([1, 2, 3])
+    try:
+        async def run():
+            await GameService.get_games("open", limit=20)
+            await GameService.get_games("open", skill_min=9, limit=20)
+            GameService.invalidate_listings(99)  # game on neither page
+            await GameService.get_games("open", limit=20)
+            assert fetch.calls == 2
+            GameService.invalidate_listings(2)  # join/leave on a listed game
+            await GameService.get_games("open", limit=20)
+            await GameService.get_games("open", skill_min=9, limit=20)
+            assert fetch.calls == 4
+            GameService.invalidate_listings()  # new game
+            await GameService.get_games("open", limit=20)
+            assert fetch.calls == 5
+        asyncio.run(run())
+    finally:
+        GameService._fetch_games = original
+
+def test_password_pool_fails_fast_when_saturated():
+    async def run():
+        limit = settings.PASSWORD_HASH_MAX_PENDING
+        outcomes = await asyncio.gather(
+            *(run_password_task(time.sleep, 0.05) for _ in range(limit + 10)),
+            return_exceptions=True
+        )
+        rejected = [o for o in outcomes if isinstance(o, HTTPException)]
+        assert len(rejected) == 10 and all(o.status_code == 503 for o in rejected)
+        assert password_pool.password_pool_stats()["pending"] == 0
+    try:
+        asyncio.run(run())
+    finally:
+        password_pool.shutdown_password_pool()
+
+if __name__ == "__main__":
+    print("🧪 Testing listing cache and password pool...")
+    test_single_flight_coalesces_concurrent_loads()
+    test_concurrent_listing_misses_share_one_query()
+    test_writes_invalidate_affected_listings()
+    test_password_pool_fails_fast_when_saturated()
+    print("✅ Listing cache tests passed!")
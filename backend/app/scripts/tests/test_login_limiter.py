@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test login throttling token buckets and their backends (no database needed)
+
+    python -m app.scripts.tests.test_login_limiter
+"""
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from fastapi import HTTPException
+
+from app.core import settings
+from app.models import UserLogin
+from app.services import user_service, UserService
+from app.utils import rate_limit
+from app.utils.rate_limit import LoginLimiter, MemoryBucketBackend, SQLiteBucketBackend, take_token
+
+def test_bucket_allows_burst_then_refills():
+    state, now = None, 1000.0
+    for _ in range(5):
+        state, retry_after = take_token(state, 5, 1 / 60, now)
+        assert retry_after == 0
+    state, retry_after = take_token(state, 5, 1 / 60, now)
+    assert 59 < retry_after <= 60
+    state, retry_after = take_token(state, 5, 1 / 60, now + 60)
+    assert retry_after == 0
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryBucketBackend(max_keys=3)
+    for key in ("a", "b", "c"):
+        backend.take(key, 1, 0.001, 0)
+    backend.take("a", 1, 0.001, 0)  # "a" is now the most recent
+    backend.take("d", 1, 0.001, 0)
+    assert len(backend) == 3
+    assert backend.take("b", 1, 0.001, 0) == 0  # evicted, so full again
+    assert backend.take("a", 1, 0.001, 0) > 0
+
+def test_sqlite_backend_is_shared_between_instances():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "buckets.db")
+        node_a, node_b = SQLiteBucketBackend(path), SQLiteBucketBackend(path)
+        assert node_a.take("user:alice", 2, 0.001, 0) == 0
+        assert node_b.take("user:alice", 2, 0.001, 0) == 0
+        assert node_a.take("user:alice", 2, 0.001, 0) > 0
+        node_b.reset("user:alice")
+        assert node_a.take("user:alice", 2, 0.001, 0) == 0
+
+def test_ip_bucket_limits_many_usernames():
+    limiter = LoginLimiter(MemoryBucketBackend())
+    for i in range(settings.LOGIN_IP_BURST):
+        asyncio.run(limiter.check(f"user{i}", "10.0.0.1"))
+    try:
+        asyncio.run(limiter.check("someone-else", "10.0.0.1"))
+        assert False, "expected 429"
+    except HTTPException as e:
+        assert e.status_code == 429 and int(e.headers["Retry-After"]) >= 1
+    asyncio.run(limiter.check("someone-else", "10.0.0.2"))
+
+def test_locked_store_runs_off_loop_and_fails_open():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "buckets.db")
+        limiter = LoginLimiter(SQLiteBucketBackend(path))
+        # Another process holds the write lock past the busy timeout
+        holder = sqlite3.connect(path, isolation_level=None)
+        holder.execute("BEGIN IMMEDIATE")
+        try:
+            async def run():
+                ticks = 0
+
+                async def ticker():
+                    nonlocal ticks
+                    while True:
+                        await asyncio.sleep(0.05)
+                        ticks += 1
+
+                task = asyncio.create_task(ticker())
+                await limiter.check("alice", "10.0.0.5")  # allowed, not a 500
+                task.cancel()
+                return ticks
+            assert asyncio.run(run()) >= 5  # the loop kept running while SQLite waited
+            assert limiter.backend_errors == 1
+        finally:
+            holder.execute("ROLLBACK")
+            holder.close()
+
+def test_rejected_login_skips_database_and_bcrypt():
+    class NoDatabase:
+        def __init__(self):
+            raise AssertionError("throttled login reached the database")
+
+    original_db, original_limiter = user_service.AsyncDatabaseManager, rate_limit._login_limiter
+    user_service.AsyncDatabaseManager = NoDatabase
+    rate_limit._login_limiter = limiter = LoginLimiter(MemoryBucketBackend())
+    try:
+        for _ in range(settings.LOGIN_USERNAME_BURST):
+            asyncio.run(limiter.check("victim", "10.0.0.3"))
+        login = UserLogin(username="victim", password="wrong-password")
+        try:
+            asyncio.run(UserService.authenticate_user(login, "10.0.0.4"))
+            assert False, "expected 429"
+        except HTTPException as e:
+            assert e.status_code == 429
+        asyncio.run(limiter.succeeded("victim"))
+        assert limiter.backend.take("user:victim", 1, 0.001, 0) == 0
+    finally:
+        user_service.AsyncDatabaseManager = original_db
+        rate_limit._login_limiter = original_limiter
+
+if __name__ == "__main__":
+    print("🧪 Testing login throttling...")
+    test_bucket_allows_burst_then_refills()
+    test_memory_backend_evicts_least_recently_used()
+    test_sqlite_backend_is_shared_between_instances()
+    test_ip_bucket_limits_many_usernames()
+    test_locked_store_runs_off_loop_and_fails_open()
+    test_rejected_login_skips_database_and_bcrypt()
+    print("✅ Login throttling tests passed!")
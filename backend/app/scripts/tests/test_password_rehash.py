@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test bcrypt cost detection and the rehash-on-login upgrade (no database needed)
+
+    python -m app.scripts.tests.test_password_rehash
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+import bcrypt
+
+from app.core import password_pool, settings
+from app.services import user_service, UserService
+from app.services.user_service import bcrypt_cost, password_needs_rehash
+
+class FakeUsersTable:
+    """Stands in for AsyncDatabaseManager over a one-column users table"""
+
+    def __init__(self, hashes):
+        self.hashes = hashes
+        self.updates = 0
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self, None
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params):
+        new_hash, user_id, old_hash = params
+        self.updates += 1
+        self._row = None
+        if self.hashes.get(user_id) == old_hash:
+            self.hashes[user_id] = new_hash
+            self._row = {"id": user_id}
+
+    def fetchone(self):
+        return self._row
+
+def with_rounds(rounds):
+    saved = settings.BCRYPT_ROUNDS
+    settings.BCRYPT_ROUNDS = rounds
+    return saved
+
+def test_cost_detection():
+    assert bcrypt_cost(bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=5)).decode()) == 5
+    assert bcrypt_cost("not-a-bcrypt-hash") is None
+    saved = with_rounds(5)
+    try:
+        assert not password_needs_rehash(bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=5)).decode())
+        assert password_needs_rehash(bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=4)).decode())
+        assert not password_needs_rehash("not-a-bcrypt-hash")
+    finally:
+        settings.BCRYPT_ROUNDS = saved
+
+def test_login_rehash_upgrades_cost_once():
+    old_hash = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4)).decode()
+    table = FakeUsersTable({7: old_hash})
+    original_db, saved = user_service.AsyncDatabaseManager, with_rounds(5)
+    user_service.AsyncDatabaseManager = table
+    try:
+        async def run():
+            for _ in range(3):  # concurrent logins schedule a single rehash
+                UserService.schedule_rehash(7, "secret", old_hash)
+            await asyncio.gather(*user_service._rehash_tasks)
+        asyncio.run(run())
+        new_hash = table.hashes[7]
+        assert table.updates == 1 and bcrypt_cost(new_hash) == 5
+        assert bcrypt.checkpw(b"secret", new_hash.encode())
+        # A password changed since the login is left alone
+        assert not asyncio.run(UserService.rehash_password(7, "secret", old_hash))
+        assert table.hashes[7] == new_hash
+    finally:
+        user_service.AsyncDatabaseManager = original_db
+        settings.BCRYPT_ROUNDS = saved
+        password_pool.shutdown_password_pool()
+
+if __name__ == "__main__":
+    print("🧪 Testing password rehash on login...")
+    test_cost_detection()
+    test_login_rehash_upgrades_cost_once()
+    print("✅ Password rehash tests passed!")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test per-request SQL instrumentation and the Server-Timing header (no database needed)
+
+    python -m app.scripts.tests.test_query_stats
+"""
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from app.core import AsyncCursor, QueryTimingMiddleware, current_queries, fingerprint, settings
+from app.core.query_stats import redact_params
+
+class FakeConnection:
+    """Stands in for an asyncpg connection that returns ``rows`` rows per statement"""
+
+    def __init__(self, rows: int = 1, delay: float = 0.0, error: Exception = None):
+        self.rows = rows
+        self.delay = delay
+        self.error = error
+
+    async def fetch(self, query, *params):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [{"id": i} for i in range(self.rows)]
+
+    async def execute(self, query, *params):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return f"{query.split()[0].upper()} {self.rows}"
+
+class ParticipantService:
+    @staticmethod
+    async def load_names(cursor, user_ids):
+        for user_id in user_ids:  # an N+1 on purpose
+            await cursor.execute("SELECT first_name FROM users WHERE id = %s", (user_id,))
+
+def run_request(handler):
+    """Call ``handler`` through the middleware as GET /test; returns the response headers"""
+    async def app(scope, receive, send):
+        await handler()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    scope = {"type": "http", "method": "GET", "path": "/test", "headers": []}
+    asyncio.run(QueryTimingMiddleware(app)(scope, receive, send))
+    return dict(sent[0]["headers"])
+
+def test_fingerprint_strips_literals():
+    assert fingerprint("SELECT *  FROM games\n WHERE id = %s AND status = 'open' LIMIT 20") == \
+        "SELECT * FROM games WHERE id = ? AND status = ? LIMIT ?"
+    assert fingerprint("SELECT 1 FROM t WHERE id IN ($1, $2, $3)") == "SELECT ? FROM t WHERE id IN (...)"
+    assert redact_params((7, "secret", [1, 2, 3], None)) == ["int", "str", "list[3]", "NoneType"]
+
+def test_server_timing_counts_request_queries():
+    async def handler():
+        cursor = AsyncCursor(FakeConnection(rows=3))
+        await cursor.execute("SELECT id FROM games WHERE status = %s", ("open",))
+        await cursor.execute("SELECT id FROM games WHERE status = %s", ("full",))
+        queries = current_queries()
+        assert queries.count == 2 and queries.statements[0].rows == 3
+        assert queries.statements[0].caller == "test_server_timing_counts_request_queries.<locals>.handler"
+
+    header = run_request(handler)[b"server-timing"].decode()
+    assert header.startswith("db;dur=") and 'desc="2 queries"' in header and ", app;dur=" in header
+    assert current_queries() is None
+
+def test_failed_and_write_statements_are_recorded():
+    async def handler():
+        cursor = AsyncCursor(FakeConnection(rows=4))
+        await cursor.execute("DELETE FROM game_participants WHERE game_id = %s", (1,))
+        assert cursor.rowcount == 4 and cursor.fetchall() == []
+        failing = AsyncCursor(FakeConnection(error=TimeoutError()))
+        try:
+            await failing.execute("SELECT pg_sleep(%s)", (60,))
+            assert False, "expected the statement to fail"
+        except TimeoutError:
+            pass
+        assert failing.rowcount == -1
+        queries = current_queries()
+        assert queries.count == 2
+        assert [r.rows for r in queries.statements] == [4, 0]
+
+    run_request(handler)
+
+def test_slow_and_repeated_queries_are_logged():
+    records = []
+
+    class Capture(logging.Handler):
+        def emit(self, record):
+            records.append(record.getMessage())
+
+    logger = logging.getLogger("app.core.query_stats")
+    handler = Capture()
+    logger.addHandler(handler)
+    saved = (settings.SLOW_QUERY_MS, settings.REPEATED_QUERY_WARN)
+    settings.SLOW_QUERY_MS, settings.REPEATED_QUERY_WARN = 5, 3
+    try:
+        async def slow():
+            await AsyncCursor(FakeConnection(delay=0.01)).execute(
+                "UPDATE users SET password_hash = %s WHERE id = %s", ("$2b$12$hash", 42)
+            )
+            await ParticipantService.load_names(AsyncCursor(FakeConnection()), [1, 2, 3, 4])
+
+        run_request(slow)
+    finally:
+        settings.SLOW_QUERY_MS, settings.REPEATED_QUERY_WARN = saved
+        logger.removeHandler(handler)
+
+    slow_logs = [m for m in records if m.startswith("Slow query")]
+    assert len(slow_logs) == 1 and "params=['str', 'int']" in slow_logs[0]
+    assert "$2b$12$hash" not in slow_logs[0] and "42" not in slow_logs[0].split("params=")[1]
+    repeated = [m for m in records if "possible N+1" in m]
+    assert len(repeated) == 1 and "ParticipantService.load_names ran the same statement 4 times" in repeated[0]
+
+if __name__ == "__main__":
+    print("🧪 Testing query instrumentation...")
+    test_fingerprint_strips_literals()
+    test_server_timing_counts_request_queries()
+    test_failed_and_write_statements_are_recorded()
+    test_slow_and_repeated_queries_are_logged()
+    print("✅ Query instrumentation tests passed!")
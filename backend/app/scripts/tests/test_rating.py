@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test the player rating updates directly (no database needed)
+
+    python -m app.scripts.tests.test_rating
+"""
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from app.algorithms import RatedGame, initial_rating, rate_game, rating_to_skill, replay_ratings
+
+def random_history(players: int, games: int, seed: int = 11):
+    rng = random.Random(seed)
+    history = []
+    for _ in range(games):
+        size = rng.randint(2, 11)
+        roster = rng.sample(range(players), 2 * size)
+        history.append(RatedGame(roster[:size], roster[size:], rng.randint(0, 6), rng.randint(0, 6)))
+    return history
+
+def sequential_replay(initial, history):
+    ratings = list(initial)
+    games_rated = [0] * len(ratings)
+    for game in history:
+        delta_a, delta_b = rate_game(
+            [ratings[i] for i in game.team_a], [games_rated[i] for i in game.team_a],
+            [ratings[i] for i in game.team_b], [games_rated[i] for i in game.team_b],
+            game.score_a, game.score_b
+        )
+        for i, delta in zip(game.team_a + game.team_b, list(delta_a) + list(delta_b)):
+            ratings[i] += delta
+            games_rated[i] += 1
+    return np.array(ratings), np.array(games_rated)
+
+def test_winner_gains_loser_loses():
+    delta_a, delta_b = rate_game([1500, 1500], [20, 20], [1500, 1500], [20, 20], 3, 1)
+    assert all(d > 0 for d in delta_a) and all(d < 0 for d in delta_b)
+    assert abs(sum(delta_a) + sum(delta_b)) < 1e-9
+
+    # Upset win by the weaker side moves ratings more than the expected win
+    upset, _ = rate_game([1300], [20], [1700], [20], 1, 0)
+    expected, _ = rate_game([1700], [20], [1300], [20], 1, 0)
+    assert upset[0] > expected[0]
+
+def test_skill_scale_round_trip():
+    for skill in range(1, 11):
+        assert abs(rating_to_skill(initial_rating(skill)) - skill) < 1e-9
+
+def test_replay_matches_sequential_updates():
+    players = 120
+    history = random_history(players, 800)
+    initial = [initial_rating(random.Random(i).randint(1, 10)) for i in range(players)]
+
+    expected_ratings, expected_counts = sequential_replay(initial, history)
+    ratings, counts = replay_ratings(initial, history)
+
+    assert np.array_equal(counts, expected_counts)
+    assert np.max(np.abs(ratings - expected_ratings)) < 1e-6
+
+def test_replay_throughput():
+    players = 2000
+    history = random_history(players, 20000, seed=3)
+    started = time.perf_counter()
+    replay_ratings([1500.0] * players, history)
+    elapsed = time.perf_counter() - started
+    print(f"🚀 Replayed {len(history):,} games in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    print("🧪 Testing player ratings...")
+    test_winner_gains_loser_loses()
+    test_skill_scale_round_trip()
+    test_replay_matches_sequential_updates()
+    test_replay_throughput()
+    print("✅ Player rating tests passed!")
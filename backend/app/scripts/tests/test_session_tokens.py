@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test session token issuing, key rotation and revocation directly (no database needed)
+
+    python -m app.scripts.tests.test_session_tokens
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+import jwt
+from fastapi import HTTPException
+
+from app.core import settings
+from app.routes.user_routes import deactivate_my_account
+from app.services import user_service
+from app.utils import security
+from app.utils.security import create_access_token, decode_access_token, get_active_user, revoke_token
+
+if not settings.JWT_SIGNING_KEYS:
+    settings.JWT_SIGNING_KEYS, settings.JWT_ACTIVE_KEY_ID = {"test": "test-only-secret"}, "test"
+
+def expect_401(token):
+    try:
+        decode_access_token(token)
+    except HTTPException as e:
+        assert e.status_code == 401
+        return e.detail
+    raise AssertionError("token was accepted")
+
+def with_keys(keys, active):
+    saved = (settings.JWT_SIGNING_KEYS, settings.JWT_ACTIVE_KEY_ID)
+    settings.JWT_SIGNING_KEYS, settings.JWT_ACTIVE_KEY_ID = keys, active
+    return saved
+
+def restore(saved):
+    settings.JWT_SIGNING_KEYS, settings.JWT_ACTIVE_KEY_ID = saved
+
+def test_claims_round_trip():
+    token, expires_in = create_access_token(42, 7)
+    session = decode_access_token(token)
+    assert (session.user_id, session.skill_level, session.is_active) == (42, 7, True)
+    assert expires_in == settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    assert session.expires_at - int(time.time()) <= expires_in
+
+def test_key_rotation():
+    saved = with_keys({"old": "old-secret"}, "old")
+    try:
+        old_token, _ = create_access_token(1, 5)
+        # New key added and made active: old tokens still verify
+        with_keys({"old": "old-secret", "new": "new-secret"}, "new")
+        new_token, _ = create_access_token(1, 5)
+        assert jwt.get_unverified_header(new_token)["kid"] == "new"
+        assert decode_access_token(old_token).user_id == 1
+        # Old key retired: its tokens stop verifying, new ones keep working
+        with_keys({"new": "new-secret"}, "new")
+        expect_401(old_token)
+        assert decode_access_token(new_token).user_id == 1
+    finally:
+        restore(saved)
+
+def test_rejects_tampered_expired_and_revoked_tokens():
+    token, _ = create_access_token(3, 4)
+    header, payload, signature = token.split(".")
+    forged = jwt.encode({"sub": "3", "skill_level": 10, "is_active": True}, "guess", headers={"kid": settings.JWT_ACTIVE_KEY_ID})
+    expect_401(forged)
+    expect_401(f"{header}.{payload}.{signature[::-1]}")
+
+    now = int(time.time())
+    expired = jwt.encode(
+        {"sub": "3", "skill_level": 4, "is_active": True, "iss": settings.JWT_ISSUER,
+         "iat": now - 120, "exp": now - 60, "jti": "x"},
+        settings.JWT_SIGNING_KEYS[settings.JWT_ACTIVE_KEY_ID],
+        headers={"kid": settings.JWT_ACTIVE_KEY_ID}
+    )
+    assert expect_401(expired) == "Session expired"
+
+    revoke_token(decode_access_token(token))
+    assert expect_401(token) == "Session revoked"
+
+class FakeUsersTable:
+    """Stands in for AsyncDatabaseManager over a users table holding only is_active"""
+
+    def __init__(self, active):
+        self.active = active
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self, None
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params):
+        user_id = params[-1]
+        if query.strip().startswith("UPDATE"):
+            self._row = {"id": user_id} if self.active.get(user_id) else None
+            if self._row:
+                self.active[user_id] = False
+        else:
+            self._row = {"is_active": self.active[user_id]} if user_id in self.active else None
+
+    def fetchone(self):
+        return self._row
+
+def test_deactivation_ends_every_session():
+    table = FakeUsersTable({9: True})
+    original = user_service.AsyncDatabaseManager
+    user_service.AsyncDatabaseManager = table
+    try:
+        phone, _ = create_access_token(9, 5)
+        laptop, _ = create_access_token(9, 5)
+        asyncio.run(deactivate_my_account(decode_access_token(phone)))
+        # This worker rejects the other session outright
+        assert expect_401(laptop) == "Session revoked"
+
+        # A worker that never saw the deactivation still refuses writes
+        security._sessions_revoked_before.clear()
+        session = decode_access_token(laptop)
+        try:
+            asyncio.run(get_active_user(session))
+            raise AssertionError("inactive account was allowed to write")
+        except HTTPException as e:
+            assert e.status_code == 403
+        assert expect_401(laptop) == "Session revoked"
+    finally:
+        user_service.AsyncDatabaseManager = original
+
+def test_refuses_to_start_without_signing_keys():
+    for keys, active in (({}, ""), ({"a": "secret"}, "b")):
+        saved = with_keys(keys, active)
+        try:
+            settings.require_signing_keys()
+            raise AssertionError("started without a usable signing key")
+        except RuntimeError:
+            pass
+        finally:
+            restore(saved)
+    settings.require_signing_keys()
+
+if __name__ == "__main__":
+    print("🧪 Testing session tokens...")
+    test_claims_round_trip()
+    test_key_rotation()
+    test_rejects_tampered_expired_and_revoked_tokens()
+    test_deactivation_ends_every_session()
+    test_refuses_to_start_without_signing_keys()
+    print("✅ Session token tests passed!")
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Test the team balancing algorithm directly (no database needed)
+
+    python -m app.scripts.tests.test_team_balancer
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from app.algorithms import (
+    AGE_RANGES, PLAYING_STYLES, POSITIONS, BalanceCalculator, BatchBalanceScorer,
+    ChemistryMatrix, Player, SwapEvaluator, TeamBalancer, get_search_pool, shutdown_search_pool, split_teams
+)
+from app.algorithms.parallel_search import run_restarts
+
+def random_roster(size: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [
+        Player(
+            i, f"player{i}", "Test", f"Player{i}", rng.randint(1, 10),
+            rng.choice(POSITIONS + ['Any']), rng.choice(PLAYING_STYLES), rng.choice(AGE_RANGES)
+        )
+        for i in range(1, size + 1)
+    ]
+
+def test_basic_balancing():
+    players = [
+        Player(1, "player1", "John", "Doe", 8, "Forward", "Aggressive", "26-35"),
+        Player(2, "player2", "Jane", "Smith", 6, "Midfielder", "Technical", "18-25"),
+        Player(3, "player3", "Bob", "Wilson", 7, "Defender", "Physical", "26-35"),
+        Player(4, "player4", "Alice", "Brown", 5, "Goalkeeper", "Balanced", "18-25"),
+        Player(5, "player5", "Charlie", "Davis", 8, "Forward", "Creative", "36-45"),
+        Player(6, "player6", "Diana", "Miller", 6, "Midfielder", "Defensive", "26-35"),
+    ]
+
+    result = TeamBalancer().generate_balanced_teams(players)
+
+    print(f"⚖️  Balance Score: {result['balance_score']:.1f}/100")
+    print(f"   Team A: {[p.first_name for p in result['team_a']]}")
+    print(f"   Team B: {[p.first_name for p in result['team_b']]}")
+
+    assert len(result['team_a']) == len(result['team_b']) == 3
+    assert result['balance_details']['skill_difference'] <= 1.0
+    assert set(result['assigned_positions']) == {p.id for p in players}
+
+def test_goalkeepers_split():
+    players = random_roster(14)
+    players[0].preferred_position = players[1].preferred_position = 'Goalkeeper'
+    for p in players[2:]:
+        if p.preferred_position == 'Goalkeeper':
+            p.preferred_position = 'Defender'
+
+    result = TeamBalancer().generate_balanced_teams(players)
+    keepers_a = [p for p in result['team_a'] if p.position == 'Goalkeeper']
+    keepers_b = [p for p in result['team_b'] if p.position == 'Goalkeeper']
+    assert len(keepers_a) == len(keepers_b) == 1
+
+def test_swap_scores_match_full_recalculation():
+    players = random_roster(30)
+    evaluator = SwapEvaluator(players, [i % 2 for i in range(len(players))])
+    calculator = BalanceCalculator()
+    rng = random.Random(3)
+
+    for _ in range(100):
+        a = rng.choice([i for i, t in enumerate(evaluator.assignment) if t == 0])
+        b = rng.choice([i for i, t in enumerate(evaluator.assignment) if t == 1])
+        predicted = evaluator.swap_score(a, b)
+        evaluator.apply_swap(a, b)
+        actual, _ = calculator.calculate_total_balance(*evaluator.teams())
+        assert abs(predicted - actual) < 1e-6
+
+def test_batch_scores_match_reference():
+    players = random_roster(23)
+    players[4].age_range = None
+    players[9].playing_style = None
+    rng = random.Random(5)
+    assignments = [[rng.randint(0, 1) for _ in players] for _ in range(200)]
+    assignments.append([0] * len(players))  # degenerate: empty Team B
+
+    scores = BatchBalanceScorer(players).score(assignments)
+    calculator = BalanceCalculator()
+    for assignment, score in zip(assignments, scores):
+        expected, _ = calculator.calculate_total_balance(*split_teams(players, assignment))
+        assert abs(score - expected) < 1e-6
+
+def test_chemistry_scores_match_reference():
+    players = random_roster(30)
+    rng = random.Random(9)
+    pairs = {}
+    for _ in range(120):
+        a, b = sorted(rng.sample([p.id for p in players], 2))
+        games = rng.randint(1, 12)
+        wins = rng.randint(0, games)
+        pairs[(a, b)] = (games, wins, rng.randint(0, games - wins))
+    chemistry = ChemistryMatrix(pairs)
+
+    assignments = [[rng.randint(0, 1) for _ in players] for _ in range(50)]
+    scores = BatchBalanceScorer(players, chemistry).score(assignments)
+    plain = BatchBalanceScorer(players).score(assignments)
+    calculator = BalanceCalculator(chemistry)
+    for assignment, score in zip(assignments, scores):
+        expected, _ = calculator.calculate_total_balance(*split_teams(players, assignment))
+        assert abs(score - expected) < 1e-6
+    assert abs(scores - plain).max() > 0
+
+    result = TeamBalancer(chemistry=chemistry).generate_balanced_teams(players)
+    assert len(result['team_a']) == len(result['team_b']) == 15
+
+def test_multi_start_reproducible_from_seed():
+    players = random_roster(30)
+    balancer = TeamBalancer(restarts=16, executor=get_search_pool(2))
+    first = balancer.generate_balanced_teams(players, seed=42)
+    second = balancer.generate_balanced_teams(players, seed=42)
+
+    assert first['restarts_completed'] == second['restarts_completed'] == 16
+    assert [p.id for p in first['team_a']] == [p.id for p in second['team_a']]
+    assert first['balance_score'] == second['balance_score']
+    assert first['balance_score'] >= TeamBalancer().generate_balanced_teams(players)['balance_score'] - 1e-9
+
+def test_multi_start_respects_time_budget():
+    players = random_roster(30)
+    started = time.perf_counter()
+    result = TeamBalancer(restarts=10000, time_budget=0.5, executor=get_search_pool(2)).generate_balanced_teams(players)
+    elapsed = time.perf_counter() - started
+    print(f"⏱️  {result['restarts_completed']} restarts in {elapsed:.2f}s (budget 0.5s)")
+    assert elapsed < 1.0
+    assert len(result['team_a']) == len(result['team_b']) == 15
+    shutdown_search_pool()
+
+def test_truncated_run_replays_from_seed_and_restarts():
+    players = random_roster(30)
+    pool = get_search_pool(2)
+    # A budget too small to finish every restart, as on a cold or busy pool
+    truncated = TeamBalancer(restarts=10000, time_budget=0.05, executor=pool).generate_balanced_teams(players, seed=7)
+    replay = TeamBalancer(
+        restarts=truncated['restarts_completed'], time_budget=None, executor=pool
+    ).generate_balanced_teams(players, seed=7)
+    assert replay['restarts_completed'] == truncated['restarts_completed']
+    assert [p.id for p in replay['team_a']] == [p.id for p in truncated['team_a']]
+    assert replay['balance_score'] == truncated['balance_score']
+    shutdown_search_pool()
+
+def test_back_to_back_budgets_share_the_pool():
+    players = random_roster(60)
+    pool = get_search_pool(2)
+    try:
+        TeamBalancer(restarts=2, time_budget=None, executor=pool).generate_balanced_teams(players)  # spawn the workers
+        # Each search's chunks stop at its deadline instead of holding the workers
+        for seed in range(3):
+            result = TeamBalancer(restarts=10000, time_budget=0.5, executor=pool).generate_balanced_teams(players, seed=seed)
+            print(f"⏱️  search {seed + 1}: {result['restarts_completed']} restarts")
+            assert result['restarts_completed'] > 0
+        _, assignment, _, ran = run_restarts(players, [1, 2, 3], 50, deadline=time.time() - 1)
+        assert (assignment, ran) == (None, 0)
+    finally:
+        shutdown_search_pool()
+
+def test_rebalance_keeps_most_players():
+    players = random_roster(22)
+    generated = TeamBalancer().generate_balanced_teams(players)
+    previous = {p.id: 0 for p in generated['team_a']}
+    previous.update({p.id: 1 for p in generated['team_b']})
+
+    # Two Team A players leave, one waitlisted player is promoted
+    leavers = {generated['team_a'][0].id, generated['team_a'][1].id}
+    promoted = Player(99, "player99", "Late", "Joiner", 6, "Midfielder", "Balanced", "26-35")
+    roster = [p for p in players if p.id not in leavers] + [promoted]
+
+    result = TeamBalancer().rebalance_teams(roster, previous, generated['balance_score'])
+    print(f"🔁 Rebalanced: {len(result['moved_player_ids'])} moved, score {result['balance_score']:.1f}")
+
+    assert abs(len(result['team_a']) - len(result['team_b'])) <= 1
+    assert {p.id for p in result['team_a'] + result['team_b']} == {p.id for p in roster}
+    assert len(result['moved_player_ids']) <= 1 + 2 * 3  # one size move plus max_swaps swaps
+    stayed = [p for p in result['team_a'] if previous.get(p.id) == 0] + \
+        [p for p in result['team_b'] if previous.get(p.id) == 1]
+    assert len(stayed) == len(roster) - 1 - len(result['moved_player_ids'])
+
+def test_swap_throughput():
+    players = random_roster(30)
+    evaluator = SwapEvaluator(players, [i % 2 for i in range(len(players))])
+    evaluated = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < 0.5:
+        for a in range(0, 30, 2):
+            for b in range(1, 30, 2):
+                evaluator.swap_score(a, b)
+                evaluated += 1
+    rate = evaluated / (time.perf_counter() - started)
+    print(f"🚀 {rate:,.0f} candidate swaps/second (30 players)")
+    assert rate > 10000
+
+if __name__ == "__main__":
+    print("🧪 Testing team balancer...")
+    test_basic_balancing()
+    test_goalkeepers_split()
+    test_swap_scores_match_full_recalculation()
+    test_batch_scores_match_reference()
+    test_chemistry_scores_match_reference()
+    test_multi_start_reproducible_from_seed()
+    test_multi_start_respects_time_budget()
+    test_truncated_run_replays_from_seed_and_restarts()
+    test_back_to_back_budgets_share_the_pool()
+    test_rebalance_keeps_most_players()
+    test_swap_throughput()
+    print("✅ Team balancer tests passed!")
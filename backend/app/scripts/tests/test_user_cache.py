@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test the user profile cache and the bulk lookup (no database needed)
+
+    python -m app.scripts.tests.test_user_cache
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from fastapi import HTTPException
+
+from app.models import UserProfileUpdate
+from app.services import user_service, UserService
+
+def make_user(user_id: int, **overrides) -> dict:
+    user = {
+        "id": user_id, "username": f"player{user_id}", "first_name": "Pat", "last_name": f"Player{user_id}",
+        "age_range": "26-35", "bio": None, "skill_level": 5, "preferred_position": "Any",
+        "playing_style": "Balanced", "is_active": True, "is_verified": False, "created_at": "2030-01-01",
+    }
+    user.update(overrides)
+    return user
+
+class FakeUsersTable:
+    """Stands in for AsyncDatabaseManager over an in-memory users table, recording each query"""
+
+    def __init__(self, users):
+        self.users = {user["id"]: user for user in users}
+        self.queries = []
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self, None
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params):
+        self.queries.append((query, params))
+        if "ANY(" in query:
+            ids = params[0]
+        elif query.strip().startswith("UPDATE"):
+            ids = [params[-1]]
+            user = self.users.get(params[-1])
+            if user and "bio = %s" in query:
+                user["bio"] = params[0]
+        else:
+            ids = [params[0]]
+        self._rows = [self.users[i] for i in ids if i in self.users and self.users[i]["is_active"]]
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return self._rows
+
+def with_fake_users(users):
+    table = FakeUsersTable(users)
+    original = user_service.AsyncDatabaseManager
+    user_service.AsyncDatabaseManager = table
+    user_service._user_cache.clear()
+    return table, original
+
+def test_get_user_reads_through_cache():
+    table, original = with_fake_users([make_user(1)])
+    try:
+        async def run():
+            first = await UserService.get_user_by_id(1)
+            second = await UserService.get_user_by_id(1)
+            assert first == second and len(table.queries) == 1
+            try:
+                await UserService.get_user_by_id(2)
+                assert False, "expected 404"
+            except HTTPException as e:
+                assert e.status_code == 404
+            stats = UserService.user_cache_stats()
+            assert stats["hits"] >= 1 and stats["misses"] >= 2
+        asyncio.run(run())
+    finally:
+        user_service.AsyncDatabaseManager = original
+
+def test_bulk_lookup_fetches_only_misses():
+    table, original = with_fake_users([make_user(i) for i in range(1, 6)])
+    try:
+        async def run():
+            await UserService.get_user_by_id(2)
+            await UserService.get_user_by_id(4)
+            users = await UserService.get_users_by_ids([5, 4, 3, 2, 1, 99, 3])
+            assert [u.id for u in users] == [5, 4, 3, 2, 1]
+            assert len(table.queries) == 3
+            query, params = table.queries[-1]
+            assert "ANY(" in query and sorted(params[0]) == [1, 3, 5, 99]
+            await UserService.get_users_by_ids([1, 2, 3, 4, 5])
+            assert len(table.queries) == 3  # all cached now
+        asyncio.run(run())
+    finally:
+        user_service.AsyncDatabaseManager = original
+
+def test_profile_changes_and_deactivation_invalidate():
+    table, original = with_fake_users([make_user(1), make_user(2)])
+    try:
+        async def run():
+            await UserService.get_users_by_ids([1, 2])
+            updated = await UserService.update_profile(1, UserProfileUpdate(bio="Left-footed"))
+            assert updated.bio == "Left-footed"
+            assert (await UserService.get_user_by_id(1)).bio == "Left-footed"
+
+            await UserService.deactivate_user(2)
+            table.users[2]["is_active"] = False
+            assert await UserService.get_users_by_ids([1, 2]) == [updated]
+        asyncio.run(run())
+    finally:
+        user_service.AsyncDatabaseManager = original
+
+def test_invalidation_during_load_is_not_overwritten():
+    table, original = with_fake_users([make_user(1), make_user(2)])
+    read = table.execute
+
+    async def read_then_update(query, params):
+        await read(query, params)  # the old row is read, then a write commits before we cache it
+        table.users[1] = make_user(1, bio="Changed")
+        UserService.invalidate_user(1)
+
+    table.execute = read_then_update
+    try:
+        async def run():
+            assert (await UserService.get_user_by_id(1)).bio is None
+            assert user_service._user_cache.get(1) is None
+            await UserService.get_users_by_ids([1, 2])
+            assert user_service._user_cache.get(1) is None and user_service._user_cache.get(2) is None
+            table.execute = read
+            assert (await UserService.get_user_by_id(1)).bio == "Changed"
+            assert user_service._user_cache.get(1).bio == "Changed"
+        asyncio.run(run())
+    finally:
+        user_service.AsyncDatabaseManager = original
+
+if __name__ == "__main__":
+    print("🧪 Testing user profile cache...")
+    test_get_user_reads_through_cache()
+    test_bulk_lookup_fetches_only_misses()
+    test_profile_changes_and_deactivation_invalidate()
+    test_invalidation_during_load_is_not_overwritten()
+    print("✅ User cache tests passed!")
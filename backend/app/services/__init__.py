@@ -3,5 +3,12 @@ Services module initialization
 """
 from .user_service import UserService
 from .game_service import GameService
+from .team_service import TeamService
+from .rating_service import RatingService
+from .chemistry_service import ChemistryService
+from .recommendation_service import RecommendationService
 
-__all__ = ["UserService", "GameService"]
+__all__ = [
+    "UserService", "GameService", "TeamService", "RatingService", "ChemistryService",
+    "RecommendationService"
+]
@@ -0,0 +1,54 @@
+"""
+Teammate chemistry business logic
+"""
+from typing import List, Sequence
+
+from ..algorithms import ChemistryMatrix, teammate_pairs
+
+class ChemistryService:
+    """Service class for the sparse teammate chemistry matrix"""
+
+    @staticmethod
+    async def record_game(
+        cursor, game_id: int, team_a: Sequence[int], team_b: Sequence[int], score_a: int, score_b: int
+    ) -> int:
+        """Add one completed game to its teammate pairs (both teams, one upsert); returns pairs touched"""
+        user_a: List[int] = []
+        user_b: List[int] = []
+        wins: List[int] = []
+        draws: List[int] = []
+        for team, won in ((team_a, score_a > score_b), (team_b, score_b > score_a)):
+            for a, b in teammate_pairs(team):
+                user_a.append(a)
+                user_b.append(b)
+                wins.append(1 if won else 0)
+                draws.append(1 if score_a == score_b else 0)
+
+        if not user_a:
+            return 0
+
+        await cursor.execute("""
+            INSERT INTO teammate_chemistry AS tc (user_a, user_b, games_together, wins_together, draws_together, last_game_id)
+            SELECT p.user_a, p.user_b, 1, p.win, p.draw, %s
+            FROM unnest(%s::int[], %s::int[], %s::int[], %s::int[]) AS p(user_a, user_b, win, draw)
+            ORDER BY p.user_a, p.user_b
+            ON CONFLICT (user_a, user_b) DO UPDATE SET
+                games_together = tc.games_together + 1,
+                wins_together = tc.wins_together + EXCLUDED.wins_together,
+                draws_together = tc.draws_together + EXCLUDED.draws_together,
+                last_game_id = EXCLUDED.last_game_id,
+                updated_at = CURRENT_TIMESTAMP
+        """, (game_id, user_a, user_b, wins, draws))
+        return len(user_a)
+
+    @staticmethod
+    async def load_for_roster(cursor, user_ids: Sequence[int]) -> ChemistryMatrix:
+        """All stored pairs within a roster in one query (at most n*(n-1)/2 rows)"""
+        if len(user_ids) < 2:
+            return ChemistryMatrix()
+        await cursor.execute("""
+            SELECT user_a, user_b, games_together, wins_together, draws_together
+            FROM teammate_chemistry
+            WHERE user_a = ANY(%s::int[]) AND user_b = ANY(%s::int[])
+        """, (list(user_ids), list(user_ids)))
+        return ChemistryMatrix.from_rows(cursor.fetchall())
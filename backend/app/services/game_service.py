@@ -2,32 +2,58 @@
 Game-related business logic and database operations
 """
 from fastapi import HTTPException
+import asyncpg
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
-from ..core import DatabaseManager
+from ..core import AsyncDatabaseManager, settings
 from ..models import (
     CreateGameRequest, JoinGameRequest, GameResponse, 
     ParticipantResponse, GameParticipantsResponse
 )
+from ..utils.cache import LRUCache, SingleFlight
+from ..utils.geo import distance_sql, encode_geohash, radius_condition
+from ..utils.pagination import clamp_page_size, decode_cursor, decode_ranked_cursor
+
+# Game search (15_add_game_search_indexes.sql): full-text match on search_vector, or a
+# fuzzy trigram match on title + location for typos; both are served by GIN indexes
+SEARCH_QUERY_SQL = "websearch_to_tsquery('english', %s)"
+SEARCH_TEXT_SQL = "(g.title || ' ' || g.location)"
+SEARCH_RANK_SQL = f"(ts_rank(g.search_vector, {SEARCH_QUERY_SQL}, 32) + word_similarity(%s, {SEARCH_TEXT_SQL}))::float8"
+SEARCH_HIGHLIGHT_OPTIONS = "StartSel=<mark>, StopSel=</mark>"
+SEARCH_HIGHLIGHT_SQL = f"""
+    ts_headline('english', p.title, {SEARCH_QUERY_SQL}, '{SEARCH_HIGHLIGHT_OPTIONS}, HighlightAll=true') AS title_highlight,
+    ts_headline('english', p.location, {SEARCH_QUERY_SQL}, '{SEARCH_HIGHLIGHT_OPTIONS}, HighlightAll=true') AS location_highlight,
+    ts_headline('english', p.description, {SEARCH_QUERY_SQL},
+                '{SEARCH_HIGHLIGHT_OPTIONS}, MaxFragments=2, MaxWords=25, MinWords=8') AS description_highlight
+""".strip()
+
+# Shared listing pages: filters -> (games, ids on the page), per worker
+_games_list_cache = LRUCache(maxsize=settings.GAMES_LIST_CACHE_SIZE, ttl=settings.GAMES_LIST_CACHE_TTL)
+_games_list_flight = SingleFlight()
+_games_list_generation = 0  # bumped by every invalidation
 
 class GameService:
     """Service class for game-related operations"""
     
     @staticmethod
-    def create_game(game_data: CreateGameRequest, created_by: int) -> GameResponse:
-        """Create a new game"""
-        with DatabaseManager() as (cursor, conn):
+    async def create_game(game_data: CreateGameRequest, created_by: int, creator_verified: bool = False) -> GameResponse:
+        """Create a new game.
+
+        ``creator_verified`` means the caller already proved ``created_by`` is
+        an active user (a session token), so the users lookup is skipped; the
+        creator's name comes back from the insert itself.
+        """
+        async with AsyncDatabaseManager() as (cursor, conn):
             try:
-                # Verify the creator exists and is active
-                cursor.execute("""
-                    SELECT id, first_name, last_name FROM users 
-                    WHERE id = %s AND is_active = true
-                """, (created_by,))
-                creator = cursor.fetchone()
-                
-                if not creator:
-                    raise HTTPException(status_code=404, detail="Creator user not found or inactive")
+                if not creator_verified:
+                    # Verify the creator exists and is active
+                    await cursor.execute("""
+                        SELECT id FROM users 
+                        WHERE id = %s AND is_active = true
+                    """, (created_by,))
+                    if not cursor.fetchone():
+                        raise HTTPException(status_code=404, detail="Creator user not found or inactive")
                 
                 # Validate skill level range
                 if game_data.skill_level_min > game_data.skill_level_max:
@@ -35,23 +61,34 @@ class GameService:
                 
                 # Parse and validate datetime
                 try:
-                    datetime.fromisoformat(game_data.date_time.replace('Z', '+00:00'))
+                    game_datetime = datetime.fromisoformat(game_data.date_time.replace('Z', '+00:00'))
                 except ValueError:
                     raise HTTPException(status_code=400, detail="Invalid datetime format. Use ISO format (e.g., 2024-01-01T18:00:00Z)")
                 
-                # Insert the new game
-                cursor.execute("""
-                    INSERT INTO games (
-                        title, description, location, date_time, duration_minutes,
-                        max_players, skill_level_min, skill_level_max, created_by
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id, title, description, location, date_time, duration_minutes,
-                             max_players, skill_level_min, skill_level_max, status,
-                             created_by, created_at, updated_at
+                geohash = None
+                if game_data.latitude is not None:
+                    geohash = encode_geohash(game_data.latitude, game_data.longitude)
+                
+                # Insert the new game, reading the creator's name in the same statement
+                await cursor.execute("""
+                    WITH new_game AS (
+                        INSERT INTO games (
+                            title, description, location, date_time, duration_minutes,
+                            max_players, skill_level_min, skill_level_max, created_by,
+                            latitude, longitude, geohash
+                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                        RETURNING id, title, description, location, date_time, duration_minutes,
+                                 max_players, skill_level_min, skill_level_max, status,
+                                 created_by, created_at, updated_at, latitude, longitude
+                    )
+                    SELECT ng.*, u.first_name, u.last_name
+                    FROM new_game ng
+                    JOIN users u ON u.id = ng.created_by
                 """, (
                     game_data.title, game_data.description, game_data.location,
-                    game_data.date_time, game_data.duration_minutes, game_data.max_players,
-                    game_data.skill_level_min, game_data.skill_level_max, created_by
+                    game_datetime, game_data.duration_minutes, game_data.max_players,
+                    game_data.skill_level_min, game_data.skill_level_max, created_by,
+                    game_data.latitude, game_data.longitude, geohash
                 ))
                 
                 new_game = cursor.fetchone()
@@ -68,13 +105,15 @@ class GameService:
                     skill_level_max=new_game['skill_level_max'],
                     status=new_game['status'],
                     created_by=new_game['created_by'],
-                    creator_name=f"{creator['first_name']} {creator['last_name']}",
+                    creator_name=f"{new_game['first_name']} {new_game['last_name']}",
                     created_at=str(new_game['created_at']),
                     updated_at=str(new_game['updated_at']),
                     confirmed_players=0,
                     waitlisted_players=0,
                     user_status=None,
-                    user_waitlist_position=None
+                    user_waitlist_position=None,
+                    latitude=new_game['latitude'],
+                    longitude=new_game['longitude']
                 )
                 
             except HTTPException:
@@ -83,28 +122,133 @@ class GameService:
                 raise HTTPException(status_code=500, detail=f"Failed to create game: {str(e)}")
 
     @staticmethod
-    def get_games(
+    async def get_games(
         status: Optional[str] = "open",
         skill_min: Optional[int] = None,
         skill_max: Optional[int] = None,
         limit: Optional[int] = 20,
-        user_id: Optional[int] = None
+        user_id: Optional[int] = None,
+        page_cursor: Optional[str] = None,
+        near: Optional[Tuple[float, float]] = None,
+        radius_km: Optional[float] = None,
+        q: Optional[str] = None
     ) -> List[GameResponse]:
-        """Get list of available games"""
-        with DatabaseManager() as (cursor, conn):
+        """Get a page of available games ordered by (date_time, id).
+
+        Participant counts are read from the trigger-maintained counters on
+        games. ``page_cursor`` is the opaque token returned for the previous
+        page.
+
+        ``near`` restricts the listing to located games within ``radius_km``
+        of a ``(lat, lon)`` point (geohash index, see utils/geo.py). Without a
+        radius the caller's max_travel_distance is used, else the default.
+
+        ``q`` searches titles, locations and descriptions (full-text, plus
+        trigram matching for typos); results are then ordered by relevance
+        before (date_time, id) and carry ``<mark>``-highlighted snippets.
+
+        The page itself is shared by every caller asking for the same
+        filters: it is cached for GAMES_LIST_CACHE_TTL seconds and concurrent
+        misses share one query. The caller's status/waitlist position is
+        overlaid afterwards with one small indexed lookup.
+        """
+        limit = clamp_page_size(limit)
+        q = q.strip() if q else None
+        if page_cursor:
+            after = decode_ranked_cursor(page_cursor) if q else decode_cursor(page_cursor)
+        else:
+            after = None
+
+        # The default radius comes from the caller's preferences, so only then is the page per-user
+        radius_owner = user_id if near and radius_km is None else None
+        key = (status, skill_min, skill_max, limit, after, near, radius_km, q, radius_owner)
+
+        listing = _games_list_cache.get(key)
+        if listing is None:
+            generation = _games_list_generation
+
+            async def load():
+                games = await GameService._fetch_games(
+                    status, skill_min, skill_max, limit, after, near, radius_km, q, radius_owner
+                )
+                listing = (games, frozenset(game.id for game in games))
+                if generation == _games_list_generation:  # no write landed while we were querying
+                    _games_list_cache.set(key, listing)
+                return listing
+
+            listing = await _games_list_flight.do((generation, key), load)
+
+        games = listing[0]
+        if user_id is None or not games:
+            return games
+        return await GameService._overlay_user_status(games, user_id)
+
+    @staticmethod
+    def invalidate_listings(game_id: Optional[int] = None) -> None:
+        """Drop this worker's cached listings after a committed write.
+
+        With ``game_id`` only pages showing that game are dropped (its
+        counters moved); a new game can land on any page, so without one
+        everything goes. Other workers catch up within the TTL.
+        """
+        global _games_list_generation
+        _games_list_generation += 1
+        if game_id is None:
+            _games_list_cache.clear()
+        else:
+            _games_list_cache.invalidate_where(lambda listing: game_id in listing[1])
+
+    @staticmethod
+    def listing_cache_stats() -> dict:
+        return {**_games_list_cache.stats(), "coalesced": _games_list_flight.coalesced}
+
+    @staticmethod
+    async def _overlay_user_status(games: List[GameResponse], user_id: int) -> List[GameResponse]:
+        """Copy of a shared page with one user's participation filled in"""
+        async with AsyncDatabaseManager() as (cursor, conn):
+            # Ranks come from one ordered walk of idx_game_participants_waitlist_queue per game
+            # the user is waitlisted in, the same ROW_NUMBER() as get_game_participants
+            await cursor.execute("""
+                WITH mine AS (
+                    SELECT id, game_id, status
+                    FROM game_participants
+                    WHERE user_id = %s AND game_id = ANY(%s::int[])
+                ), queue AS (
+                    SELECT gp.id,
+                           ROW_NUMBER() OVER (PARTITION BY gp.game_id ORDER BY gp.queue_seq) AS waitlist_position
+                    FROM game_participants gp
+                    WHERE gp.status = 'waitlisted'
+                    AND gp.game_id IN (SELECT game_id FROM mine WHERE status = 'waitlisted')
+                )
+                SELECT mine.game_id, mine.status, queue.waitlist_position
+                FROM mine
+                LEFT JOIN queue ON queue.id = mine.id
+            """, (user_id, [game.id for game in games]))
+            mine = {row['game_id']: row for row in cursor.fetchall()}
+
+        return [
+            game.model_copy(update={
+                'user_status': mine[game.id]['status'],
+                'user_waitlist_position': mine[game.id]['waitlist_position']
+            }) if game.id in mine else game
+            for game in games
+        ]
+
+    @staticmethod
+    async def _fetch_games(
+        status: Optional[str],
+        skill_min: Optional[int],
+        skill_max: Optional[int],
+        limit: int,
+        after: Optional[tuple],
+        near: Optional[Tuple[float, float]],
+        radius_km: Optional[float],
+        q: Optional[str],
+        user_id: Optional[int]
+    ) -> List[GameResponse]:
+        """One shared page of games (no per-user fields); ``user_id`` only supplies a default radius"""
+        async with AsyncDatabaseManager() as (cursor, conn):
             try:
-                # Build query with optional filters
-                query = """
-                    SELECT g.id, g.title, g.description, g.location, g.date_time,
-                           g.duration_minutes, g.max_players, g.skill_level_min, g.skill_level_max,
-                           g.status, g.created_by, g.created_at, g.updated_at,
-                           u.first_name, u.last_name,
-                           (SELECT COUNT(*) FROM game_participants WHERE game_id = g.id AND status = 'confirmed') as confirmed_players,
-                           (SELECT COUNT(*) FROM game_participants WHERE game_id = g.id AND status = 'waitlisted') as waitlisted_players
-                    FROM games g
-                    JOIN users u ON g.created_by = u.id
-                """
-                
                 conditions = []
                 params = []
                 
@@ -120,44 +264,85 @@ class GameService:
                     conditions.append("g.skill_level_min <= %s")
                     params.append(skill_max)
                 
-                if conditions:
-                    query += " WHERE " + " AND ".join(conditions)
-                
-                query += " ORDER BY g.date_time ASC"
-                
-                if limit:
-                    query += f" LIMIT {limit}"
+                distance_column = "NULL::float8"
+                distance_params = []
+                if near:
+                    if radius_km is None:
+                        radius_km = settings.DEFAULT_SEARCH_RADIUS_KM
+                        if user_id is not None:
+                            await cursor.execute(
+                                "SELECT max_travel_distance FROM user_preferences WHERE user_id = %s",
+                                (user_id,)
+                            )
+                            prefs = cursor.fetchone()
+                            if prefs and prefs['max_travel_distance'] is not None:
+                                radius_km = float(prefs['max_travel_distance'])
+                    condition, condition_params = radius_condition(near[0], near[1], radius_km)
+                    conditions.append(condition)
+                    params.extend(condition_params)
+                    distance_column = distance_sql()
+                    distance_params = [near[0], near[0], near[1]]
+                
+                rank_column = "NULL::float8"
+                rank_params = []
+                highlight_columns = "NULL AS title_highlight, NULL AS location_highlight, NULL AS description_highlight"
+                highlight_params = []
+                page_order = "g.date_time ASC, g.id ASC"
+                result_order = "p.date_time ASC, p.id ASC"
+                if q:
+                    # Threshold for the indexed <% fuzzy operator, local to this transaction
+                    await cursor.execute(
+                        "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                        (str(settings.SEARCH_SIMILARITY_THRESHOLD),)
+                    )
+                    conditions.append(f"(g.search_vector @@ {SEARCH_QUERY_SQL} OR %s <%% {SEARCH_TEXT_SQL})")
+                    params.extend([q, q])
+                    rank_column = SEARCH_RANK_SQL
+                    rank_params = [q, q]
+                    highlight_columns = SEARCH_HIGHLIGHT_SQL
+                    highlight_params = [q, q, q]
+                    page_order = "search_rank DESC, " + page_order
+                    result_order = "p.search_rank DESC, " + result_order
+                
+                if after:
+                    if q:
+                        # Relevance first: (-rank, date_time, id) ascending
+                        conditions.append(f"(-{SEARCH_RANK_SQL}, g.date_time, g.id) > (%s, %s, %s)")
+                        params.extend([q, q, -after[0], after[1], after[2]])
+                    else:
+                        conditions.append("(g.date_time, g.id) > (%s, %s)")
+                        params.extend(after)
+                
+                where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+                params = distance_params + rank_params + params
+                params.append(limit)
+                params.extend(highlight_params)
+                
+                query = f"""
+                    WITH page AS (
+                        SELECT g.id, g.title, g.description, g.location, g.date_time,
+                               g.duration_minutes, g.max_players, g.skill_level_min, g.skill_level_max,
+                               g.status, g.created_by, g.created_at, g.updated_at,
+                               g.confirmed_players, g.waitlisted_players,
+                               g.latitude, g.longitude, {distance_column} AS distance_km,
+                               {rank_column} AS search_rank
+                        FROM games g
+                        {where_clause}
+                        ORDER BY {page_order}
+                        LIMIT %s
+                    )
+                    SELECT p.*, u.first_name, u.last_name,
+                           {highlight_columns}
+                    FROM page p
+                    JOIN users u ON p.created_by = u.id
+                    ORDER BY {result_order}
+                """
                 
-                cursor.execute(query, params)
+                await cursor.execute(query, params)
                 games = cursor.fetchall()
                 
-                result = []
-                for game in games:
-                    # Check user's participation status if user_id provided
-                    user_status = None
-                    user_waitlist_position = None
-                    
-                    if user_id:
-                        cursor.execute("""
-                            SELECT status, joined_at FROM game_participants 
-                            WHERE game_id = %s AND user_id = %s
-                        """, (game['id'], user_id))
-                        participation = cursor.fetchone()
-                        
-                        if participation:
-                            user_status = participation['status']
-                            
-                            # Get waitlist position if waitlisted
-                            if user_status == 'waitlisted':
-                                cursor.execute("""
-                                    SELECT COUNT(*) + 1 as position
-                                    FROM game_participants 
-                                    WHERE game_id = %s AND status = 'waitlisted' AND joined_at < %s
-                                """, (game['id'], participation['joined_at']))
-                                position_result = cursor.fetchone()
-                                user_waitlist_position = position_result['position'] if position_result else None
-                    
-                    result.append(GameResponse(
+                return [
+                    GameResponse(
                         id=game['id'],
                         title=game['title'],
                         description=game['description'],
@@ -174,24 +359,56 @@ class GameService:
                         updated_at=str(game['updated_at']),
                         confirmed_players=game['confirmed_players'],
                         waitlisted_players=game['waitlisted_players'],
-                        user_status=user_status,
-                        user_waitlist_position=user_waitlist_position
-                    ))
-                
-                return result
+                        latitude=game['latitude'],
+                        longitude=game['longitude'],
+                        distance_km=round(game['distance_km'], 2) if game['distance_km'] is not None else None,
+                        search_rank=game['search_rank'],
+                        highlights={
+                            field: game[f'{field}_highlight']
+                            for field in ('title', 'location', 'description')
+                            if game[f'{field}_highlight'] is not None
+                        } if q else None
+                    )
+                    for game in games
+                ]
                 
+            except HTTPException:
+                raise
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Failed to fetch games: {str(e)}")
 
     @staticmethod
-    def join_game(game_id: int, request: JoinGameRequest, user_id: int) -> dict:
-        """Join a game (confirmed or waitlisted based on availability)"""
-        with DatabaseManager() as (cursor, conn):
+    async def join_game(
+        game_id: int, request: JoinGameRequest, user_id: int, skill_level: Optional[int] = None
+    ) -> dict:
+        """Join a game (confirmed or waitlisted based on availability).
+
+        Admission holds a row lock on this game only (``SELECT ... FOR UPDATE``),
+        so concurrent joins for the same game are serialized while joins for
+        other games proceed in parallel. Under the lock the trigger-maintained
+        counters are exact, which rules out the count-then-insert race.
+
+        ``skill_level`` from a verified session token skips the users lookup.
+        """
+        async with AsyncDatabaseManager() as (cursor, conn):
             try:
-                # Check if game exists and is open
-                cursor.execute("""
-                    SELECT id, title, max_players, status, skill_level_min, skill_level_max
+                if skill_level is None:
+                    # Check if user exists and get their skill level (before taking the game lock)
+                    await cursor.execute("""
+                        SELECT id, skill_level FROM users WHERE id = %s AND is_active = true
+                    """, (user_id,))
+                    user = cursor.fetchone()
+                    
+                    if not user:
+                        raise HTTPException(status_code=404, detail="User not found")
+                    skill_level = user['skill_level']
+                
+                # Check if game exists and is open, locking its row for the admission decision
+                await cursor.execute("""
+                    SELECT id, title, max_players, status, skill_level_min, skill_level_max,
+                           confirmed_players, waitlisted_players
                     FROM games WHERE id = %s
+                    FOR UPDATE
                 """, (game_id,))
                 game = cursor.fetchone()
                 
@@ -201,24 +418,15 @@ class GameService:
                 if game['status'] != 'open':
                     raise HTTPException(status_code=400, detail="Game is not open for registration")
                 
-                # Check if user exists and get their skill level
-                cursor.execute("""
-                    SELECT id, skill_level FROM users WHERE id = %s AND is_active = true
-                """, (user_id,))
-                user = cursor.fetchone()
-                
-                if not user:
-                    raise HTTPException(status_code=404, detail="User not found")
-                
                 # Check skill level compatibility
-                if not (game['skill_level_min'] <= user['skill_level'] <= game['skill_level_max']):
+                if not (game['skill_level_min'] <= skill_level <= game['skill_level_max']):
                     raise HTTPException(
                         status_code=400, 
-                        detail=f"Your skill level ({user['skill_level']}) doesn't match game requirements ({game['skill_level_min']}-{game['skill_level_max']})"
+                        detail=f"Your skill level ({skill_level}) doesn't match game requirements ({game['skill_level_min']}-{game['skill_level_max']})"
                     )
                 
                 # Check if user is already in this game
-                cursor.execute("""
+                await cursor.execute("""
                     SELECT status FROM game_participants 
                     WHERE game_id = %s AND user_id = %s
                 """, (game_id, user_id))
@@ -227,19 +435,11 @@ class GameService:
                 if existing:
                     raise HTTPException(status_code=400, detail=f"You are already {existing['status']} for this game")
                 
-                # Count confirmed players
-                cursor.execute("""
-                    SELECT COUNT(*) as confirmed_count 
-                    FROM game_participants 
-                    WHERE game_id = %s AND status = 'confirmed'
-                """, (game_id,))
-                confirmed_count = cursor.fetchone()['confirmed_count']
-                
-                # Determine status (confirmed or waitlisted)
-                status = 'confirmed' if confirmed_count < game['max_players'] else 'waitlisted'
+                # Determine status (confirmed or waitlisted) from the counters read under the lock
+                status = 'confirmed' if game['confirmed_players'] < game['max_players'] else 'waitlisted'
                 
                 # Insert participant
-                cursor.execute("""
+                await cursor.execute("""
                     INSERT INTO game_participants (game_id, user_id, status, position_preference)
                     VALUES (%s, %s, %s, %s)
                     RETURNING id, status, joined_at
@@ -247,15 +447,9 @@ class GameService:
                 
                 participant = cursor.fetchone()
                 
-                # Get waitlist position if waitlisted
-                waitlist_position = None
-                if status == 'waitlisted':
-                    cursor.execute("""
-                        SELECT COUNT(*) + 1 as position
-                        FROM game_participants 
-                        WHERE game_id = %s AND status = 'waitlisted' AND joined_at < %s
-                    """, (game_id, participant['joined_at']))
-                    waitlist_position = cursor.fetchone()['position']
+                # New waitlisted players go to the back of the queue: queue_seq is
+                # assigned on insert while we hold the game lock
+                waitlist_position = game['waitlisted_players'] + 1 if status == 'waitlisted' else None
                 
                 return {
                     "message": f"Successfully {'joined' if status == 'confirmed' else 'added to waitlist for'} {game['title']}",
@@ -267,16 +461,29 @@ class GameService:
                 
             except HTTPException:
                 raise
+            except asyncpg.CheckViolationError:
+                # Capacity guard in the counter trigger (07_enforce_game_capacity.sql)
+                raise HTTPException(status_code=409, detail="Game filled up while joining, please try again")
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Failed to join game: {str(e)}")
 
     @staticmethod
-    def leave_game(game_id: int, user_id: int) -> dict:
+    async def leave_game(game_id: int, user_id: int) -> dict:
         """Leave a game"""
-        with DatabaseManager() as (cursor, conn):
+        async with AsyncDatabaseManager() as (cursor, conn):
             try:
+                # Lock the game row first so leave/promotion and joins for this game
+                # take their locks in the same order
+                await cursor.execute("SELECT status FROM games WHERE id = %s FOR UPDATE", (game_id,))
+                game = cursor.fetchone()
+                if not game:
+                    raise HTTPException(status_code=404, detail="Game not found")
+                # Finished games keep their roster: teams and ratings are replayed from it
+                if game['status'] not in ('open', 'full'):
+                    raise HTTPException(status_code=400, detail=f"Cannot leave a game that is {game['status']}")
+                
                 # Check if user is in this game
-                cursor.execute("""
+                await cursor.execute("""
                     SELECT gp.id, gp.status, g.title
                     FROM game_participants gp
                     JOIN games g ON gp.game_id = g.id
@@ -288,7 +495,7 @@ class GameService:
                     raise HTTPException(status_code=404, detail="You are not registered for this game")
                 
                 # Delete the participation (trigger will handle waitlist promotion)
-                cursor.execute("""
+                await cursor.execute("""
                     DELETE FROM game_participants 
                     WHERE game_id = %s AND user_id = %s
                 """, (game_id, user_id))
@@ -305,27 +512,32 @@ class GameService:
                 raise HTTPException(status_code=500, detail=f"Failed to leave game: {str(e)}")
 
     @staticmethod
-    def get_game_participants(game_id: int) -> GameParticipantsResponse:
+    async def get_game_participants(game_id: int) -> GameParticipantsResponse:
         """Get all participants for a game"""
-        with DatabaseManager() as (cursor, conn):
+        async with AsyncDatabaseManager() as (cursor, conn):
             try:
                 # Check if game exists
-                cursor.execute("SELECT id FROM games WHERE id = %s", (game_id,))
+                await cursor.execute("SELECT id FROM games WHERE id = %s", (game_id,))
                 if not cursor.fetchone():
                     raise HTTPException(status_code=404, detail="Game not found")
                 
                 # Get all participants with user details
-                cursor.execute("""
+                await cursor.execute("""
                     SELECT gp.id, gp.user_id, gp.status, gp.position_preference, gp.joined_at,
-                           u.username, u.first_name, u.last_name, u.skill_level
+                           u.username, u.first_name, u.last_name, u.skill_level,
+                           u.preferred_position, u.playing_style, u.age_range, pr.rating,
+                           CASE WHEN gp.status = 'waitlisted' THEN
+                               ROW_NUMBER() OVER (PARTITION BY gp.status ORDER BY gp.queue_seq)
+                           END AS waitlist_position
                     FROM game_participants gp
                     JOIN users u ON gp.user_id = u.id
+                    LEFT JOIN player_ratings pr ON pr.user_id = gp.user_id
                     WHERE gp.game_id = %s
                     ORDER BY 
                         CASE WHEN gp.status = 'confirmed' THEN 1 
                              WHEN gp.status = 'waitlisted' THEN 2 
                              ELSE 3 END,
-                        gp.joined_at ASC
+                        gp.queue_seq ASC
                 """, (game_id,))
                 
                 participants = cursor.fetchall()
@@ -341,9 +553,14 @@ class GameService:
                         first_name=p['first_name'],
                         last_name=p['last_name'],
                         skill_level=p['skill_level'],
+                        preferred_position=p['preferred_position'],
+                        playing_style=p['playing_style'],
+                        age_range=p['age_range'],
                         status=p['status'],
                         position_preference=p['position_preference'],
-                        joined_at=str(p['joined_at'])
+                        joined_at=str(p['joined_at']),
+                        waitlist_position=p['waitlist_position'],
+                        rating=p['rating']
                     )
                     
                     if p['status'] == 'confirmed':
@@ -365,12 +582,20 @@ class GameService:
                 raise HTTPException(status_code=500, detail=f"Failed to fetch participants: {str(e)}")
 
     @staticmethod
-    def get_user_games(user_id: int, status: Optional[str] = None) -> List[dict]:
-        """Get games for a specific user"""
-        with DatabaseManager() as (cursor, conn):
+    async def get_user_games(
+        user_id: int,
+        status: Optional[str] = None,
+        limit: Optional[int] = 20,
+        page_cursor: Optional[str] = None
+    ) -> List[dict]:
+        """Get a page of games for a specific user ordered by (date_time, id)"""
+        limit = clamp_page_size(limit)
+        after = decode_cursor(page_cursor) if page_cursor else None
+        
+        async with AsyncDatabaseManager() as (cursor, conn):
             try:
                 # Check if user exists
-                cursor.execute("SELECT id FROM users WHERE id = %s", (user_id,))
+                await cursor.execute("SELECT id FROM users WHERE id = %s", (user_id,))
                 if not cursor.fetchone():
                     raise HTTPException(status_code=404, detail="User not found")
                 
@@ -379,6 +604,7 @@ class GameService:
                     SELECT g.id, g.title, g.description, g.location, g.date_time, g.duration_minutes,
                            g.max_players, g.skill_level_min, g.skill_level_max, g.status,
                            g.created_by, g.created_at, g.updated_at,
+                           g.confirmed_players, g.waitlisted_players,
                            u.first_name, u.last_name,
                            gp.status as user_status, gp.position_preference, gp.joined_at
                     FROM games g
@@ -393,9 +619,15 @@ class GameService:
                     query += " AND gp.status = %s"
                     params.append(status)
                 
-                query += " ORDER BY g.date_time ASC"
+                # gp.game_date_time mirrors g.date_time so (user_id, game_date_time, game_id) serves each page
+                if after:
+                    query += " AND (gp.game_date_time, gp.game_id) > (%s, %s)"
+                    params.extend(after)
+                
+                query += " ORDER BY gp.game_date_time ASC, gp.game_id ASC LIMIT %s"
+                params.append(limit)
                 
-                cursor.execute(query, params)
+                await cursor.execute(query, params)
                 user_games = cursor.fetchall()
                 
                 return [
@@ -414,7 +646,9 @@ class GameService:
                             created_by=game['created_by'],
                             creator_name=f"{game['first_name']} {game['last_name']}",
                             created_at=str(game['created_at']),
-                            updated_at=str(game['updated_at'])
+                            updated_at=str(game['updated_at']),
+                            confirmed_players=game['confirmed_players'],
+                            waitlisted_players=game['waitlisted_players']
                         ),
                         "participation": {
                             "status": game['user_status'],
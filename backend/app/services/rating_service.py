@@ -0,0 +1,119 @@
+"""
+Player rating business logic
+"""
+from fastapi import HTTPException
+
+from ..algorithms import initial_rating, rate_game
+from ..core import AsyncDatabaseManager
+from ..models import GameResultRequest, GameResultResponse, PlayerRatingChange
+from .chemistry_service import ChemistryService
+
+class RatingService:
+    """Service class for recording results and updating player ratings"""
+
+    @staticmethod
+    async def record_result(game_id: int, user_id: int, result: GameResultRequest) -> GameResultResponse:
+        """Record a game's final score, mark it completed and re-rate its players.
+
+        Only the players of this game are touched: their rating rows are
+        locked (in user_id order, so concurrent results sharing players
+        cannot deadlock) and moved by one Elo update, and their teammate
+        pairs are added to the chemistry matrix.
+        """
+        async with AsyncDatabaseManager() as (cursor, conn):
+            await cursor.execute(
+                "SELECT created_by, status FROM games WHERE id = %s FOR UPDATE", (game_id,)
+            )
+            game = cursor.fetchone()
+            if not game:
+                raise HTTPException(status_code=404, detail="Game not found")
+            if game['created_by'] != user_id:
+                raise HTTPException(status_code=403, detail="Only the game creator can record the result")
+            if game['status'] == 'cancelled':
+                raise HTTPException(status_code=400, detail="Cannot record a result for a cancelled game")
+
+            await cursor.execute("SELECT 1 FROM game_results WHERE game_id = %s", (game_id,))
+            if cursor.fetchone():
+                raise HTTPException(status_code=409, detail="A result has already been recorded for this game")
+
+            await cursor.execute("""
+                SELECT ta.user_id, ta.team, u.skill_level
+                FROM team_assignments ta
+                JOIN users u ON u.id = ta.user_id
+                JOIN game_participants gp
+                    ON gp.game_id = ta.game_id AND gp.user_id = ta.user_id AND gp.status = 'confirmed'
+                WHERE ta.game_id = %s
+                ORDER BY ta.user_id
+            """, (game_id,))
+            assigned = cursor.fetchall()
+            teams = {row['team'] for row in assigned}
+            if teams != {'A', 'B'}:
+                raise HTTPException(status_code=400, detail="Generate teams before recording a result")
+
+            # First rated game: seed the rating from the self-reported skill level
+            await cursor.execute("""
+                INSERT INTO player_ratings (user_id, rating)
+                SELECT * FROM unnest(%s::int[], %s::float8[])
+                ON CONFLICT (user_id) DO NOTHING
+            """, (
+                [row['user_id'] for row in assigned],
+                [initial_rating(row['skill_level']) for row in assigned]
+            ))
+
+            await cursor.execute("""
+                SELECT user_id, rating, games_rated
+                FROM player_ratings
+                WHERE user_id = ANY(%s::int[])
+                ORDER BY user_id
+                FOR UPDATE
+            """, ([row['user_id'] for row in assigned],))
+            current = {row['user_id']: row for row in cursor.fetchall()}
+
+            team_a = [current[row['user_id']] for row in assigned if row['team'] == 'A']
+            team_b = [current[row['user_id']] for row in assigned if row['team'] == 'B']
+            delta_a, delta_b = rate_game(
+                [p['rating'] for p in team_a], [p['games_rated'] for p in team_a],
+                [p['rating'] for p in team_b], [p['games_rated'] for p in team_b],
+                result.team_a_score, result.team_b_score
+            )
+
+            changes = [
+                PlayerRatingChange(
+                    user_id=p['user_id'],
+                    team=team,
+                    rating_before=p['rating'],
+                    rating_after=p['rating'] + float(delta),
+                    games_rated=p['games_rated'] + 1
+                )
+                for team, players, deltas in (('A', team_a, delta_a), ('B', team_b, delta_b))
+                for p, delta in zip(players, deltas)
+            ]
+
+            await cursor.execute("""
+                UPDATE player_ratings pr
+                SET rating = v.rating,
+                    games_rated = pr.games_rated + 1,
+                    last_game_id = %s,
+                    updated_at = CURRENT_TIMESTAMP
+                FROM unnest(%s::int[], %s::float8[]) AS v(user_id, rating)
+                WHERE pr.user_id = v.user_id
+            """, (game_id, [c.user_id for c in changes], [c.rating_after for c in changes]))
+
+            await ChemistryService.record_game(
+                cursor, game_id,
+                [c.user_id for c in changes if c.team == 'A'], [c.user_id for c in changes if c.team == 'B'],
+                result.team_a_score, result.team_b_score
+            )
+
+            await cursor.execute("""
+                INSERT INTO game_results (game_id, team_a_score, team_b_score, recorded_by)
+                VALUES (%s, %s, %s, %s)
+            """, (game_id, result.team_a_score, result.team_b_score, user_id))
+            await cursor.execute("UPDATE games SET status = 'completed' WHERE id = %s", (game_id,))
+
+            return GameResultResponse(
+                game_id=game_id,
+                team_a_score=result.team_a_score,
+                team_b_score=result.team_b_score,
+                rating_changes=changes
+            )
@@ -0,0 +1,127 @@
+"""
+Game recommendation business logic
+"""
+from fastapi import HTTPException
+from typing import List
+
+from ..core import AsyncDatabaseManager, settings
+from ..models import RecommendedGameResponse
+from ..utils.geo import radius_condition
+from ..utils.pagination import clamp_page_size
+
+ALL_DAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+ALL_TIMES = ['morning', 'afternoon', 'evening']
+DEFAULT_SKILL_RANGE = (-2, 2)
+
+# Ranking weights: day match, time match, skill fit, remaining capacity
+RECOMMENDATION_WEIGHTS = {'day': 0.35, 'time': 0.25, 'skill': 0.25, 'capacity': 0.15}
+
+class RecommendationService:
+    """Service class for preference-driven game recommendations"""
+
+    @staticmethod
+    async def get_recommended_games(user_id: int, limit: int = 20) -> List[RecommendedGameResponse]:
+        """Rank upcoming open games for a user by their saved preferences.
+
+        Candidates are open games on a preferred day or in a preferred time
+        bucket whose skill range overlaps the user's auto-join window - both
+        served by partial indexes on games (13_add_game_recommendation_indexes.sql).
+        Games the user has already joined are left out, as are located games
+        further than max_travel_distance from a user with a home location.
+        """
+        limit = clamp_page_size(limit)
+
+        async with AsyncDatabaseManager() as (cursor, conn):
+            await cursor.execute("""
+                SELECT u.skill_level, u.latitude, u.longitude,
+                       up.preferred_days, up.preferred_times, up.auto_join_skill_range, up.max_travel_distance
+                FROM users u
+                LEFT JOIN user_preferences up ON up.user_id = u.id
+                WHERE u.id = %s AND u.is_active = true
+            """, (user_id,))
+            user = cursor.fetchone()
+            if not user:
+                raise HTTPException(status_code=404, detail="User not found")
+
+            # No preference on an axis means every value matches it
+            days = user['preferred_days'] or ALL_DAYS
+            times = user['preferred_times'] or ALL_TIMES
+            low_offset, high_offset = user['auto_join_skill_range'] or DEFAULT_SKILL_RANGE
+            skill = user['skill_level']
+            window_min = max(settings.MIN_SKILL_LEVEL, skill + low_offset)
+            window_max = min(settings.MAX_SKILL_LEVEL, skill + high_offset)
+
+            # Games without coordinates can't be ruled out on distance
+            travel_clause = ""
+            travel_params = []
+            if user['latitude'] is not None and user['max_travel_distance'] is not None:
+                condition, travel_params = radius_condition(
+                    user['latitude'], user['longitude'], float(user['max_travel_distance'])
+                )
+                travel_clause = f"AND (g.geohash IS NULL OR ({condition}))"
+
+            weights = RECOMMENDATION_WEIGHTS
+            await cursor.execute(f"""
+                WITH candidates AS (
+                    SELECT g.id, g.title, g.description, g.location, g.date_time,
+                           g.duration_minutes, g.max_players, g.skill_level_min, g.skill_level_max,
+                           g.status, g.created_by, g.created_at, g.updated_at,
+                           g.confirmed_players, g.waitlisted_players,
+                           g.day_of_week = ANY(%s::text[]) AS day_match,
+                           g.time_bucket = ANY(%s::text[]) AS time_match,
+                           %s::int BETWEEN g.skill_level_min AND g.skill_level_max AS skill_match
+                    FROM games g
+                    WHERE g.status = 'open'
+                    AND g.date_time > CURRENT_TIMESTAMP
+                    AND (g.day_of_week = ANY(%s::text[]) OR g.time_bucket = ANY(%s::text[]))
+                    AND g.skill_level_min <= %s AND g.skill_level_max >= %s
+                    AND NOT EXISTS (
+                        SELECT 1 FROM game_participants gp WHERE gp.game_id = g.id AND gp.user_id = %s
+                    )
+                    {travel_clause}
+                )
+                SELECT c.*, u.first_name, u.last_name,
+                       GREATEST(c.max_players - c.confirmed_players, 0) AS spots_left,
+                       %s::float8 * c.day_match::int
+                       + %s::float8 * c.time_match::int
+                       + %s::float8 * CASE WHEN c.skill_match THEN 1.0 ELSE 0.5 END
+                       + %s::float8 * GREATEST(c.max_players - c.confirmed_players, 0)::float / c.max_players
+                       AS score
+                FROM candidates c
+                JOIN users u ON u.id = c.created_by
+                ORDER BY score DESC, c.date_time ASC, c.id ASC
+                LIMIT %s
+            """, (
+                days, times, skill,
+                days, times, window_max, window_min, user_id, *travel_params,
+                weights['day'], weights['time'], weights['skill'], weights['capacity'],
+                limit
+            ))
+            games = cursor.fetchall()
+
+        return [
+            RecommendedGameResponse(
+                id=game['id'],
+                title=game['title'],
+                description=game['description'],
+                location=game['location'],
+                date_time=str(game['date_time']),
+                duration_minutes=game['duration_minutes'],
+                max_players=game['max_players'],
+                skill_level_min=game['skill_level_min'],
+                skill_level_max=game['skill_level_max'],
+                status=game['status'],
+                created_by=game['created_by'],
+                creator_name=f"{game['first_name']} {game['last_name']}",
+                created_at=str(game['created_at']),
+                updated_at=str(game['updated_at']),
+                confirmed_players=game['confirmed_players'],
+                waitlisted_players=game['waitlisted_players'],
+                recommendation_score=round(float(game['score']) * 100, 1),
+                day_match=game['day_match'],
+                time_match=game['time_match'],
+                skill_match=game['skill_match'],
+                spots_left=game['spots_left']
+            )
+            for game in games
+        ]
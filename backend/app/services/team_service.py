@@ -0,0 +1,373 @@
+"""
+Team generation business logic
+"""
+import asyncio
+import json
+import logging
+from fastapi import HTTPException
+from typing import Dict, List, Optional
+
+from ..algorithms import ChemistryMatrix, Player, TeamBalancer, MIN_PLAYERS_FOR_TEAMS, get_search_pool
+from ..core import AsyncDatabaseManager, settings
+from ..models import ParticipantResponse, TeamPlayerResponse, TeamsResponse
+from ..utils.cache import LRUCache
+from .chemistry_service import ChemistryService
+from .game_service import GameService
+
+logger = logging.getLogger(__name__)
+
+# game_id -> (game_teams.version, TeamsResponse); entries are only served while the
+# stored version still matches, so invalidation in other workers is not required
+_team_sheet_cache = LRUCache(maxsize=512)
+
+class TeamService:
+    """Service class for team balancing operations"""
+
+    @staticmethod
+    def players_from_participants(participants: List[ParticipantResponse]) -> List[Player]:
+        """Convert confirmed participants into balancer players"""
+        return [
+            Player(
+                id=p.user_id,
+                username=p.username,
+                first_name=p.first_name,
+                last_name=p.last_name,
+                skill_level=p.skill_level,
+                preferred_position=p.preferred_position,
+                playing_style=p.playing_style,
+                age_range=p.age_range,
+                position_preference=p.position_preference,
+                rating=p.rating
+            )
+            for p in participants
+        ]
+
+    @staticmethod
+    async def load_confirmed_players(cursor, game_id: int) -> List[Player]:
+        """Confirmed roster of a game as balancer players, read on the caller's connection"""
+        await cursor.execute("""
+            SELECT gp.user_id, gp.position_preference,
+                   u.username, u.first_name, u.last_name, u.skill_level,
+                   u.preferred_position, u.playing_style, u.age_range, pr.rating::float8 AS rating
+            FROM game_participants gp
+            JOIN users u ON gp.user_id = u.id
+            LEFT JOIN player_ratings pr ON pr.user_id = gp.user_id
+            WHERE gp.game_id = %s AND gp.status = 'confirmed'
+            ORDER BY gp.queue_seq ASC
+        """, (game_id,))
+        return [
+            Player(
+                id=row['user_id'],
+                username=row['username'],
+                first_name=row['first_name'],
+                last_name=row['last_name'],
+                skill_level=row['skill_level'],
+                preferred_position=row['preferred_position'],
+                playing_style=row['playing_style'],
+                age_range=row['age_range'],
+                position_preference=row['position_preference'],
+                rating=row['rating']
+            )
+            for row in cursor.fetchall()
+        ]
+
+    @staticmethod
+    def build_response(game_id: int, result: Dict) -> TeamsResponse:
+        """Shape a balancer result as an API response"""
+        def team_players(team: List[Player]) -> List[TeamPlayerResponse]:
+            return [
+                TeamPlayerResponse(
+                    user_id=p.id,
+                    username=p.username,
+                    first_name=p.first_name,
+                    last_name=p.last_name,
+                    skill_level=p.skill_level,
+                    preferred_position=p.preferred_position,
+                    playing_style=p.playing_style,
+                    age_range=p.age_range,
+                    assigned_position=result['assigned_positions'][p.id]
+                )
+                for p in sorted(team, key=lambda p: -p.skill_level)
+            ]
+
+        return TeamsResponse(
+            game_id=game_id,
+            team_a=team_players(result['team_a']),
+            team_b=team_players(result['team_b']),
+            balance_score=round(result['balance_score'], 2),
+            balance_details={k: round(v, 2) for k, v in result['balance_details'].items()},
+            algorithm_version=result['algorithm_version'],
+            swaps_evaluated=result['swaps_evaluated'],
+            seed=result.get('seed'),
+            restarts_completed=result.get('restarts_completed', 0)
+        )
+
+    @staticmethod
+    def balancer(chemistry: Optional[ChemistryMatrix] = None, replay_restarts: Optional[int] = None) -> TeamBalancer:
+        """Balancer configured for multi-start search on the shared process pool.
+
+        With ``replay_restarts`` it runs exactly that many restarts and no time
+        budget, so a seed gives the same teams however busy the pool is.
+        """
+        if replay_restarts is not None:
+            restarts, time_budget = replay_restarts, None
+        else:
+            restarts, time_budget = settings.TEAM_SEARCH_RESTARTS, settings.TEAM_SEARCH_TIME_BUDGET
+        return TeamBalancer(
+            restarts=restarts,
+            time_budget=time_budget,
+            executor=get_search_pool(settings.TEAM_SEARCH_WORKERS),
+            chemistry=chemistry
+        )
+
+    @staticmethod
+    async def generate_teams(
+        game_id: int, user_id: int, seed: Optional[int] = None, restarts: Optional[int] = None
+    ) -> TeamsResponse:
+        """Generate balanced teams from a game's confirmed roster (creator only).
+
+        ``seed`` plus the ``restarts`` completed by the run being reproduced
+        (default TEAM_SEARCH_RESTARTS) replays that run exactly.
+        """
+        replay_restarts = None
+        if seed is not None:
+            replay_restarts = settings.TEAM_SEARCH_RESTARTS if restarts is None else restarts
+            if not 0 <= replay_restarts <= settings.TEAM_SEARCH_RESTARTS:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"restarts must be between 0 and {settings.TEAM_SEARCH_RESTARTS}"
+                )
+        elif restarts is not None:
+            raise HTTPException(status_code=400, detail="restarts is only used together with seed")
+
+        async with AsyncDatabaseManager() as (cursor, conn):
+            await cursor.execute("SELECT created_by, roster_version FROM games WHERE id = %s", (game_id,))
+            game = cursor.fetchone()
+
+        if not game:
+            raise HTTPException(status_code=404, detail="Game not found")
+        if game['created_by'] != user_id:
+            raise HTTPException(status_code=403, detail="Only the game creator can generate teams")
+
+        roster = await GameService.get_game_participants(game_id)
+        if len(roster.confirmed) < MIN_PLAYERS_FOR_TEAMS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Need at least {MIN_PLAYERS_FOR_TEAMS} confirmed players to generate teams"
+            )
+
+        players = TeamService.players_from_participants(roster.confirmed)
+        async with AsyncDatabaseManager() as (cursor, conn):
+            chemistry = await ChemistryService.load_for_roster(cursor, [p.id for p in players])
+
+        try:
+            # CPU-bound search waits on worker processes; keep it off the event loop
+            result = await asyncio.to_thread(
+                TeamService.balancer(chemistry, replay_restarts).generate_balanced_teams, players, seed
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        async with AsyncDatabaseManager() as (cursor, conn):
+            # The roster version read before the roster: if it moved meanwhile, the
+            # next read of the team sheet sees a mismatch and rebalances
+            version = await TeamService.save_teams(
+                cursor, game_id, result, target_score=result['balance_score'],
+                roster_version=game['roster_version']
+            )
+
+        response = TeamService.build_response(game_id, result)
+        response.version = version
+        return response
+
+    @staticmethod
+    async def save_teams(cursor, game_id: int, result: Dict, target_score: float, roster_version: int) -> int:
+        """Replace a game's stored teams with a balancer result; returns the new sheet version"""
+        await cursor.execute("""
+            INSERT INTO game_teams (
+                game_id, balance_score, target_score, balance_details, algorithm_version, seed,
+                restarts_completed, roster_version
+            )
+            VALUES (%s, %s, %s, %s::jsonb, %s, %s, %s, %s)
+            ON CONFLICT (game_id) DO UPDATE SET
+                balance_score = EXCLUDED.balance_score,
+                target_score = EXCLUDED.target_score,
+                balance_details = EXCLUDED.balance_details,
+                algorithm_version = EXCLUDED.algorithm_version,
+                seed = EXCLUDED.seed,
+                restarts_completed = EXCLUDED.restarts_completed,
+                roster_version = EXCLUDED.roster_version,
+                version = game_teams.version + 1,
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING version
+        """, (
+            game_id, round(result['balance_score'], 2), round(target_score, 2),
+            json.dumps(result['balance_details']), result['algorithm_version'], result.get('seed'),
+            result.get('restarts_completed', 0), roster_version
+        ))
+        version = cursor.fetchone()['version']
+        _team_sheet_cache.invalidate(game_id)
+
+        user_ids, teams, positions = [], [], []
+        for team, players in (('A', result['team_a']), ('B', result['team_b'])):
+            for p in players:
+                user_ids.append(p.id)
+                teams.append(team)
+                positions.append(result['assigned_positions'][p.id])
+
+        await cursor.execute("DELETE FROM team_assignments WHERE game_id = %s", (game_id,))
+        await cursor.execute("""
+            INSERT INTO team_assignments (game_id, user_id, team, assigned_position)
+            SELECT %s, t.user_id, t.team, t.assigned_position
+            FROM unnest(%s::int[], %s::char(1)[], %s::varchar[]) AS t(user_id, team, assigned_position)
+        """, (game_id, user_ids, teams, positions))
+        return version
+
+    @staticmethod
+    async def get_teams(game_id: int) -> TeamsResponse:
+        """Stored team sheet for a game.
+
+        Served from the per-worker cache while the stored sheet version is
+        unchanged; a sheet computed for an older confirmed roster is first
+        rebalanced incrementally (never a full solve).
+        """
+        for _ in range(2):
+            async with AsyncDatabaseManager() as (cursor, conn):
+                await cursor.execute("""
+                    SELECT g.roster_version, gt.version, gt.roster_version AS teams_roster_version
+                    FROM games g
+                    LEFT JOIN game_teams gt ON gt.game_id = g.id
+                    WHERE g.id = %s
+                """, (game_id,))
+                state = cursor.fetchone()
+
+            if not state:
+                raise HTTPException(status_code=404, detail="Game not found")
+            if state['version'] is None:
+                raise HTTPException(status_code=404, detail="Teams have not been generated for this game")
+            if state['teams_roster_version'] == state['roster_version']:
+                break
+            await TeamService.rebalance_teams(game_id)
+
+        cached = _team_sheet_cache.get(game_id)
+        if cached and cached[0] == state['version']:
+            return cached[1]
+
+        async with AsyncDatabaseManager() as (cursor, conn):
+            await cursor.execute("""
+                SELECT gt.balance_score, gt.balance_details, gt.algorithm_version, gt.seed,
+                       gt.restarts_completed, gt.version,
+                       ta.user_id, ta.team, ta.assigned_position,
+                       u.username, u.first_name, u.last_name, u.skill_level,
+                       u.preferred_position, u.playing_style, u.age_range
+                FROM game_teams gt
+                JOIN team_assignments ta ON ta.game_id = gt.game_id
+                JOIN users u ON u.id = ta.user_id
+                WHERE gt.game_id = %s
+                ORDER BY ta.team, u.skill_level DESC, u.id
+            """, (game_id,))
+            rows = cursor.fetchall()
+
+        if not rows:
+            raise HTTPException(status_code=404, detail="Teams have not been generated for this game")
+
+        teams: Dict[str, List[TeamPlayerResponse]] = {'A': [], 'B': []}
+        for row in rows:
+            teams[row['team']].append(TeamPlayerResponse(
+                user_id=row['user_id'],
+                username=row['username'],
+                first_name=row['first_name'],
+                last_name=row['last_name'],
+                skill_level=row['skill_level'],
+                preferred_position=row['preferred_position'],
+                playing_style=row['playing_style'],
+                age_range=row['age_range'],
+                assigned_position=row['assigned_position']
+            ))
+
+        header = rows[0]
+        details = header['balance_details']
+        response = TeamsResponse(
+            game_id=game_id,
+            team_a=teams['A'],
+            team_b=teams['B'],
+            balance_score=float(header['balance_score']),
+            balance_details={
+                k: round(v, 2) for k, v in (json.loads(details) if isinstance(details, str) else details).items()
+            },
+            algorithm_version=header['algorithm_version'],
+            seed=header['seed'],
+            restarts_completed=header['restarts_completed'],
+            version=header['version']
+        )
+        _team_sheet_cache.set(game_id, (header['version'], response))
+        return response
+
+    @staticmethod
+    async def rebalance_teams(game_id: int) -> bool:
+        """Incrementally rebalance stored teams after the confirmed roster changed.
+
+        Starts from the stored assignment and applies the fewest moves/swaps
+        needed to get back near the original balance score, so most players
+        keep their team. Teams are dropped when the roster falls below the
+        minimum. Completed and cancelled games are never touched: their teams
+        are the history ratings and chemistry are replayed from. Returns True
+        when stored teams were updated.
+        """
+        async with AsyncDatabaseManager() as (cursor, conn):
+            # Serializes concurrent rebalances of the same game
+            await cursor.execute("""
+                SELECT gt.target_score, gt.roster_version AS teams_roster_version, g.roster_version, g.status
+                FROM game_teams gt
+                JOIN games g ON g.id = gt.game_id
+                WHERE gt.game_id = %s
+                FOR UPDATE OF gt
+            """, (game_id,))
+            stored = cursor.fetchone()
+            if not stored or stored['status'] not in ('open', 'full'):
+                return False
+            if stored['teams_roster_version'] == stored['roster_version']:
+                return False
+
+            await cursor.execute(
+                "SELECT user_id, team FROM team_assignments WHERE game_id = %s", (game_id,)
+            )
+            previous = {row['user_id']: 0 if row['team'] == 'A' else 1 for row in cursor.fetchall()}
+
+            # Same connection: a second checkout while holding the lock could starve the pool
+            players = await TeamService.load_confirmed_players(cursor, game_id)
+            if {p.id for p in players} == set(previous):
+                # Roster churned back to the same players: the sheet is current again
+                await cursor.execute(
+                    "UPDATE game_teams SET roster_version = %s WHERE game_id = %s",
+                    (stored['roster_version'], game_id)
+                )
+                return False
+
+            if len(players) < MIN_PLAYERS_FOR_TEAMS:
+                await cursor.execute("DELETE FROM game_teams WHERE game_id = %s", (game_id,))
+                _team_sheet_cache.invalidate(game_id)
+                return True
+
+            chemistry = await ChemistryService.load_for_roster(cursor, [p.id for p in players])
+            result = TeamBalancer(chemistry=chemistry).rebalance_teams(
+                players, previous, float(stored['target_score'])
+            )
+            await TeamService.save_teams(
+                cursor, game_id, result, target_score=float(stored['target_score']),
+                roster_version=stored['roster_version']
+            )
+            logger.info(
+                "Rebalanced teams for game %s: %d player(s) changed team, score %.1f",
+                game_id, len(result['moved_player_ids']), result['balance_score']
+            )
+            return True
+
+    @staticmethod
+    async def rebalance_teams_quietly(game_id: int) -> bool:
+        """``rebalance_teams`` for callers whose own change has already committed"""
+        try:
+            return await TeamService.rebalance_teams(game_id)
+        except Exception:
+            logger.exception("Failed to rebalance teams for game %s", game_id)
+            return False
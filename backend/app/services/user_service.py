@@ -2,54 +2,92 @@
 User-related business logic and database operations
 """
 from fastapi import HTTPException
+import asyncio
 import bcrypt
-import psycopg2
-from typing import Optional
+import asyncpg
+import logging
+from typing import Dict, List, Optional, Set
 
-from ..core import DatabaseManager
-from ..models import UserSignup, UserLogin, UserResponse
+from ..core import AsyncDatabaseManager, run_password_task, settings
+from ..models import UserSignup, UserProfileUpdate, UserLogin, UserResponse
+from ..utils.cache import LRUCache
+from ..utils.rate_limit import get_login_limiter
+from ..utils.security import revoke_user_sessions
+
+logger = logging.getLogger(__name__)
+
+# Background rehashes in flight (keeps the tasks referenced, one per user)
+_rehash_tasks: Set[asyncio.Task] = set()
+_rehashing_users: Set[int] = set()
+
+# user_id -> UserResponse of an active user; writes here invalidate, the TTL covers other workers
+_user_cache = LRUCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
+_user_cache_generation = 0  # bumped by every invalidation
+
+USER_COLUMNS = """id, username, first_name, last_name, age_range, 
+                           bio, skill_level, preferred_position, playing_style, 
+                           is_active, is_verified, created_at"""
+
+def _hash_password(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
+    return hashed.decode('utf-8')
+
+def bcrypt_cost(hashed: str) -> Optional[int]:
+    """Cost factor of a ``$2b$12$...`` hash, or None if it is not a bcrypt hash"""
+    parts = hashed.split('$')
+    if len(parts) != 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+def password_needs_rehash(hashed: str) -> bool:
+    """True when a stored bcrypt hash was made at a cost other than BCRYPT_ROUNDS"""
+    cost = bcrypt_cost(hashed)
+    return cost is not None and cost != settings.BCRYPT_ROUNDS
+
+def _check_password(password: str, hashed: str) -> bool:
+    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
 class UserService:
     """Service class for user-related operations"""
     
     @staticmethod
-    def hash_password(password: str) -> str:
-        """Hash password using bcrypt"""
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+    async def hash_password(password: str) -> str:
+        """Hash password using bcrypt (on the bounded password pool)"""
+        return await run_password_task(_hash_password, password)
 
     @staticmethod
-    def verify_password(password: str, hashed: str) -> bool:
-        """Verify password against hash"""
-        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    async def verify_password(password: str, hashed: str) -> bool:
+        """Verify password against hash (on the bounded password pool)"""
+        return await run_password_task(_check_password, password, hashed)
 
     @staticmethod
-    def create_user(user_data: UserSignup) -> UserResponse:
+    async def create_user(user_data: UserSignup) -> UserResponse:
         """Create a new user account"""
-        with DatabaseManager() as (cursor, conn):
+        # Hash before taking a connection so none is held while bcrypt runs
+        hashed_password = await UserService.hash_password(user_data.password)
+        
+        async with AsyncDatabaseManager() as (cursor, conn):
             try:
                 # Check if username already exists
-                cursor.execute("SELECT id FROM users WHERE username = %s", (user_data.username,))
+                await cursor.execute("SELECT id FROM users WHERE username = %s", (user_data.username,))
                 if cursor.fetchone():
                     raise HTTPException(status_code=400, detail="Username already exists")
                 
-                # Hash the password
-                hashed_password = UserService.hash_password(user_data.password)
-                
                 # Insert new user
                 insert_query = """
                     INSERT INTO users (
                         username, password_hash, first_name, last_name, 
-                        age_range, bio, skill_level, preferred_position, playing_style
+                        age_range, bio, skill_level, preferred_position, playing_style,
+                        latitude, longitude
                     ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s
+                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
                     ) RETURNING id, username, first_name, last_name, age_range, 
                                bio, skill_level, preferred_position, playing_style, 
                                is_active, is_verified, created_at
                 """
                 
-                cursor.execute(insert_query, (
+                await cursor.execute(insert_query, (
                     user_data.username,
                     hashed_password,
                     user_data.first_name,
@@ -58,7 +96,9 @@ class UserService:
                     user_data.bio,
                     user_data.skill_level,
                     user_data.preferred_position,
-                    user_data.playing_style
+                    user_data.playing_style,
+                    user_data.latitude,
+                    user_data.longitude
                 ))
                 
                 new_user = cursor.fetchone()
@@ -78,7 +118,7 @@ class UserService:
                     created_at=str(new_user['created_at'])
                 )
                 
-            except psycopg2.IntegrityError as e:
+            except asyncpg.IntegrityConstraintViolationError as e:
                 if "username" in str(e):
                     raise HTTPException(status_code=400, detail="Username already exists")
                 else:
@@ -89,12 +129,15 @@ class UserService:
                 raise HTTPException(status_code=500, detail=f"Failed to create user: {str(e)}")
 
     @staticmethod
-    def authenticate_user(login_data: UserLogin) -> UserResponse:
-        """Authenticate user login"""
-        with DatabaseManager() as (cursor, conn):
+    async def authenticate_user(login_data: UserLogin, client_ip: Optional[str] = None) -> UserResponse:
+        """Authenticate user login (throttled per username and client IP before any lookup)"""
+        limiter = get_login_limiter()
+        await limiter.check(login_data.username, client_ip)
+        
+        async with AsyncDatabaseManager() as (cursor, conn):
             try:
                 # Get user by username
-                cursor.execute("""
+                await cursor.execute("""
                     SELECT id, username, password_hash, first_name, last_name, 
                            age_range, bio, skill_level, preferred_position, playing_style, 
                            is_active, is_verified, created_at
@@ -103,72 +146,227 @@ class UserService:
                 """, (login_data.username,))
                 
                 user = cursor.fetchone()
-                if not user:
-                    raise HTTPException(status_code=401, detail="Invalid credentials")
-                
-                # Verify password
-                if not UserService.verify_password(login_data.password, user['password_hash']):
-                    raise HTTPException(status_code=401, detail="Invalid credentials")
-                
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Login failed: {str(e)}")
+        
+        if not user:
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+        
+        # Verify password with no connection held (bcrypt runs on the password pool)
+        if not await UserService.verify_password(login_data.password, user['password_hash']):
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+        
+        await limiter.succeeded(login_data.username)
+        
+        if password_needs_rehash(user['password_hash']):
+            UserService.schedule_rehash(user['id'], login_data.password, user['password_hash'])
+        
+        async with AsyncDatabaseManager() as (cursor, conn):
+            try:
                 # Update last login timestamp
-                cursor.execute("""
+                await cursor.execute("""
                     UPDATE users 
                     SET last_login = CURRENT_TIMESTAMP 
                     WHERE id = %s
                 """, (user['id'],))
-                
-                return UserResponse(
-                    id=user['id'],
-                    username=user['username'],
-                    first_name=user['first_name'],
-                    last_name=user['last_name'],
-                    age_range=user['age_range'],
-                    bio=user['bio'],
-                    skill_level=user['skill_level'],
-                    preferred_position=user['preferred_position'],
-                    playing_style=user['playing_style'],
-                    is_active=user['is_active'],
-                    is_verified=user['is_verified'],
-                    created_at=str(user['created_at'])
-                )
-                
-            except HTTPException:
-                raise
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Login failed: {str(e)}")
+        
+        return UserResponse(
+            id=user['id'],
+            username=user['username'],
+            first_name=user['first_name'],
+            last_name=user['last_name'],
+            age_range=user['age_range'],
+            bio=user['bio'],
+            skill_level=user['skill_level'],
+            preferred_position=user['preferred_position'],
+            playing_style=user['playing_style'],
+            is_active=user['is_active'],
+            is_verified=user['is_verified'],
+            created_at=str(user['created_at'])
+        )
+
+    @staticmethod
+    def schedule_rehash(user_id: int, password: str, old_hash: str) -> None:
+        """Upgrade a just-verified password to BCRYPT_ROUNDS after the login response"""
+        if user_id in _rehashing_users:
+            return
+        _rehashing_users.add(user_id)
+        task = asyncio.get_running_loop().create_task(UserService.rehash_password(user_id, password, old_hash))
+        _rehash_tasks.add(task)
+        task.add_done_callback(_rehash_tasks.discard)
+
+    @staticmethod
+    async def rehash_password(user_id: int, password: str, old_hash: str) -> bool:
+        """Store a hash at the current cost unless the password changed meanwhile; never raises"""
+        try:
+            new_hash = await UserService.hash_password(password)
+            async with AsyncDatabaseManager() as (cursor, conn):
+                await cursor.execute("""
+                    UPDATE users SET password_hash = %s
+                    WHERE id = %s AND password_hash = %s
+                    RETURNING id
+                """, (new_hash, user_id, old_hash))
+                updated = cursor.fetchone() is not None
+            if updated:
+                logger.info(
+                    "Rehashed password for user %s from cost %s to %s",
+                    user_id, bcrypt_cost(old_hash), settings.BCRYPT_ROUNDS
+                )
+            return updated
+        except HTTPException:
+            return False  # password pool saturated; the next login retries
+        except Exception:
+            logger.exception("Failed to rehash password for user %s", user_id)
+            return False
+        finally:
+            _rehashing_users.discard(user_id)
+
+    @staticmethod
+    def _user_from_row(user: dict) -> UserResponse:
+        return UserResponse(
+            id=user['id'],
+            username=user['username'],
+            first_name=user['first_name'],
+            last_name=user['last_name'],
+            age_range=user['age_range'],
+            bio=user['bio'],
+            skill_level=user['skill_level'],
+            preferred_position=user['preferred_position'],
+            playing_style=user['playing_style'],
+            is_active=user['is_active'],
+            is_verified=user['is_verified'],
+            created_at=str(user['created_at'])
+        )
 
     @staticmethod
-    def get_user_by_id(user_id: int) -> UserResponse:
-        """Get user by ID"""
-        with DatabaseManager() as (cursor, conn):
+    async def get_user_by_id(user_id: int) -> UserResponse:
+        """Get user by ID (served from the per-worker user cache when possible)"""
+        cached = _user_cache.get(user_id)
+        if cached is not None:
+            return cached
+        
+        generation = _user_cache_generation
+        async with AsyncDatabaseManager() as (cursor, conn):
             try:
-                cursor.execute("""
-                    SELECT id, username, first_name, last_name, age_range, 
-                           bio, skill_level, preferred_position, playing_style, 
-                           is_active, is_verified, created_at
+                await cursor.execute(f"""
+                    SELECT {USER_COLUMNS}
                     FROM users WHERE id = %s AND is_active = true
                 """, (user_id,))
                 
                 user = cursor.fetchone()
                 if not user:
                     raise HTTPException(status_code=404, detail="User not found")
-                
-                return UserResponse(
-                    id=user['id'],
-                    username=user['username'],
-                    first_name=user['first_name'],
-                    last_name=user['last_name'],
-                    age_range=user['age_range'],
-                    bio=user['bio'],
-                    skill_level=user['skill_level'],
-                    preferred_position=user['preferred_position'],
-                    playing_style=user['playing_style'],
-                    is_active=user['is_active'],
-                    is_verified=user['is_verified'],
-                    created_at=str(user['created_at'])
-                )
-                
             except HTTPException:
                 raise
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Failed to fetch user: {str(e)}")
+        
+        response = UserService._user_from_row(user)
+        if generation == _user_cache_generation:  # no write landed while we were querying
+            _user_cache.set(user_id, response)
+        return response
+
+    @staticmethod
+    async def get_users_by_ids(user_ids: List[int]) -> List[UserResponse]:
+        """Active users among ``user_ids``, in request order; only cache misses are queried"""
+        found: Dict[int, UserResponse] = {}
+        misses = []
+        for user_id in dict.fromkeys(user_ids):
+            cached = _user_cache.get(user_id)
+            if cached is not None:
+                found[user_id] = cached
+            else:
+                misses.append(user_id)
+        
+        if misses:
+            generation = _user_cache_generation
+            async with AsyncDatabaseManager() as (cursor, conn):
+                try:
+                    await cursor.execute(f"""
+                        SELECT {USER_COLUMNS}
+                        FROM users WHERE id = ANY(%s::int[]) AND is_active = true
+                    """, (misses,))
+                    rows = cursor.fetchall()
+                except Exception as e:
+                    raise HTTPException(status_code=500, detail=f"Failed to fetch users: {str(e)}")
+            for row in rows:
+                response = UserService._user_from_row(row)
+                if generation == _user_cache_generation:
+                    _user_cache.set(response.id, response)
+                found[response.id] = response
+        
+        return [found[user_id] for user_id in dict.fromkeys(user_ids) if user_id in found]
+
+    @staticmethod
+    async def update_profile(user_id: int, update: UserProfileUpdate) -> UserResponse:
+        """Change the fields sent in ``update`` and drop the cached profile"""
+        changes = update.model_dump(exclude_unset=True)
+        if not changes:
+            raise HTTPException(status_code=400, detail="No profile fields to update")
+        
+        assignments = ", ".join(f"{column} = %s" for column in changes)
+        async with AsyncDatabaseManager() as (cursor, conn):
+            try:
+                await cursor.execute(f"""
+                    UPDATE users SET {assignments}
+                    WHERE id = %s AND is_active = true
+                    RETURNING {USER_COLUMNS}
+                """, (*changes.values(), user_id))
+                user = cursor.fetchone()
+                if not user:
+                    raise HTTPException(status_code=404, detail="User not found")
+            except HTTPException:
+                raise
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Failed to update user: {str(e)}")
+        
+        UserService.invalidate_user(user_id)
+        return UserService._user_from_row(user)
+
+    @staticmethod
+    async def deactivate_user(user_id: int) -> None:
+        """Mark the account inactive, end its sessions and drop the cached profile"""
+        async with AsyncDatabaseManager() as (cursor, conn):
+            try:
+                await cursor.execute("""
+                    UPDATE users SET is_active = false
+                    WHERE id = %s AND is_active = true
+                    RETURNING id
+                """, (user_id,))
+                if not cursor.fetchone():
+                    raise HTTPException(status_code=404, detail="User not found")
+            except HTTPException:
+                raise
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Failed to deactivate user: {str(e)}")
+        
+        revoke_user_sessions(user_id)
+        UserService.invalidate_user(user_id)
+
+    @staticmethod
+    async def is_active(user_id: int) -> bool:
+        """Whether the account exists and is active, read from the database (never the cache)"""
+        async with AsyncDatabaseManager() as (cursor, conn):
+            try:
+                await cursor.execute("SELECT is_active FROM users WHERE id = %s", (user_id,))
+                user = cursor.fetchone()
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Failed to fetch user: {str(e)}")
+        return bool(user and user['is_active'])
+
+    @staticmethod
+    def invalidate_user(user_id: int) -> None:
+        """Forget this worker's cached profile after a change to the user's row.
+
+        Bumping the generation also stops lookups already in flight, which
+        may have read the old row, from caching it afterwards.
+        """
+        global _user_cache_generation
+        _user_cache_generation += 1
+        _user_cache.invalidate(user_id)
+
+    @staticmethod
+    def user_cache_stats() -> dict:
+        return _user_cache.stats()
@@ -0,0 +1,125 @@
+"""
+Geohash helpers for radius search without PostGIS
+
+Games store a geohash of their coordinates in a B-tree indexed column (byte
+collation). A radius search picks the finest geohash precision whose cells
+are at least as large as the radius, and scans the 3x3 block of cells around
+the centre as prefix ranges on that index; the haversine distance then trims
+the corners exactly.
+"""
+import math
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException
+
+GEOHASH_PRECISION = 9  # ~4.8m x 4.8m cells
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Standard base32 geohash of a point"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        rng, value = (lon_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            rng[0] = mid
+        else:
+            bits <<= 1
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+def cell_size_degrees(precision: int) -> Tuple[float, float]:
+    """(height, width) of a geohash cell in degrees"""
+    total_bits = 5 * precision
+    lat_bits = total_bits // 2
+    lon_bits = total_bits - lat_bits
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+def covering_prefixes(latitude: float, longitude: float, radius_km: float) -> Optional[List[str]]:
+    """Geohash prefixes whose cells cover the circle, or None when it is too large to bother"""
+    # Cells are narrowest at the circle's edge furthest from the equator
+    edge_lat = min(89.9, abs(latitude) + radius_km / KM_PER_DEGREE)
+    lon_km_per_degree = KM_PER_DEGREE * math.cos(math.radians(edge_lat))
+
+    precision = 0
+    for p in range(GEOHASH_PRECISION, 0, -1):
+        height, width = cell_size_degrees(p)
+        if height * KM_PER_DEGREE >= radius_km and width * lon_km_per_degree >= radius_km:
+            precision = p
+            break
+    if not precision:
+        return None
+
+    height, width = cell_size_degrees(precision)
+    prefixes = set()
+    for d_lat in (-height, 0.0, height):
+        for d_lon in (-width, 0.0, width):
+            lat = max(-90.0, min(90.0, latitude + d_lat))
+            lon = (longitude + d_lon + 180.0) % 360.0 - 180.0
+            prefixes.add(encode_geohash(lat, lon, precision))
+    return sorted(prefixes)
+
+def prefix_range(prefix: str) -> Tuple[str, str]:
+    """Half-open [low, high) byte-order range of all geohashes starting with ``prefix``"""
+    return prefix, prefix + "~"  # '~' sorts after every base32 character
+
+def distance_sql(alias: str = "g") -> str:
+    """Haversine distance in km from ``(%s, %s)`` (lat, lon) to ``alias``'s coordinates"""
+    return f"""(2 * {EARTH_RADIUS_KM} * asin(least(1.0, sqrt(
+        power(sin(radians({alias}.latitude - %s::float8) / 2), 2)
+        + cos(radians(%s::float8)) * cos(radians({alias}.latitude))
+        * power(sin(radians({alias}.longitude - %s::float8) / 2), 2)
+    ))))"""
+
+def radius_condition(latitude: float, longitude: float, radius_km: float, alias: str = "g") -> Tuple[str, list]:
+    """SQL condition (and its params) for rows of ``alias`` within ``radius_km`` of a point.
+
+    The geohash prefix ranges are what the index serves; the haversine test
+    only runs on the rows they return.
+    """
+    conditions = []
+    params: list = []
+    prefixes = covering_prefixes(latitude, longitude, radius_km)
+    if prefixes:
+        ranges = []
+        for prefix in prefixes:
+            ranges.append(f"({alias}.geohash >= %s AND {alias}.geohash < %s)")
+            params.extend(prefix_range(prefix))
+        conditions.append("(" + " OR ".join(ranges) + ")")
+    else:
+        conditions.append(f"{alias}.geohash IS NOT NULL")
+    conditions.append(f"{distance_sql(alias)} <= %s::float8")
+    params.extend([latitude, latitude, longitude, radius_km])
+    return " AND ".join(conditions), params
+
+def parse_near(near: str) -> Tuple[float, float]:
+    """Parse a ``lat,lon`` query value"""
+    try:
+        lat_text, lon_text = near.split(",")
+        latitude, longitude = float(lat_text), float(lon_text)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="near must be 'lat,lon'")
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise HTTPException(status_code=400, detail="near coordinates out of range")
+    return latitude, longitude
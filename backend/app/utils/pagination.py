@@ -0,0 +1,68 @@
+"""
+Keyset pagination helpers
+
+Listings are ordered by ``(date_time, id)`` and paged with an opaque cursor
+encoding the last row of the previous page, so a deep page costs the same
+index range scan as the first one.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+
+from ..core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    """Keep page sizes stable: missing/invalid limits fall back to the default"""
+    if not limit or limit < 1:
+        return settings.DEFAULT_PAGE_SIZE
+    return min(limit, settings.MAX_PAGE_SIZE)
+
+def encode_cursor(date_time: datetime, row_id: int, rank: Optional[float] = None) -> str:
+    """Encode a ``(date_time, id)`` keyset position as an opaque URL-safe token.
+
+    Search results are ordered by relevance first, so their cursors also
+    carry the last row's ``rank``.
+    """
+    position = {"t": date_time.isoformat(), "id": row_id}
+    if rank is not None:
+        position["r"] = rank
+    payload = json.dumps(position, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def _decode_payload(token: str) -> dict:
+    padded = token + "=" * (-len(token) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+def decode_cursor(token: str) -> Tuple[datetime, int]:
+    """Decode a token produced by :func:`encode_cursor`"""
+    try:
+        payload = _decode_payload(token)
+        return datetime.fromisoformat(payload["t"]), int(payload["id"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+def decode_ranked_cursor(token: str) -> Tuple[float, datetime, int]:
+    """Decode a search cursor into ``(rank, date_time, id)``"""
+    try:
+        payload = _decode_payload(token)
+        return float(payload["r"]), datetime.fromisoformat(payload["t"]), int(payload["id"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+def next_cursor(rows: Sequence, limit: int) -> Optional[str]:
+    """Cursor for the page after ``rows``, or None when this was the last page.
+
+    ``rows`` are GameResponse-like objects exposing ``date_time`` (as the
+    string form of a datetime) and ``id``, plus ``search_rank`` for search results.
+    """
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    rank = getattr(last, "search_rank", None)
+    return encode_cursor(datetime.fromisoformat(str(last.date_time)), last.id, rank)
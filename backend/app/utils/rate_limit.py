@@ -0,0 +1,198 @@
+"""
+Token-bucket login throttling
+
+Every login attempt takes a token from its username's bucket and from its
+client IP's bucket before anything else happens; an empty bucket answers 429
+without touching the database or bcrypt, so a credential-stuffing burst costs
+a dictionary lookup per attempt instead of a hash. A successful login refills
+that username's bucket.
+
+Buckets live in a pluggable backend:
+
+- ``MemoryBucketBackend`` (default): an LRU-bounded map per worker.
+- ``SQLiteBucketBackend``: a SQLite file that every worker and API node on
+  the host (or sharing the volume) reads and writes transactionally, a local
+  stand-in for a shared store such as Redis.
+
+Select one with LOGIN_RATE_LIMIT_STORE (``memory`` or a SQLite file path).
+Blocking backends run on a thread, off the event loop. If a backend fails
+(e.g. the SQLite file stays locked past its busy timeout) the attempt is
+allowed: throttling is a defence against abuse, not a reason to stop logins.
+"""
+import asyncio
+import logging
+import random
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+def refill(tokens: float, updated: float, capacity: float, rate: float, now: float) -> float:
+    """Tokens in a bucket last seen at ``updated`` holding ``tokens``"""
+    return min(capacity, tokens + max(0.0, now - updated) * rate)
+
+def take_token(state: Optional[Tuple[float, float]], capacity: float, rate: float, now: float) -> Tuple[Tuple[float, float], float]:
+    """Apply one attempt to a bucket ``(tokens, updated)``; returns ``(new_state, retry_after)``
+
+    ``retry_after`` is 0 when the attempt is allowed, else seconds until a token is back.
+    """
+    tokens = capacity if state is None else refill(state[0], state[1], capacity, rate, now)
+    if tokens >= 1.0:
+        return (tokens - 1.0, now), 0.0
+    return (tokens, now), (1.0 - tokens) / rate
+
+class BucketBackend(ABC):
+    """Storage for token buckets keyed by string"""
+
+    blocking = False  # True when calls may wait on I/O or locks held by other processes
+
+    @abstractmethod
+    def take(self, key: str, capacity: float, rate: float, now: float) -> float:
+        """Take one token from ``key``'s bucket: 0.0 if granted, else the retry-after in seconds"""
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+        """Forget ``key``'s bucket (it starts full again)"""
+
+class MemoryBucketBackend(BucketBackend):
+    """Per-worker buckets in an LRU-bounded map"""
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, capacity: float, rate: float, now: float) -> float:
+        with self._lock:
+            state, retry_after = take_token(self._buckets.get(key), capacity, rate, now)
+            self._buckets[key] = state
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return retry_after
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+class SQLiteBucketBackend(BucketBackend):
+    """Buckets in a SQLite file shared by every process that opens it"""
+
+    blocking = True
+    PRUNE_PROBABILITY = 0.001  # chance per take of dropping idle rows
+    IDLE_SECONDS = 3600  # rows untouched this long are full buckets again
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=1.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS login_buckets (
+                key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL
+            )
+        """)
+        self._lock = threading.Lock()
+
+    def take(self, key: str, capacity: float, rate: float, now: float) -> float:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tokens, updated FROM login_buckets WHERE key = ?", (key,)
+                ).fetchone()
+                state, retry_after = take_token(row, capacity, rate, now)
+                self._conn.execute(
+                    "INSERT INTO login_buckets (key, tokens, updated) VALUES (?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                    (key, state[0], state[1])
+                )
+                if random.random() < self.PRUNE_PROBABILITY:
+                    self._conn.execute("DELETE FROM login_buckets WHERE updated < ?", (now - self.IDLE_SECONDS,))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return retry_after
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM login_buckets WHERE key = ?", (key,))
+
+class LoginLimiter:
+    """Per-username and per-IP login attempt limits"""
+
+    def __init__(self, backend: BucketBackend):
+        self.backend = backend
+        self.rejected = 0
+        self.backend_errors = 0
+
+    async def _call(self, func, *args):
+        """Run a backend call (on a thread if it blocks); None when the backend fails"""
+        try:
+            if self.backend.blocking:
+                return await asyncio.to_thread(func, *args)
+            return func(*args)
+        except Exception as e:
+            self.backend_errors += 1
+            logger.warning("Login rate limit store failed, allowing the attempt: %s", e)
+            return None
+
+    def _take_both(self, username: str, client_ip: Optional[str], now: float) -> float:
+        retry_after = 0.0
+        if client_ip:
+            retry_after = self.backend.take(
+                f"ip:{client_ip}", settings.LOGIN_IP_BURST, 1.0 / settings.LOGIN_IP_REFILL_SECONDS, now
+            )
+        if not retry_after:
+            retry_after = self.backend.take(
+                f"user:{username}", settings.LOGIN_USERNAME_BURST, 1.0 / settings.LOGIN_USERNAME_REFILL_SECONDS, now
+            )
+        return retry_after
+
+    async def check(self, username: str, client_ip: Optional[str] = None) -> None:
+        """Spend one attempt, or raise 429 with Retry-After when either bucket is empty"""
+        retry_after = await self._call(self._take_both, username, client_ip, time.time())
+        if retry_after:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=429,
+                detail="Too many login attempts, please try again later",
+                headers={"Retry-After": str(max(1, int(retry_after + 0.999)))}
+            )
+
+    async def succeeded(self, username: str) -> None:
+        """A correct password restores the username's attempts"""
+        await self._call(self.backend.reset, f"user:{username}")
+
+    def stats(self) -> dict:
+        stats = {"store": type(self.backend).__name__, "rejected": self.rejected, "backend_errors": self.backend_errors}
+        if isinstance(self.backend, MemoryBucketBackend):
+            stats["tracked_keys"] = len(self.backend)
+        return stats
+
+_login_limiter: Optional[LoginLimiter] = None
+
+def get_login_limiter() -> LoginLimiter:
+    """The process-wide login limiter, on the backend chosen by LOGIN_RATE_LIMIT_STORE"""
+    global _login_limiter
+    if _login_limiter is None:
+        store = settings.LOGIN_RATE_LIMIT_STORE
+        if store == "memory":
+            backend: BucketBackend = MemoryBucketBackend(settings.LOGIN_RATE_LIMIT_MAX_KEYS)
+        else:
+            backend = SQLiteBucketBackend(store)
+        _login_limiter = LoginLimiter(backend)
+    return _login_limiter
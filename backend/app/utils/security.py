@@ -1,23 +1,52 @@
 """
 Security utilities for authentication and password management
+
+Sessions are short-lived HS256 JWTs issued at login. They carry the user's
+id, skill level and active flag, so authorizing a request (and checking
+skill compatibility on join) needs no users lookup. Each token names its
+signing key in the ``kid`` header, which is what makes key rotation
+possible (see JWT_SIGNING_KEYS). Logged-out token ids are kept in an
+in-memory revocation list until the token would have expired anyway.
+
+Deactivating an account must end all of its sessions, not just the one
+that asked. The worker that handles it records a per-user watermark that
+rejects every token issued before it. Other workers learn of it through
+``get_active_user``, which routes that change data use: it re-reads
+``users.is_active``, so a stale token cannot write anything on any worker.
 """
 import bcrypt
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
 import jwt
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-# JWT Configuration (for future use)
-SECRET_KEY = "your-secret-key-here"  # Should be in environment variables
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
+from ..core.config import settings
+from .cache import LRUCache
+
+security = HTTPBearer(auto_error=False)
 
-security = HTTPBearer()
+# jti -> True until the token's own expiry (per worker)
+_revoked_tokens = LRUCache(maxsize=settings.REVOKED_TOKENS_MAX, ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+# user_id -> time before which all of the user's tokens are void (per worker)
+_sessions_revoked_before = LRUCache(maxsize=settings.REVOKED_TOKENS_MAX, ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+@dataclass(frozen=True)
+class SessionUser:
+    """Claims of a verified session token"""
+    user_id: int
+    skill_level: int
+    is_active: bool
+    token_id: str
+    expires_at: int
+    issued_at: int
 
 def hash_password(password: str) -> str:
     """Hash password using bcrypt"""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -25,32 +54,90 @@ def verify_password(password: str, hashed: str) -> bool:
     """Verify password against hash"""
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    """Create JWT access token (for future use)"""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
-
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    """Verify JWT token (for future use)"""
+def create_access_token(user_id: int, skill_level: int, is_active: bool = True) -> Tuple[str, int]:
+    """Sign a session token with the active key; returns ``(token, expires_in_seconds)``"""
+    kid = settings.JWT_ACTIVE_KEY_ID
+    if kid not in settings.JWT_SIGNING_KEYS:
+        raise HTTPException(status_code=500, detail="Session signing key is not configured")
+    now = int(time.time())
+    expires_in = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    claims = {
+        "sub": str(user_id),
+        "skill_level": skill_level,
+        "is_active": is_active,
+        "iss": settings.JWT_ISSUER,
+        "iat": now,
+        "exp": now + expires_in,
+        "jti": uuid.uuid4().hex,
+    }
+    token = jwt.encode(claims, settings.JWT_SIGNING_KEYS[kid], algorithm=settings.JWT_ALGORITHM, headers={"kid": kid})
+    return token, expires_in
+
+def _unauthorized(detail: str = "Could not validate credentials") -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def decode_access_token(token: str) -> SessionUser:
+    """Verify signature, expiry and revocation of a session token"""
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        return username
-    except jwt.PyJWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
+        key = settings.JWT_SIGNING_KEYS.get(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
+            raise _unauthorized()  # signed with a retired or unknown key
+        claims = jwt.decode(
+            token, key,
+            algorithms=[settings.JWT_ALGORITHM],
+            issuer=settings.JWT_ISSUER,
+            options={"require": ["sub", "exp", "iat", "jti"]}
         )
+        session = SessionUser(
+            user_id=int(claims["sub"]),
+            skill_level=int(claims["skill_level"]),
+            is_active=bool(claims["is_active"]),
+            token_id=claims["jti"],
+            expires_at=int(claims["exp"]),
+            issued_at=int(claims["iat"]),
+        )
+    except jwt.ExpiredSignatureError:
+        raise _unauthorized("Session expired")
+    except (jwt.PyJWTError, KeyError, TypeError, ValueError):
+        raise _unauthorized()
+    if _revoked_tokens.get(session.token_id):
+        raise _unauthorized("Session revoked")
+    revoked_before = _sessions_revoked_before.get(session.user_id)
+    if revoked_before is not None and session.issued_at <= revoked_before:
+        raise _unauthorized("Session revoked")
+    return session
+
+def revoke_token(session: SessionUser) -> None:
+    """Reject this token from now on (in this worker) until it expires"""
+    _revoked_tokens.set(session.token_id, True)
+
+def revoke_user_sessions(user_id: int) -> None:
+    """Reject every token issued to this user so far (in this worker)"""
+    _sessions_revoked_before.set(user_id, int(time.time()))
+
+def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> SessionUser:
+    """Dependency: the verified, active session user (401/403 otherwise)"""
+    if credentials is None:
+        raise _unauthorized("Not authenticated")
+    session = decode_access_token(credentials.credentials)
+    if not session.is_active:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Account is inactive")
+    return session
+
+async def get_active_user(session: SessionUser = Depends(get_current_user)) -> SessionUser:
+    """Dependency for writes: the session user, with ``users.is_active`` re-checked (403 otherwise)"""
+    from ..services import UserService
+    if not await UserService.is_active(session.user_id):
+        revoke_user_sessions(session.user_id)  # spare the lookup for this user's other tokens
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Account is inactive")
+    return session
+
+def get_optional_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> Optional[SessionUser]:
+    """Dependency: the session user when a token is sent, else None"""
+    if credentials is None:
+        return None
+    return get_current_user(credentials)
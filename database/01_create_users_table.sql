@@ -18,6 +18,8 @@ CREATE TABLE IF NOT EXISTS users (
     skill_level INTEGER CHECK (skill_level >= 1 AND skill_level <= 10) DEFAULT 5,
     preferred_position VARCHAR(50) CHECK (preferred_position IN ('Goalkeeper', 'Defender', 'Midfielder', 'Forward', 'Any')),
     playing_style VARCHAR(100) CHECK (playing_style IN ('Aggressive', 'Technical', 'Physical', 'Balanced', 'Creative', 'Defensive')),
+    latitude DOUBLE PRECISION, -- optional home coordinates (14_add_game_coordinates.sql)
+    longitude DOUBLE PRECISION,
     
     -- Account status
     is_active BOOLEAN DEFAULT true,
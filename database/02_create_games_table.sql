@@ -17,12 +17,22 @@ CREATE TABLE IF NOT EXISTS games (
     skill_level_max INTEGER DEFAULT 10,
     status VARCHAR(20) DEFAULT 'open', -- open, full, cancelled, completed
     created_by INTEGER REFERENCES users(id),
+    confirmed_players INTEGER NOT NULL DEFAULT 0, -- maintained by trigger (05_add_game_participant_counters.sql)
+    waitlisted_players INTEGER NOT NULL DEFAULT 0, -- maintained by trigger (05_add_game_participant_counters.sql)
+    roster_version INTEGER NOT NULL DEFAULT 0, -- bumped on confirmed roster changes (10_add_team_sheet_versioning.sql)
+    day_of_week VARCHAR(9), -- set by trigger from date_time (13_add_game_recommendation_indexes.sql)
+    time_bucket VARCHAR(9), -- morning/afternoon/evening, set by trigger (13_add_game_recommendation_indexes.sql)
+    latitude DOUBLE PRECISION, -- optional venue coordinates (14_add_game_coordinates.sql)
+    longitude DOUBLE PRECISION,
+    geohash VARCHAR(12) COLLATE "C", -- geohash of latitude/longitude (14_add_game_coordinates.sql)
+    -- search_vector (generated tsvector) is added by 15_add_game_search_indexes.sql
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
 -- Create indexes for better query performance
-CREATE INDEX IF NOT EXISTS idx_games_date_time ON games(date_time);
+CREATE INDEX IF NOT EXISTS idx_games_date_time_id ON games(date_time, id); -- keyset pagination
+CREATE INDEX IF NOT EXISTS idx_games_status_date_time_id ON games(status, date_time, id); -- keyset pagination
 CREATE INDEX IF NOT EXISTS idx_games_status ON games(status);
 CREATE INDEX IF NOT EXISTS idx_games_skill_range ON games(skill_level_min, skill_level_max);
 CREATE INDEX IF NOT EXISTS idx_games_location ON games(location);
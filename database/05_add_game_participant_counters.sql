@@ -0,0 +1,80 @@
+-- Denormalized participant counters for Pickup Football App
+-- Keeps games.confirmed_players / games.waitlisted_players exact so listings and
+-- capacity checks read one row instead of counting game_participants
+
+-- psql -U postgres -d pickup_football -f 05_add_game_participant_counters.sql -- Run after 03_create_game_participants_table.sql
+-- python app/scripts/database_scripts/repair_game_counters.py -- to verify (and --repair) counter drift
+
+ALTER TABLE games ADD COLUMN IF NOT EXISTS confirmed_players INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE games ADD COLUMN IF NOT EXISTS waitlisted_players INTEGER NOT NULL DEFAULT 0;
+
+DO $$
+BEGIN
+    -- Counters can never go negative
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.table_constraints
+        WHERE constraint_name = 'check_participant_counters'
+        AND table_name = 'games'
+    ) THEN
+        ALTER TABLE games ADD CONSTRAINT check_participant_counters
+            CHECK (confirmed_players >= 0 AND waitlisted_players >= 0);
+    END IF;
+END $$;
+
+-- Function to apply a +1/-1 change for one participant status
+CREATE OR REPLACE FUNCTION adjust_game_participant_counts(p_game_id INTEGER, p_status VARCHAR, p_delta INTEGER)
+RETURNS VOID AS $$
+BEGIN
+    IF p_status NOT IN ('confirmed', 'waitlisted') THEN
+        RETURN;
+    END IF;
+
+    UPDATE games
+    SET confirmed_players = confirmed_players + CASE WHEN p_status = 'confirmed' THEN p_delta ELSE 0 END,
+        waitlisted_players = waitlisted_players + CASE WHEN p_status = 'waitlisted' THEN p_delta ELSE 0 END
+    WHERE id = p_game_id;
+END;
+$$ language 'plpgsql';
+
+-- Function to keep counters in step with every participant insert/update/delete.
+-- Waitlist promotions done by manage_waitlist_positions() are plain UPDATEs on
+-- game_participants, so they are counted here as well.
+CREATE OR REPLACE FUNCTION maintain_game_participant_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+       AND NEW.game_id IS NOT DISTINCT FROM OLD.game_id
+       AND NEW.status IS NOT DISTINCT FROM OLD.status THEN
+        RETURN NEW;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM adjust_game_participant_counts(OLD.game_id, OLD.status, -1);
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM adjust_game_participant_counts(NEW.game_id, NEW.status, 1);
+    END IF;
+
+    RETURN COALESCE(NEW, OLD);
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS maintain_game_counts_on_participant_change ON game_participants;
+CREATE TRIGGER maintain_game_counts_on_participant_change
+    AFTER INSERT OR UPDATE OR DELETE ON game_participants
+    FOR EACH ROW
+    EXECUTE FUNCTION maintain_game_participant_counts();
+
+-- Backfill counters from existing participants
+UPDATE games g
+SET confirmed_players = (
+        SELECT COUNT(*) FROM game_participants WHERE game_id = g.id AND status = 'confirmed'
+    ),
+    waitlisted_players = (
+        SELECT COUNT(*) FROM game_participants WHERE game_id = g.id AND status = 'waitlisted'
+    );
+
+-- Add comments for documentation
+COMMENT ON COLUMN games.confirmed_players IS 'Number of confirmed participants (maintained by trigger)';
+COMMENT ON COLUMN games.waitlisted_players IS 'Number of waitlisted participants (maintained by trigger)';
@@ -0,0 +1,15 @@
+-- Keyset pagination indexes for Pickup Football App
+-- GET /api/games and GET /api/users/{id}/games page on (date_time, id); these
+-- composite indexes let every page be a bounded index range scan
+
+-- psql -U postgres -d pickup_football -f 06_add_keyset_pagination_indexes.sql -- Run this command to add the indexes
+
+-- Default listing filters on status, so lead with it
+CREATE INDEX IF NOT EXISTS idx_games_status_date_time_id ON games(status, date_time, id);
+
+-- Unfiltered listings; supersedes the single-column date_time index
+CREATE INDEX IF NOT EXISTS idx_games_date_time_id ON games(date_time, id);
+DROP INDEX IF EXISTS idx_games_date_time;
+
+-- A user's game history starts from their participation rows
+CREATE INDEX IF NOT EXISTS idx_game_participants_user_game ON game_participants(user_id, game_id);
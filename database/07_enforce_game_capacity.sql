@@ -0,0 +1,28 @@
+-- Capacity guard for Pickup Football App
+-- The API admits players under a per-game row lock (SELECT ... FOR UPDATE on games);
+-- this makes the counter trigger refuse any confirmed insert/promotion that would
+-- overfill a game, whichever code path issued it
+
+-- psql -U postgres -d pickup_football -f 07_enforce_game_capacity.sql -- Run after 05_add_game_participant_counters.sql
+
+CREATE OR REPLACE FUNCTION adjust_game_participant_counts(p_game_id INTEGER, p_status VARCHAR, p_delta INTEGER)
+RETURNS VOID AS $$
+BEGIN
+    IF p_status NOT IN ('confirmed', 'waitlisted') THEN
+        RETURN;
+    END IF;
+
+    UPDATE games
+    SET confirmed_players = confirmed_players + CASE WHEN p_status = 'confirmed' THEN p_delta ELSE 0 END,
+        waitlisted_players = waitlisted_players + CASE WHEN p_status = 'waitlisted' THEN p_delta ELSE 0 END
+    WHERE id = p_game_id
+    AND (p_status <> 'confirmed' OR p_delta < 0 OR confirmed_players < max_players);
+
+    -- Row exists but the capacity condition failed: the game is already full
+    IF NOT FOUND AND p_status = 'confirmed' AND p_delta > 0
+       AND EXISTS (SELECT 1 FROM games WHERE id = p_game_id) THEN
+        RAISE EXCEPTION 'Game % is full', p_game_id
+            USING ERRCODE = 'check_violation';
+    END IF;
+END;
+$$ language 'plpgsql';
@@ -0,0 +1,54 @@
+-- Persisted waitlist queue order for Pickup Football App
+-- Every participant row gets a monotonic queue_seq at insert time. Waitlist ranks and
+-- promotion order come from (game_id, queue_seq) instead of comparing joined_at,
+-- which ties for players who join in the same transaction timestamp
+
+-- psql -U postgres -d pickup_football -f 08_add_waitlist_queue_seq.sql -- Run after 03_create_game_participants_table.sql
+
+CREATE SEQUENCE IF NOT EXISTS game_participants_queue_seq AS BIGINT;
+
+ALTER TABLE game_participants ADD COLUMN IF NOT EXISTS queue_seq BIGINT;
+
+-- Backfill existing rows in their historical join order
+UPDATE game_participants gp
+SET queue_seq = ordered.seq
+FROM (
+    SELECT id, nextval('game_participants_queue_seq') AS seq
+    FROM (
+        SELECT id FROM game_participants
+        WHERE queue_seq IS NULL
+        ORDER BY joined_at ASC, id ASC
+    ) pending
+) ordered
+WHERE gp.id = ordered.id;
+
+ALTER TABLE game_participants ALTER COLUMN queue_seq SET DEFAULT nextval('game_participants_queue_seq');
+ALTER TABLE game_participants ALTER COLUMN queue_seq SET NOT NULL;
+ALTER SEQUENCE game_participants_queue_seq OWNED BY game_participants.queue_seq;
+
+-- Waitlist rank lookups and promotion walk this index in queue order
+CREATE INDEX IF NOT EXISTS idx_game_participants_waitlist_queue
+    ON game_participants(game_id, queue_seq)
+    WHERE status = 'waitlisted';
+
+-- Promote the head of the queue instead of the earliest joined_at
+CREATE OR REPLACE FUNCTION manage_waitlist_positions()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- When a confirmed player leaves, promote the first waitlisted player
+    IF TG_OP = 'DELETE' AND OLD.status = 'confirmed' THEN
+        UPDATE game_participants 
+        SET status = 'confirmed'
+        WHERE id = (
+            SELECT id FROM game_participants 
+            WHERE game_id = OLD.game_id AND status = 'waitlisted'
+            ORDER BY queue_seq ASC 
+            LIMIT 1
+        );
+    END IF;
+    
+    RETURN COALESCE(NEW, OLD);
+END;
+$$ language 'plpgsql';
+
+COMMENT ON COLUMN game_participants.queue_seq IS 'Monotonic insertion sequence; orders the waitlist and breaks joined_at ties';
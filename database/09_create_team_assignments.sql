@@ -0,0 +1,33 @@
+-- Persisted team assignments for Pickup Football App
+-- generate-teams stores its split here so later roster changes (leave, waitlist
+-- promotion, late confirmed join) can be rebalanced incrementally from the stored
+-- assignment instead of reshuffling everybody
+
+-- psql -U postgres -d pickup_football -f 09_create_team_assignments.sql -- Run after 03_create_game_participants_table.sql
+
+-- One row per game that has generated teams
+CREATE TABLE IF NOT EXISTS game_teams (
+    game_id INTEGER PRIMARY KEY REFERENCES games(id) ON DELETE CASCADE,
+    balance_score NUMERIC(5, 2) NOT NULL,
+    target_score NUMERIC(5, 2) NOT NULL, -- score of the full solve; incremental updates aim to stay near it
+    balance_details JSONB NOT NULL DEFAULT '{}',
+    algorithm_version VARCHAR(20) NOT NULL,
+    seed BIGINT,
+    generated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- One row per assigned player
+CREATE TABLE IF NOT EXISTS team_assignments (
+    game_id INTEGER NOT NULL REFERENCES game_teams(game_id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    team CHAR(1) NOT NULL CHECK (team IN ('A', 'B')),
+    assigned_position VARCHAR(20) NOT NULL
+        CHECK (assigned_position IN ('Goalkeeper', 'Defender', 'Midfielder', 'Forward')),
+    assigned_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (game_id, user_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_team_assignments_user_id ON team_assignments(user_id);
+
+COMMENT ON COLUMN game_teams.target_score IS 'Balance score of the last full solve; incremental rebalancing swaps until back within tolerance of it';
@@ -0,0 +1,44 @@
+-- Team sheet versioning for Pickup Football App
+-- games.roster_version is bumped by the counter trigger whenever the confirmed roster
+-- changes; game_teams records the roster_version its teams were computed for plus its
+-- own version (bumped on every save). GET /api/games/{id}/teams serves a cached sheet
+-- while both versions match and only rebalances when the roster has moved on
+
+-- psql -U postgres -d pickup_football -f 10_add_team_sheet_versioning.sql -- Run after 07_enforce_game_capacity.sql and 09_create_team_assignments.sql
+
+ALTER TABLE games ADD COLUMN IF NOT EXISTS roster_version INTEGER NOT NULL DEFAULT 0;
+
+ALTER TABLE game_teams ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE game_teams ADD COLUMN IF NOT EXISTS roster_version INTEGER NOT NULL DEFAULT 0;
+
+-- Team sheet reads group by team
+CREATE INDEX IF NOT EXISTS idx_team_assignments_game_team ON team_assignments(game_id, team);
+
+-- Same as 07, plus a roster_version bump for confirmed joins, leaves and promotions
+CREATE OR REPLACE FUNCTION adjust_game_participant_counts(p_game_id INTEGER, p_status VARCHAR, p_delta INTEGER)
+RETURNS VOID AS $$
+BEGIN
+    IF p_status NOT IN ('confirmed', 'waitlisted') THEN
+        RETURN;
+    END IF;
+
+    UPDATE games
+    SET confirmed_players = confirmed_players + CASE WHEN p_status = 'confirmed' THEN p_delta ELSE 0 END,
+        waitlisted_players = waitlisted_players + CASE WHEN p_status = 'waitlisted' THEN p_delta ELSE 0 END,
+        roster_version = roster_version + CASE WHEN p_status = 'confirmed' THEN 1 ELSE 0 END
+    WHERE id = p_game_id
+    AND (p_status <> 'confirmed' OR p_delta < 0 OR confirmed_players < max_players);
+
+    -- Row exists but the capacity condition failed: the game is already full
+    IF NOT FOUND AND p_status = 'confirmed' AND p_delta > 0
+       AND EXISTS (SELECT 1 FROM games WHERE id = p_game_id) THEN
+        RAISE EXCEPTION 'Game % is full', p_game_id
+            USING ERRCODE = 'check_violation';
+    END IF;
+END;
+$$ language 'plpgsql';
+
+-- Existing team sheets were computed for the roster as it stands now
+UPDATE game_teams gt SET roster_version = g.roster_version FROM games g WHERE g.id = gt.game_id;
+
+COMMENT ON COLUMN games.roster_version IS 'Bumped on every confirmed roster change; compared with game_teams.roster_version to detect stale team sheets';
@@ -0,0 +1,27 @@
+-- Player ratings for Pickup Football App
+-- Recording a completed game's result updates the Elo rating of that game's players
+-- only (see backend/app/algorithms/rating.py). Ratings start from the self-reported
+-- skill_level; rerate_players.py replays all results when rating parameters change
+
+-- psql -U postgres -d pickup_football -f 11_create_player_ratings.sql -- Run after 09_create_team_assignments.sql
+
+-- Final score of a completed game; teams come from team_assignments
+CREATE TABLE IF NOT EXISTS game_results (
+    game_id INTEGER PRIMARY KEY REFERENCES games(id) ON DELETE CASCADE,
+    team_a_score INTEGER NOT NULL CHECK (team_a_score >= 0),
+    team_b_score INTEGER NOT NULL CHECK (team_b_score >= 0),
+    recorded_by INTEGER REFERENCES users(id),
+    recorded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS player_ratings (
+    user_id INTEGER PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    rating DOUBLE PRECISION NOT NULL,
+    games_rated INTEGER NOT NULL DEFAULT 0,
+    last_game_id INTEGER REFERENCES games(id) ON DELETE SET NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_player_ratings_rating ON player_ratings(rating DESC);
+
+COMMENT ON TABLE player_ratings IS 'Team Elo ratings; players without a row are rated from users.skill_level';
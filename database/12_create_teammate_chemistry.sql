@@ -0,0 +1,34 @@
+-- Teammate chemistry for Pickup Football App
+-- Sparse upper-triangular matrix: one row per pair of players (user_a < user_b) who
+-- have been on the same team in a completed game. Recording a result upserts the
+-- pairs of that game only; a roster's pairs are fetched in one primary-key query
+
+-- psql -U postgres -d pickup_football -f 12_create_teammate_chemistry.sql -- Run after 11_create_player_ratings.sql
+
+CREATE TABLE IF NOT EXISTS teammate_chemistry (
+    user_a INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    user_b INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    games_together INTEGER NOT NULL DEFAULT 0,
+    wins_together INTEGER NOT NULL DEFAULT 0,
+    draws_together INTEGER NOT NULL DEFAULT 0,
+    last_game_id INTEGER REFERENCES games(id) ON DELETE SET NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_a, user_b),
+    CHECK (user_a < user_b)
+);
+
+-- Lookups by the higher id of a pair (the primary key covers user_a)
+CREATE INDEX IF NOT EXISTS idx_teammate_chemistry_user_b ON teammate_chemistry(user_b);
+
+-- Backfill from results recorded before this table existed
+INSERT INTO teammate_chemistry (user_a, user_b, games_together, wins_together, draws_together)
+SELECT a.user_id, b.user_id,
+       COUNT(*),
+       COUNT(*) FILTER (WHERE (a.team = 'A' AND gr.team_a_score > gr.team_b_score)
+                           OR (a.team = 'B' AND gr.team_b_score > gr.team_a_score)),
+       COUNT(*) FILTER (WHERE gr.team_a_score = gr.team_b_score)
+FROM game_results gr
+JOIN team_assignments a ON a.game_id = gr.game_id
+JOIN team_assignments b ON b.game_id = a.game_id AND b.team = a.team AND a.user_id < b.user_id
+GROUP BY a.user_id, b.user_id
+ON CONFLICT (user_a, user_b) DO NOTHING;
@@ -0,0 +1,41 @@
+-- Game recommendation indexes for Pickup Football App
+-- Every game carries the day_of_week and time_bucket vocabulary of user_preferences
+-- (monday..sunday, morning/afternoon/evening), set by trigger from date_time in the
+-- database's TimeZone setting. Recommendation candidates come from partial indexes over
+-- open games instead of a scan of all games per user
+
+-- psql -U postgres -d pickup_football -f 13_add_game_recommendation_indexes.sql -- Run after 04_create_user_preferences_table.sql
+
+ALTER TABLE games ADD COLUMN IF NOT EXISTS day_of_week VARCHAR(9);
+ALTER TABLE games ADD COLUMN IF NOT EXISTS time_bucket VARCHAR(9);
+
+CREATE OR REPLACE FUNCTION set_game_time_buckets()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.day_of_week := to_char(NEW.date_time, 'FMday');
+    NEW.time_bucket := CASE
+        WHEN EXTRACT(HOUR FROM NEW.date_time) < 12 THEN 'morning'
+        WHEN EXTRACT(HOUR FROM NEW.date_time) < 17 THEN 'afternoon'
+        ELSE 'evening'
+    END;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS set_game_time_buckets ON games;
+CREATE TRIGGER set_game_time_buckets
+    BEFORE INSERT OR UPDATE OF date_time ON games
+    FOR EACH ROW
+    EXECUTE FUNCTION set_game_time_buckets();
+
+-- Backfill existing games (fires the trigger)
+UPDATE games SET date_time = date_time WHERE day_of_week IS NULL OR time_bucket IS NULL;
+
+-- Candidate generation: open games on a preferred day OR in a preferred time bucket
+-- (bitmap-OR of these two), narrowed by the skill window
+CREATE INDEX IF NOT EXISTS idx_games_open_day ON games(day_of_week, date_time) WHERE status = 'open';
+CREATE INDEX IF NOT EXISTS idx_games_open_time_bucket ON games(time_bucket, date_time) WHERE status = 'open';
+CREATE INDEX IF NOT EXISTS idx_games_open_skill_range ON games(skill_level_min, skill_level_max) WHERE status = 'open';
+
+COMMENT ON COLUMN games.day_of_week IS 'Lowercase weekday of date_time (trigger-maintained), matches user_preferences.preferred_days';
+COMMENT ON COLUMN games.time_bucket IS 'morning (<12h), afternoon (12-17h) or evening (trigger-maintained), matches user_preferences.preferred_times';
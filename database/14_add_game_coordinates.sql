@@ -0,0 +1,45 @@
+-- Game and player coordinates for Pickup Football App
+-- Games and users get optional WGS84 coordinates. Each located game also stores the
+-- geohash of its coordinates (computed by the backend, app/utils/geo.py); a radius search
+-- scans a few geohash prefix ranges on a byte-ordered B-tree instead of every game,
+-- then trims to the exact haversine distance. No PostGIS required
+
+-- psql -U postgres -d pickup_football -f 14_add_game_coordinates.sql -- Run after 02_create_games_table.sql
+
+ALTER TABLE games ADD COLUMN IF NOT EXISTS latitude DOUBLE PRECISION;
+ALTER TABLE games ADD COLUMN IF NOT EXISTS longitude DOUBLE PRECISION;
+ALTER TABLE games ADD COLUMN IF NOT EXISTS geohash VARCHAR(12) COLLATE "C";
+
+ALTER TABLE users ADD COLUMN IF NOT EXISTS latitude DOUBLE PRECISION;
+ALTER TABLE users ADD COLUMN IF NOT EXISTS longitude DOUBLE PRECISION;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.table_constraints
+        WHERE constraint_name = 'check_game_coordinates'
+        AND table_name = 'games'
+    ) THEN
+        ALTER TABLE games ADD CONSTRAINT check_game_coordinates
+            CHECK ((latitude IS NULL) = (longitude IS NULL)
+                   AND (latitude IS NULL OR (latitude BETWEEN -90 AND 90 AND longitude BETWEEN -180 AND 180))
+                   AND ((latitude IS NULL) = (geohash IS NULL)));
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.table_constraints
+        WHERE constraint_name = 'check_user_coordinates'
+        AND table_name = 'users'
+    ) THEN
+        ALTER TABLE users ADD CONSTRAINT check_user_coordinates
+            CHECK ((latitude IS NULL) = (longitude IS NULL)
+                   AND (latitude IS NULL OR (latitude BETWEEN -90 AND 90 AND longitude BETWEEN -180 AND 180)));
+    END IF;
+END $$;
+
+-- Radius search: prefix ranges on geohash, keyset order applied to the (small) match set
+CREATE INDEX IF NOT EXISTS idx_games_geohash ON games(geohash) WHERE geohash IS NOT NULL;
+
+COMMENT ON COLUMN games.geohash IS 'Base32 geohash (precision 9) of latitude/longitude, "C" collation so prefixes are contiguous index ranges';
+COMMENT ON COLUMN users.latitude IS 'Home latitude, used with user_preferences.max_travel_distance';
+COMMENT ON COLUMN users.longitude IS 'Home longitude, used with user_preferences.max_travel_distance';
@@ -0,0 +1,22 @@
+-- Game search indexes for Pickup Football App
+-- Full-text search over title (weight A), location (B) and description (C) through a
+-- generated tsvector column, plus trigram matching over title and location so typos
+-- like "central prk" still find "Central Park Field A". Both are GIN indexes, so
+-- GET /api/games?q= stays an index lookup however many historical games there are
+
+-- psql -U postgres -d pickup_football -f 15_add_game_search_indexes.sql -- Run after 02_create_games_table.sql
+-- Requires the pg_trgm extension (ships with PostgreSQL contrib)
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE games ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(location, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_games_search_vector ON games USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_games_search_trgm ON games USING GIN ((title || ' ' || location) gin_trgm_ops);
+
+COMMENT ON COLUMN games.search_vector IS 'Weighted full-text vector of title/location/description (generated)';
@@ -0,0 +1,33 @@
+-- Live game update notifications for Pickup Football App
+-- Every join, leave and waitlist promotion moves the trigger-maintained counters on games
+-- (05_add_game_participant_counters.sql), so an AFTER UPDATE trigger on those counters and
+-- on status publishes each game_participants change as a small JSON delta on the
+-- game_updates channel. Postgres delivers it on commit; each API worker LISTENs on one
+-- connection and fans the deltas out to its streaming clients (app/core/game_events.py)
+
+-- psql -U postgres -d pickup_football -f 16_add_game_update_notifications.sql -- Run after 05_add_game_participant_counters.sql
+-- psql -U postgres -d pickup_football -c "LISTEN game_updates" -- to watch deltas by hand
+
+CREATE OR REPLACE FUNCTION notify_game_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('game_updates', json_build_object(
+        'game_id', NEW.id,
+        'status', NEW.status,
+        'confirmed_players', NEW.confirmed_players,
+        'waitlisted_players', NEW.waitlisted_players,
+        'max_players', NEW.max_players
+    )::text);
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS notify_game_update ON games;
+CREATE TRIGGER notify_game_update
+    AFTER UPDATE OF confirmed_players, waitlisted_players, status, max_players ON games
+    FOR EACH ROW
+    WHEN (OLD.confirmed_players IS DISTINCT FROM NEW.confirmed_players
+          OR OLD.waitlisted_players IS DISTINCT FROM NEW.waitlisted_players
+          OR OLD.status IS DISTINCT FROM NEW.status
+          OR OLD.max_players IS DISTINCT FROM NEW.max_players)
+    EXECUTE FUNCTION notify_game_update();
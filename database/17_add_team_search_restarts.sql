@@ -0,0 +1,8 @@
+-- Replayable team generation for Pickup Football App
+-- The multi-start search keeps only the restarts that finish inside its time budget, so
+-- a seed alone does not pin down a sheet. game_teams records how many restarts the
+-- stored split used; generate-teams with ?seed=&restarts= replays exactly that run
+
+-- psql -U postgres -d pickup_football -f 17_add_team_search_restarts.sql -- Run after 10_add_team_sheet_versioning.sql
+
+ALTER TABLE game_teams ADD COLUMN IF NOT EXISTS restarts_completed INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,58 @@
+-- Keyset index for a user's game history in Pickup Football App
+-- GET /api/users/{id}/games pages on (games.date_time, games.id), but the user filter
+-- lives on game_participants, so no single index served that order and every page
+-- sorted the user's whole history. game_participants carries a copy of its game's
+-- date_time (maintained by trigger) so one index covers filter and order together
+
+-- psql -U postgres -d pickup_football -f 18_add_user_game_history_index.sql -- Run after 06_add_keyset_pagination_indexes.sql
+
+ALTER TABLE game_participants ADD COLUMN IF NOT EXISTS game_date_time TIMESTAMP WITH TIME ZONE;
+
+-- Copy the game's kickoff onto each new participation row
+CREATE OR REPLACE FUNCTION set_participant_game_date_time()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR NEW.game_id IS DISTINCT FROM OLD.game_id THEN
+        SELECT date_time INTO NEW.game_date_time FROM games WHERE id = NEW.game_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS set_participant_game_date_time ON game_participants;
+CREATE TRIGGER set_participant_game_date_time
+    BEFORE INSERT OR UPDATE OF game_id ON game_participants
+    FOR EACH ROW
+    EXECUTE FUNCTION set_participant_game_date_time();
+
+-- Follow a rescheduled game
+CREATE OR REPLACE FUNCTION sync_participant_game_date_time()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE game_participants
+    SET game_date_time = NEW.date_time
+    WHERE game_id = NEW.id;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS sync_participant_game_date_time ON games;
+CREATE TRIGGER sync_participant_game_date_time
+    AFTER UPDATE OF date_time ON games
+    FOR EACH ROW
+    WHEN (OLD.date_time IS DISTINCT FROM NEW.date_time)
+    EXECUTE FUNCTION sync_participant_game_date_time();
+
+-- Backfill existing participation rows
+UPDATE game_participants gp
+SET game_date_time = g.date_time
+FROM games g
+WHERE g.id = gp.game_id
+AND gp.game_date_time IS DISTINCT FROM g.date_time;
+
+-- Each history page is a bounded range scan; supersedes the (user_id, game_id) index from 06
+CREATE INDEX IF NOT EXISTS idx_game_participants_user_date_time_game
+    ON game_participants(user_id, game_date_time, game_id);
+DROP INDEX IF EXISTS idx_game_participants_user_game;
+
+COMMENT ON COLUMN game_participants.game_date_time IS 'Copy of games.date_time for keyset paging of a user''s games (maintained by trigger)';
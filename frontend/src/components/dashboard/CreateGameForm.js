@@ -1,5 +1,6 @@
 import React, { useState } from 'react';
 import './CreateGameForm.css';
+import { authHeaders } from '../../utils/auth';
 
 const CreateGameForm = ({ onClose, onGameCreated, currentUser }) => {
   const [formData, setFormData] = useState({
@@ -61,12 +62,10 @@ const CreateGameForm = ({ onClose, onGameCreated, currentUser }) => {
       };
 
       const response = await fetch(
-        `http://localhost:8000/api/games?created_by=${currentUser.id}`, 
+        'http://localhost:8000/api/games',
         {
           method: 'POST',
-          headers: {
-            'Content-Type': 'application/json',
-          },
+          headers: authHeaders(currentUser),
           body: JSON.stringify(gameData)
         }
       );
@@ -1,10 +1,13 @@
 import React, { useState, useEffect } from 'react';
 import { useAuth } from '../../hooks/useAuth';
-import { getUserDisplayName } from '../../utils/auth';
+import { authHeaders, getUserDisplayName } from '../../utils/auth';
 import GameCard from './GameCard';
 import CreateGameForm from './CreateGameForm';
 import './Dashboard.css';
 
+// How often to re-fetch the list while live updates are unavailable
+const FALLBACK_REFRESH_MS = 30000;
+
 const Dashboard = () => {
   const { user, logout } = useAuth();
   const [games, setGames] = useState([]);
@@ -16,6 +19,65 @@ const Dashboard = () => {
     fetchGames();
   }, [user]); // Re-fetch when user changes // eslint-disable-line react-hooks/exhaustive-deps
 
+  // Live counter/status deltas for the listed games, instead of re-fetching the list
+  const gameIds = games.map(game => game.id).join(',');
+  useEffect(() => {
+    if (!gameIds) {
+      return undefined;
+    }
+
+    const source = new EventSource(`http://localhost:8000/api/games/stream?game_ids=${gameIds}`);
+
+    source.addEventListener('game_update', (event) => {
+      const update = JSON.parse(event.data);
+      setGames(prevGames => prevGames.map(game => (
+        game.id === update.game_id
+          ? {
+              ...game,
+              status: update.status,
+              confirmed_players: update.confirmed_players,
+              waitlisted_players: update.waitlisted_players,
+              max_players: update.max_players
+            }
+          : game
+      )));
+    });
+
+    // The server missed some updates (e.g. a database reconnect), so load a fresh list
+    source.addEventListener('resync', () => fetchGames());
+
+    // Deltas sent while the stream is down are lost: re-fetch once it reconnects,
+    // and poll instead if the browser gives up on it (e.g. the server answered 503)
+    let dropped = false;
+    let pollTimer = null;
+    source.addEventListener('open', () => {
+      if (dropped) {
+        dropped = false;
+        fetchGames();
+      }
+    });
+    source.onerror = () => {
+      dropped = true;
+      if (source.readyState === EventSource.CLOSED && !pollTimer) {
+        fetchGames();
+        pollTimer = setInterval(fetchGames, FALLBACK_REFRESH_MS);
+      }
+    };
+
+    return () => {
+      source.close();
+      clearInterval(pollTimer);
+    };
+  }, [gameIds]); // eslint-disable-line react-hooks/exhaustive-deps
+
+  const updateUserStatus = (gameId, userStatus, waitlistPosition = null) => {
+    setGames(prevGames => prevGames.map(game => (
+      game.id === gameId
+        ? { ...game, user_status: userStatus, user_waitlist_position: waitlistPosition }
+        : game
+    )));
+  };
+
   const fetchGames = async () => {
     try {
       setLoading(true);
@@ -25,7 +87,7 @@ const Dashboard = () => {
         ? `http://localhost:8000/api/games?user_id=${user.id}`
         : 'http://localhost:8000/api/games';
       
-      const response = await fetch(url);
+      const response = await fetch(url, { headers: authHeaders(user) });
       
       if (!response.ok) {
         throw new Error('Failed to fetch games');
@@ -53,11 +115,9 @@ const Dashboard = () => {
     }
 
     try {
-      const response = await fetch(`http://localhost:8000/api/games/${game.id}/leave?user_id=${user.id}`, {
+      const response = await fetch(`http://localhost:8000/api/games/${game.id}/leave`, {
         method: 'DELETE',
-        headers: {
-          'Content-Type': 'application/json',
-        }
+        headers: authHeaders(user)
       });
 
       if (!response.ok) {
@@ -68,8 +128,8 @@ const Dashboard = () => {
       const result = await response.json();
       alert(result.message);
       
-      // Refresh games list to show updated participant counts
-      fetchGames();
+      // Participant counts arrive through the live update stream
+      updateUserStatus(game.id, null);
       
     } catch (error) {
       console.error('Error leaving game:', error);
@@ -84,11 +144,9 @@ const Dashboard = () => {
     }
 
     try {
-      const response = await fetch(`http://localhost:8000/api/games/${game.id}/join?user_id=${user.id}`, {
+      const response = await fetch(`http://localhost:8000/api/games/${game.id}/join`, {
         method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
+        headers: authHeaders(user),
         body: JSON.stringify({
           position_preference: null // Could be enhanced with a position selector
         })
@@ -109,8 +167,8 @@ const Dashboard = () => {
       
       alert(message);
       
-      // Refresh games list to show updated participant counts
-      fetchGames();
+      // Participant counts arrive through the live update stream
+      updateUserStatus(game.id, result.status, result.waitlist_position || null);
       
     } catch (error) {
       console.error('Error joining game:', error);
@@ -38,6 +38,13 @@ export const AuthProvider = ({ children }) => {
   };
 
   const logout = () => {
+    // Revoke the session token server-side; the local session ends either way
+    if (user?.access_token) {
+      fetch('http://localhost:8000/api/users/logout', {
+        method: 'POST',
+        headers: { Authorization: `Bearer ${user.access_token}` }
+      }).catch(() => {});
+    }
     setUser(null);
     setIsAuthenticated(false);
     localStorage.removeItem('userData');
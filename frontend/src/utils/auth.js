@@ -30,6 +30,15 @@ export const storeUser = (userData) => {
   localStorage.setItem('userData', JSON.stringify(userData));
 };
 
+// Headers for API calls made as the signed-in user (session token from login)
+export const authHeaders = (user) => {
+  const headers = { 'Content-Type': 'application/json' };
+  if (user?.access_token) {
+    headers.Authorization = `Bearer ${user.access_token}`;
+  }
+  return headers;
+};
+
 // Format user display name
 export const getUserDisplayName = (user) => {
   if (!user) return '';